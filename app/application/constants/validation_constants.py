@@ -87,3 +87,5 @@ class DefaultValues:
     # Import constants from Domain layer
     from app.domain.constants.api_constants import RouteTypeConstants
     DEFAULT_ROUTE_TYPE = RouteTypeConstants.FASTEST
+    # Fallback khi reverse geocode không resolve được địa chỉ
+    UNKNOWN_ADDRESS = "Địa chỉ không xác định"
@@ -1,7 +1,7 @@
 """DTOs for detailed route feature."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from app.domain.value_objects.latlon import LatLon
 
 
@@ -99,3 +99,5 @@ class DetailedRouteResponse:
     alternative_routes: List[AlternativeRoute] = field(default_factory=list)
     travel_mode: str = "car"
     total_alternative_count: int = 0
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)  # Thời gian từng stage của pipeline
+    degraded: List[str] = field(default_factory=list)  # Các phần bị bỏ qua do hết latency budget / upstream lỗi
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class FindNearbyDestinationsRequest:
+    """DTO for find nearby destinations request (tọa độ hoặc địa chỉ làm tâm)."""
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    address: Optional[str] = None
+    radius_meters: Optional[float] = None
+    limit: int = 10
+
+
+@dataclass
+class NearbyDestination:
+    """DTO for a saved destination with its distance from the search center."""
+    id: str
+    name: str
+    address: str
+    latitude: float
+    longitude: float
+    distance_meters: float
+
+
+@dataclass
+class FindNearbyDestinationsResponse:
+    """DTO for find nearby destinations response."""
+    success: bool
+    destinations: List[NearbyDestination] = field(default_factory=list)
+    total_count: int = 0
+    center_latitude: Optional[float] = None
+    center_longitude: Optional[float] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.application.dto.search_destinations_dto import DestinationSummary
+
+
+@dataclass
+class ListDestinationsRequest:
+    """DTO for list destinations request (một trang, keyset pagination)."""
+    limit: int = 50
+    cursor: Optional[str] = None
+
+
+@dataclass
+class ListDestinationsResponse:
+    """DTO for list destinations response; next_cursor là None ở trang cuối."""
+    success: bool
+    destinations: List[DestinationSummary] = field(default_factory=list)
+    total_count: int = 0
+    next_cursor: Optional[str] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
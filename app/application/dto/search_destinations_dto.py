@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional, List
 
+from app.domain.entities.destination import Destination
+
 
 @dataclass
 class DestinationSummary:
@@ -12,6 +14,19 @@ class DestinationSummary:
     longitude: float
     created_at: str
     updated_at: str
+    
+    @classmethod
+    def from_destination(cls, destination: Destination) -> "DestinationSummary":
+        """Flatten a Destination entity into a summary."""
+        return cls(
+            id=destination.id or "",
+            name=str(destination.name),
+            address=str(destination.address),
+            latitude=destination.coordinates.lat,
+            longitude=destination.coordinates.lon,
+            created_at=destination.created_at.isoformat(),
+            updated_at=destination.updated_at.isoformat()
+        )
 
 
 @dataclass
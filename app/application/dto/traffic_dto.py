@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from typing import List, Optional
+from app.application.dto.calculate_route_dto import RoutePlan
 from app.domain.value_objects.latlon import LatLon
 
 
@@ -143,21 +144,51 @@ class ViaRouteCommandDTO:
     language: str = "vi-VN"
 
 
+@dataclass
+class TrafficSectionDTO:
+    """Đoạn đường có giao thông chậm/kẹt trong traffic analysis."""
+    section_index: int
+    condition: str
+    start_index: int
+    end_index: int
+    delay_seconds: Optional[int] = None
+
+
 @dataclass
 class TrafficAnalysisResultDTO:
     """Result từ traffic analysis."""
-    route_summary: dict
-    traffic_data: dict
-    severe_delays: List[dict]
+    overall_status: str
+    traffic_score: float
+    conditions_count: dict
+    heavy_traffic_sections: List[TrafficSectionDTO]
+    total_sections: int
     recommendations: List[str]
 
 
+@dataclass
+class TrafficFlowDataDTO:
+    """Dữ liệu traffic flow tại một vị trí."""
+    current_speed: Optional[float] = None
+    free_flow_speed: Optional[float] = None
+    current_travel_time: Optional[int] = None
+    free_flow_travel_time: Optional[int] = None
+    confidence: Optional[float] = None
+
+
 @dataclass
 class TrafficConditionResultDTO:
     """Result từ traffic condition check."""
     location: LatLon
-    flow_data: dict
-    road_closure: bool
+    flow_data: TrafficFlowDataDTO
+    road_closure: Optional[bool]
+
+
+@dataclass
+class RouteWithTrafficResult:
+    """Route plan và traffic được suy ra từ cùng một response calculateRoute."""
+    route_plan: RoutePlan
+    traffic: TrafficResponse
+    traffic_analysis: Optional[TrafficAnalysisResultDTO] = None
 
 
 @dataclass
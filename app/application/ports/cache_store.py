@@ -0,0 +1,25 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Protocol, TypeVar
+
+V = TypeVar("V")
+
+
+class CacheStore(Protocol[V]):
+    """Key-value store có TTL cho các cache ở application layer (vd. LruTtlCache)."""
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Value còn hạn theo key, None nếu miss."""
+        ...
+
+    def set(self, key: Hashable, value: V, ttl_sec: Optional[float] = None) -> None:
+        """Lưu value với TTL riêng (None = TTL mặc định của store)."""
+        ...
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Xóa các entry có key thỏa predicate, trả về số entry đã xóa."""
+        ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê hit/miss/size của store."""
+        ...
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
+from app.application.dto.search_destinations_dto import DestinationSummary
 from app.domain.entities.destination import Destination
+from app.domain.value_objects.latlon import LatLon
+from app.domain.value_objects.page_cursor import PageCursor
 
 
 class DestinationRepository(ABC):
@@ -11,6 +14,11 @@ class DestinationRepository(ABC):
         """Save a destination and return the saved entity with ID"""
         pass
     
+    @abstractmethod
+    async def save_many(self, destinations: List[Destination]) -> List[Destination]:
+        """Save several destinations together (one transaction where supported); skip and log rows that fail, return the saved entities"""
+        pass
+    
     @abstractmethod
     async def find_by_id(self, destination_id: str) -> Optional[Destination]:
         """Find a destination by its ID"""
@@ -21,17 +29,51 @@ class DestinationRepository(ABC):
         """Find a destination by its name"""
         pass
     
+    @abstractmethod
+    async def find_by_address(self, address: str) -> Optional[Destination]:
+        """Find a destination by its exact address (case-insensitive, ignoring surrounding whitespace)"""
+        pass
+    
     @abstractmethod
     async def list_all(self) -> List[Destination]:
         """List all saved destinations"""
         pass
     
+    @abstractmethod
+    async def list_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[Destination], Optional[PageCursor]]:
+        """List one page of destinations ordered by (created_at, id) descending, starting after the cursor; return the page and the cursor of the next page (None on the last page)"""
+        pass
+    
+    @abstractmethod
+    async def list_summary_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[DestinationSummary], Optional[PageCursor]]:
+        """Same page as list_page, projected straight to DestinationSummary (read-only listings)"""
+        pass
+    
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Destination]:
+        """Stream all destinations in list_page order, reading chunk_size rows at a time"""
+        pass
+    
     @abstractmethod
     async def delete(self, destination_id: str) -> bool:
         """Delete a destination by ID, return True if deleted"""
         pass
     
+    @abstractmethod
+    async def find_nearby(self, center: LatLon, limit: int = 10, radius_m: Optional[float] = None) -> List[Tuple[Destination, float]]:
+        """Find the destinations nearest to center as (destination, distance in meters), nearest first; radius_m bounds the distance"""
+        pass
+    
     @abstractmethod
     async def search_by_name_and_address(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[Destination]:
-        """Search destinations by ID, name and/or address (partial matching, case-insensitive)"""
-        pass
\ No newline at end of file
+        """Search destinations by ID, name and/or address (partial matching, case-insensitive).
+        
+        Matching depends on the backend: SQLite matches word prefixes ("van pho" finds "Văn phòng",
+        "anoi" does not find "Hanoi"), the memory repository matches substrings.
+        """
+        pass
+    
+    @abstractmethod
+    async def search_summaries(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[DestinationSummary]:
+        """Same results as search_by_name_and_address, projected straight to DestinationSummary (read-only listings)"""
+        pass
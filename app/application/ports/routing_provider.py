@@ -1,10 +1,28 @@
-
 from typing import Protocol
 
 from app.application.dto.calculate_route_dto import CalculateRouteCommand, RoutePlan
+from app.application.dto.traffic_dto import RouteWithTrafficResult
+from app.domain.constants.api_constants import LanguageConstants
 
 
 class RoutingProvider(Protocol):
     async def calculate_route(self, cmd: CalculateRouteCommand) -> RoutePlan: ...
-    
-    async def calculate_route_with_guidance(self, cmd: CalculateRouteCommand) -> RoutePlan: ...
\ No newline at end of file
+
+    async def calculate_route_with_guidance(self, cmd: CalculateRouteCommand) -> RoutePlan: ...
+
+    async def calculate_route_without_traffic(
+        self,
+        cmd: CalculateRouteCommand,
+        language: str = LanguageConstants.DEFAULT,
+    ) -> RoutePlan:
+        """Tính route có guidance nhưng không yêu cầu traffic (request nhẹ hơn khi latency budget nhỏ)."""
+        ...
+
+    async def calculate_route_with_traffic(
+        self,
+        cmd: CalculateRouteCommand,
+        language: str = LanguageConstants.DEFAULT,
+        include_analysis: bool = False,
+    ) -> RouteWithTrafficResult:
+        """Tính route có guidance và traffic sections từ một lần gọi upstream duy nhất."""
+        ...
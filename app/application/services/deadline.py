@@ -0,0 +1,61 @@
+"""Latency budget cho một request - deadline tạo ở MCP tool boundary và lan truyền qua contextvar."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+
+class Deadline:
+    """Thời điểm hết hạn tuyệt đối (theo time.monotonic) của một request.
+
+    Đầu vào: budget_sec - tổng thời gian cho phép tính từ lúc tạo, clock (để test)
+    Chức năng: remaining() trả về thời gian còn lại; has_at_least() cho phép bỏ qua
+    các stage tùy chọn khi budget không còn đủ.
+    """
+
+    def __init__(self, budget_sec: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.budget_sec = budget_sec
+        self.at = clock() + budget_sec
+
+    def remaining(self) -> float:
+        """Số giây còn lại (không âm)."""
+        return max(0.0, self.at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def has_at_least(self, seconds: float) -> bool:
+        """Còn ít nhất `seconds` giây trước deadline hay không."""
+        return self.remaining() >= seconds
+
+
+class DeadlineExceededError(TimeoutError):
+    """Request hết latency budget của caller - không phải dấu hiệu upstream chậm hay quá tải."""
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline của request hiện tại (None nếu không có latency budget)."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget_sec: float) -> Iterator[Deadline]:
+    """Đặt deadline cho mọi lời gọi bên trong block (kể cả các task con tạo trong block).
+
+    Nếu đã có deadline bên ngoài chặt hơn thì giữ deadline đó.
+    """
+    deadline = Deadline(budget_sec)
+    outer = _current_deadline.get()
+    if outer is not None and outer.at <= deadline.at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,165 @@
+"""Write-behind cho các destination được lưu tự động (best-effort) - ghi ngoài request path."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.application.ports.destination_repository import DestinationRepository
+from app.domain.entities.destination import Destination
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DestinationWriteBehind:
+    """Hàng đợi ghi destination theo lô.
+
+    Đầu vào: repository (cần save_many), flush_interval_sec, max_batch_size, max_retries
+    Chức năng: submit() trả về ngay; các destination trùng địa chỉ đã chuẩn hóa
+    (strip + lower) được gộp lại, giữ bản mới nhất. Một background task flush khi
+    đủ max_batch_size hoặc sau flush_interval_sec, mỗi lần flush là một lời gọi
+    save_many (một transaction); task ngủ trên wakeup event khi hàng đợi rỗng.
+    Lô đang ghi vẫn đọc được qua pending() cho tới khi commit xong. Lô lỗi được
+    đưa lại hàng đợi (trừ địa chỉ đã có bản mới hơn), mỗi destination tối đa
+    max_retries lần thử lại rồi bị bỏ và log - dữ liệu này là best-effort.
+    close() flush phần còn lại trước khi dừng.
+    """
+
+    def __init__(
+        self,
+        repository: DestinationRepository,
+        flush_interval_sec: float = 0.5,
+        max_batch_size: int = 100,
+        max_retries: int = 3,
+    ):
+        self._repository = repository
+        self._flush_interval_sec = flush_interval_sec
+        self._max_batch_size = max_batch_size
+        self._max_retries = max_retries
+        self._pending: Dict[str, Destination] = {}
+        self._in_flight: Dict[str, Destination] = {}
+        self._retries: Dict[str, int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
+        self._idle = False
+        self._submitted = 0
+        self._coalesced = 0
+        self._written = 0
+        self._batches = 0
+        self._failed = 0
+        self._requeued = 0
+
+    @staticmethod
+    def key_of(address: str) -> str:
+        return address.strip().lower()
+
+    def submit(self, destination: Destination) -> None:
+        """Đưa destination vào hàng đợi (không chờ ghi)."""
+        key = self.key_of(str(destination.address))
+        if key in self._pending:
+            self._coalesced += 1
+        self._pending[key] = destination
+        self._retries.pop(key, None)
+        self._submitted += 1
+        self._ensure_running()
+        if self._idle or len(self._pending) >= self._max_batch_size:
+            self._wakeup.set()
+
+    def pending(self, address: str) -> Optional[Destination]:
+        """Destination đang chờ ghi hoặc đang được ghi cho địa chỉ này (đọc được trước khi commit)."""
+        key = self.key_of(address)
+        return self._pending.get(key) or self._in_flight.get(key)
+
+    async def flush(self) -> int:
+        """Ghi toàn bộ destination đang chờ trong một lô; trả về số bản ghi đã ghi."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+        try:
+            await self._repository.save_many(list(batch.values()))
+        except Exception as e:
+            logger.warning(f"Write-behind flush of {len(batch)} destinations failed: {e}")
+            self._requeue(batch)
+            return 0
+        finally:
+            for key, destination in batch.items():
+                if self._in_flight.get(key) is destination:
+                    del self._in_flight[key]
+        for key in batch:
+            self._retries.pop(key, None)
+        self._written += len(batch)
+        self._batches += 1
+        logger.info(f"Write-behind flushed {len(batch)} destinations")
+        return len(batch)
+
+    async def close(self) -> None:
+        """Dừng background task và flush phần còn lại."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            if self._loop is asyncio.get_running_loop():
+                # Không cancel: lô đang ghi dở phải hoàn tất, task tự thoát sau lần flush kế tiếp
+                self._closing = True
+                self._wakeup.set()
+                await asyncio.gather(task, return_exceptions=True)
+                self._closing = False
+            elif not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(task.cancel)
+        self._loop = None
+        self._wakeup = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Số destination đang chờ, đã gộp, đã ghi, số lô và số bản ghi lỗi."""
+        return {
+            "pending": len(self._pending),
+            "submitted": self._submitted,
+            "coalesced": self._coalesced,
+            "written": self._written,
+            "batches": self._batches,
+            "failed": self._failed,
+            "requeued": self._requeued,
+        }
+
+    def _requeue(self, batch: Dict[str, Destination]) -> None:
+        """Đưa lô lỗi lại hàng đợi; bỏ destination đã có bản mới hơn hoặc đã hết lượt thử lại."""
+        for key, destination in batch.items():
+            if key in self._pending:
+                continue
+            attempts = self._retries.get(key, 0) + 1
+            if attempts > self._max_retries:
+                self._retries.pop(key, None)
+                self._failed += 1
+                logger.warning(f"Write-behind dropped destination '{key}' after {self._max_retries} retries")
+                continue
+            self._retries[key] = attempts
+            self._pending[key] = destination
+            self._requeued += 1
+
+    def _ensure_running(self) -> None:
+        """Background task gắn với event loop đang chạy (tạo lại nếu loop thay đổi)."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._loop is not loop or self._task.done():
+            self._loop = loop
+            self._idle = False
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run(self._wakeup))
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while not self._closing:
+            if not self._pending:
+                # Hàng đợi rỗng: ngủ tới khi submit()/close() đánh thức, không poll theo flush interval
+                self._idle = True
+                try:
+                    await wakeup.wait()
+                finally:
+                    self._idle = False
+                wakeup.clear()
+                continue
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self._flush_interval_sec)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self.flush()
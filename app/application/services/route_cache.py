@@ -0,0 +1,115 @@
+"""Route result cache - tái sử dụng kết quả route cho cùng cặp điểm trong vài phút."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.application.dto.detailed_route_dto import RouteInstruction, RouteSection
+from app.application.dto.traffic_dto import RouteWithTrafficResult
+from app.application.ports.cache_store import CacheStore
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+RouteCacheKey = Tuple[float, float, float, float, str, str, int]
+
+
+@dataclass(frozen=True)
+class CachedRoute:
+    """Phần kết quả pipeline phụ thuộc vào tọa độ (route, traffic sections, instructions)."""
+    route: RouteWithTrafficResult
+    sections: List[RouteSection] = field(default_factory=list)
+    instructions: List[RouteInstruction] = field(default_factory=list)
+
+
+class RouteResultCache:
+    """Cache kết quả route theo tọa độ lượng tử hóa, travel mode, language và departure bucket.
+
+    TTL phụ thuộc traffic: route thông thoáng giữ max_ttl_sec, route kẹt nặng
+    (delay >= heavy_delay_sec) chỉ giữ min_ttl_sec, ở giữa nội suy tuyến tính.
+    Departure bucket làm key tự xoay vòng theo thời gian khởi hành: entry không thể được
+    đọc lại sau khi bucket của key kết thúc, nên TTL bị chặn bởi thời gian còn lại của bucket.
+    departure_bucket_sec nên >= max_ttl_sec để TTL theo traffic thực sự có tác dụng.
+    Store (vd. LruTtlCache) được inject từ DI container.
+    """
+
+    def __init__(
+        self,
+        store: CacheStore[CachedRoute],
+        min_ttl_sec: float = 60.0,
+        max_ttl_sec: float = 600.0,
+        heavy_delay_sec: int = 600,
+        departure_bucket_sec: int = 1800,
+        coordinate_precision: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._store = store
+        self._min_ttl_sec = min_ttl_sec
+        self._max_ttl_sec = max(max_ttl_sec, min_ttl_sec)
+        self._heavy_delay_sec = max(1, heavy_delay_sec)
+        self._departure_bucket_sec = max(1, departure_bucket_sec)
+        self._coordinate_precision = coordinate_precision
+        self._clock = clock
+
+    def make_key(self, origin: LatLon, destination: LatLon, travel_mode: str, language: str) -> RouteCacheKey:
+        """Tạo cache key cho thời điểm khởi hành hiện tại."""
+        precision = self._coordinate_precision
+        return (
+            round(origin.lat, precision),
+            round(origin.lon, precision),
+            round(destination.lat, precision),
+            round(destination.lon, precision),
+            str(travel_mode).lower(),
+            (language or "").lower(),
+            int(self._clock() // self._departure_bucket_sec),
+        )
+
+    def get(self, key: RouteCacheKey) -> Optional[CachedRoute]:
+        """Lấy route đã cache, None nếu miss."""
+        return self._store.get(key)
+
+    def put(self, key: RouteCacheKey, value: CachedRoute) -> float:
+        """Lưu route với TTL theo mức độ kẹt xe (chặn bởi thời gian còn lại của departure bucket).
+
+        Trả về TTL đã dùng; 0 (không lưu) nếu bucket của key đã kết thúc.
+        """
+        ttl = self.ttl_for(value.route.traffic.total_delay_seconds if value.route.traffic.success else 0)
+        bucket_remaining = (key[-1] + 1) * self._departure_bucket_sec - self._clock()
+        ttl = min(ttl, bucket_remaining)
+        if ttl <= 0:
+            return 0.0
+        self._store.set(key, value, ttl_sec=ttl)
+        return ttl
+
+    def ttl_for(self, total_delay_seconds: int) -> float:
+        """TTL giảm tuyến tính từ max_ttl_sec (không delay) về min_ttl_sec (delay nặng)."""
+        congestion = min(max(total_delay_seconds, 0) / self._heavy_delay_sec, 1.0)
+        return self._max_ttl_sec - (self._max_ttl_sec - self._min_ttl_sec) * congestion
+
+    def invalidate(self, origin: Optional[LatLon] = None, destination: Optional[LatLon] = None) -> int:
+        """Xóa các route có điểm đầu và/hoặc điểm cuối trùng (sau lượng tử hóa), trả về số entry đã xóa."""
+        precision = self._coordinate_precision
+        origin_key = (round(origin.lat, precision), round(origin.lon, precision)) if origin else None
+        destination_key = (round(destination.lat, precision), round(destination.lon, precision)) if destination else None
+
+        def matches(key: RouteCacheKey) -> bool:
+            return (origin_key is None or key[0:2] == origin_key) and (
+                destination_key is None or key[2:4] == destination_key
+            )
+
+        removed = self._store.invalidate_where(matches)
+        logger.info(f"Invalidated {removed} cached routes")
+        return removed
+
+    def invalidate_endpoint(self, point: LatLon) -> int:
+        """Xóa các route có điểm đầu hoặc điểm cuối trùng point (vd. destination đã lưu vừa thay đổi)."""
+        return self.invalidate(origin=point) + self.invalidate(destination=point)
+
+    def clear(self) -> None:
+        """Xóa toàn bộ route cache."""
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê hit/miss của route cache."""
+        return self._store.stats()
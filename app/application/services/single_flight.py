@@ -0,0 +1,53 @@
+"""Single-flight - gộp các lời gọi trùng key đang chạy đồng thời thành một."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[V]):
+    """Coalesce các lời gọi đồng thời có cùng key vào một task dùng chung.
+
+    Caller đầu tiên tạo task, các caller sau cùng key chờ chính task đó thay vì
+    chạy lại. Task được shield nên một caller bị cancel không hủy kết quả của
+    các caller còn lại. Kết quả (kể cả exception) được chia sẻ nguyên object,
+    caller không được mutate. Key được xóa ngay khi task xong - không phải cache.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> V:
+        """Chạy fn() cho key, hoặc chờ lời gọi cùng key đang chạy."""
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        else:
+            self._coalesced += 1
+            logger.debug(f"Coalesced in-flight call for key {key!r}")
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Số key đang có lời gọi chạy."""
+        return len(self._in_flight)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê số lời gọi và số lời gọi đã được gộp."""
+        return {"calls": self._calls, "coalesced": self._coalesced, "in_flight": len(self._in_flight)}
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Đánh dấu exception đã được đọc để tránh warning khi mọi caller đã bị cancel
+        if not task.cancelled():
+            task.exception()
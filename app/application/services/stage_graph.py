@@ -0,0 +1,85 @@
+"""Stage graph - chạy các async stage theo dependency, stage nào đủ input thì chạy ngay."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Sequence, Tuple
+
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+StageFunc = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class _Stage:
+    """Một stage trong graph: tên, coroutine function và các stage phụ thuộc."""
+    name: str
+    func: StageFunc
+    deps: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class StageGraph:
+    """DAG các async stage chạy đồng thời bằng asyncio.TaskGroup.
+
+    Mỗi stage nhận kết quả của các dependency dưới dạng keyword arguments
+    (tên tham số = tên stage). Dependency phải được đăng ký trước stage dùng nó,
+    nên graph luôn là DAG. Wall-clock = critical path thay vì tổng các stage.
+    """
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, _Stage] = {}
+        self._timings_ms: Dict[str, float] = {}
+
+    def add(self, name: str, func: StageFunc, deps: Sequence[str] = ()) -> "StageGraph":
+        """Đăng ký một stage.
+
+        Đầu vào: name, func (async, nhận kết quả deps qua kwargs), deps
+        Đầu ra: chính graph (để chain)
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already registered")
+        unknown = [dep for dep in deps if dep not in self._stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {unknown}")
+        self._stages[name] = _Stage(name=name, func=func, deps=tuple(deps))
+        return self
+
+    @property
+    def timings_ms(self) -> Dict[str, float]:
+        """Thời gian chạy (ms) của từng stage trong lần run gần nhất."""
+        return dict(self._timings_ms)
+
+    async def run(self) -> Dict[str, Any]:
+        """Chạy toàn bộ graph và trả về kết quả theo tên stage.
+
+        Lỗi của stage đầu tiên được raise lại nguyên bản (không bọc ExceptionGroup)
+        để caller giữ nguyên cách xử lý exception hiện có.
+        """
+        self._timings_ms = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for stage in self._stages.values():
+                    tasks[stage.name] = tg.create_task(
+                        self._run_stage(stage, [tasks[dep] for dep in stage.deps]),
+                        name=stage.name,
+                    )
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0]
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_stage(self, stage: _Stage, dep_tasks: Sequence[asyncio.Task]) -> Any:
+        """Chờ dependencies xong rồi chạy stage, ghi lại thời gian thực thi."""
+        dep_results = [await task for task in dep_tasks]
+        kwargs = dict(zip(stage.deps, dep_results))
+
+        started = time.perf_counter()
+        try:
+            return await stage.func(**kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._timings_ms[stage.name] = round(elapsed_ms, 3)
+            logger.debug(f"Stage '{stage.name}' finished in {elapsed_ms:.1f}ms")
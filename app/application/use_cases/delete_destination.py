@@ -1,7 +1,10 @@
 """Use case for deleting a destination."""
 
 from app.application.dto.delete_destination_dto import DeleteDestinationRequest, DeleteDestinationResponse
+from typing import Optional
+
 from app.application.ports.destination_repository import DestinationRepository
+from app.application.services.route_cache import RouteResultCache
 from app.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,8 +13,9 @@ logger = get_logger(__name__)
 class DeleteDestinationUseCase:
     """Use case for deleting a destination."""
     
-    def __init__(self, destination_repository: DestinationRepository):
+    def __init__(self, destination_repository: DestinationRepository, route_cache: Optional[RouteResultCache] = None):
         self._destination_repository = destination_repository
+        self._route_cache = route_cache
     
     async def execute(self, request: DeleteDestinationRequest) -> DeleteDestinationResponse:
         """Execute delete destination use case."""
@@ -33,6 +37,10 @@ class DeleteDestinationUseCase:
             if deleted:
                 logger.info(f"Successfully deleted destination with ID: {request.destination_id}")
                 
+                # Route đã cache tới/từ tọa độ của destination đã xóa không còn được dùng
+                if self._route_cache is not None:
+                    self._route_cache.invalidate_endpoint(existing_destination.coordinates)
+                
                 # Verify that the destination was actually deleted from database
                 logger.info(f"Verifying destination was deleted from database...")
                 verification_destination = await self._destination_repository.find_by_id(request.destination_id)
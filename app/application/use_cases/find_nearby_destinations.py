@@ -0,0 +1,105 @@
+"""Use case for finding the saved destinations nearest to a location."""
+
+from typing import Optional
+
+from app.application.constants.validation_constants import DefaultValues, ValidationLimits, ValidationMessages
+from app.application.dto.find_nearby_dto import FindNearbyDestinationsRequest, FindNearbyDestinationsResponse, NearbyDestination
+from app.application.dto.geocoding_dto import GeocodeAddressCommandDTO
+from app.application.ports.destination_repository import DestinationRepository
+from app.application.ports.geocoding_provider import GeocodingProvider
+from app.domain.errors import InvalidCoordinateError
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FindNearbyDestinationsUseCase:
+    """Use case: k-nearest / radius search over saved destinations.
+    
+    Tâm tìm kiếm là (latitude, longitude) nếu có, ngược lại geocode address.
+    """
+    
+    def __init__(self, destination_repository: DestinationRepository, geocoding_provider: GeocodingProvider):
+        self._destination_repository = destination_repository
+        self._geocoding_provider = geocoding_provider
+    
+    async def execute(self, request: FindNearbyDestinationsRequest) -> FindNearbyDestinationsResponse:
+        """Execute find nearby destinations."""
+        try:
+            if not ValidationLimits.MIN_LIMIT_VALUE <= request.limit <= ValidationLimits.MAX_LIMIT_VALUE:
+                raise ValueError(ValidationMessages.OUT_OF_RANGE.format(
+                    field_name="limit",
+                    min_val=ValidationLimits.MIN_LIMIT_VALUE,
+                    max_val=ValidationLimits.MAX_LIMIT_VALUE,
+                    value=request.limit
+                ))
+            if request.radius_meters is not None and request.radius_meters <= 0:
+                raise ValueError(f"radius_meters must be positive, got {request.radius_meters}")
+            
+            center = await self._resolve_center(request)
+            if center is None:
+                return FindNearbyDestinationsResponse(
+                    success=False,
+                    error=f"Could not find coordinates for address: {request.address}"
+                )
+            
+            logger.info(f"Finding {request.limit} destinations near {center.lat}, {center.lon} (radius={request.radius_meters})")
+            nearest = await self._destination_repository.find_nearby(
+                center,
+                limit=request.limit,
+                radius_m=request.radius_meters
+            )
+            
+            destinations = [
+                NearbyDestination(
+                    id=dest.id or "",
+                    name=str(dest.name),
+                    address=str(dest.address),
+                    latitude=dest.coordinates.lat,
+                    longitude=dest.coordinates.lon,
+                    distance_meters=round(meters, 1)
+                )
+                for dest, meters in nearest
+            ]
+            
+            return FindNearbyDestinationsResponse(
+                success=True,
+                destinations=destinations,
+                total_count=len(destinations),
+                center_latitude=center.lat,
+                center_longitude=center.lon,
+                message=f"Tìm thấy {len(destinations)} điểm đến gần vị trí"
+            )
+            
+        except (ValueError, InvalidCoordinateError) as e:
+            logger.error(f"Validation error: {str(e)}")
+            return FindNearbyDestinationsResponse(
+                success=False,
+                error=f"Validation error: {str(e)}"
+            )
+        except Exception as e:
+            logger.error(f"Error finding nearby destinations: {str(e)}")
+            return FindNearbyDestinationsResponse(
+                success=False,
+                message="Lỗi khi tìm điểm đến gần vị trí",
+                error=str(e)
+            )
+    
+    async def _resolve_center(self, request: FindNearbyDestinationsRequest) -> Optional[LatLon]:
+        """Tâm tìm kiếm: tọa độ truyền vào, hoặc kết quả geocode đầu tiên của address."""
+        if request.latitude is not None and request.longitude is not None:
+            return LatLon(request.latitude, request.longitude)
+        if not request.address or not request.address.strip():
+            raise ValueError("Please provide latitude and longitude, or an address")
+        
+        geocode_result = await self._geocoding_provider.geocode_address(GeocodeAddressCommandDTO(
+            address=request.address.strip(),
+            country_set=DefaultValues.DEFAULT_COUNTRY,
+            limit=DefaultValues.DEFAULT_LIMIT,
+            language=DefaultValues.DEFAULT_LANGUAGE
+        ))
+        if not geocode_result.results:
+            return None
+        position = geocode_result.results[0].position
+        return LatLon(position.lat, position.lon)
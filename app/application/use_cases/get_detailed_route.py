@@ -1,6 +1,7 @@
 """Use case for calculating detailed route between two addresses."""
 
-from typing import Optional
+import asyncio
+from typing import List, Optional
 from app.application.dto.detailed_route_dto import (
     DetailedRouteRequest,
     DetailedRouteResponse,
@@ -18,11 +19,15 @@ from app.application.errors import ApplicationError
 from app.application.ports.destination_repository import DestinationRepository
 from app.application.ports.geocoding_provider import GeocodingProvider
 from app.application.ports.routing_provider import RoutingProvider
-from app.application.ports.traffic_provider import TrafficProvider
 from app.application.ports.reverse_geocode_provider import ReverseGeocodeProvider
-from app.application.dto.traffic_dto import TrafficCheckCommand, ReverseGeocodeCommand
+from app.application.services.deadline import current_deadline
+from app.application.services.destination_write_behind import DestinationWriteBehind
+from app.application.services.route_cache import CachedRoute, RouteResultCache
+from app.application.services.stage_graph import StageGraph
+from app.application.dto.traffic_dto import ReverseGeocodeCommand, RouteWithTrafficResult, TrafficResponse
 from app.domain.enums.travel_mode import TravelMode
 from app.domain.value_objects.latlon import LatLon
+from app.application.services.single_flight import SingleFlight
 from app.infrastructure.logging.logger import get_logger
 from datetime import datetime, timezone
 from app.domain.entities.destination import Destination
@@ -33,165 +38,156 @@ logger = get_logger(__name__)
 
 
 class GetDetailedRouteUseCase:
-    """Use case for calculating detailed route with traffic info."""
+    """Use case for calculating detailed route with traffic info.
+    
+    Khi có latency budget (deadline_scope ở MCP tool boundary), các stage tùy chọn
+    bị bỏ qua nếu budget còn lại không đủ và được liệt kê trong response.degraded.
+    Có destination_writer thì các destination lưu tự động được ghi theo lô ngoài request path.
+    """
+    
+    # Các phần có thể bị bỏ qua khi thiếu budget
+    DEGRADED_TRAFFIC = "traffic"
+    DEGRADED_SECTION_ADDRESSES = "section_addresses"
     
     def __init__(
         self,
         destination_repository: DestinationRepository,
         geocoding_provider: GeocodingProvider,
         routing_provider: RoutingProvider,
-        traffic_provider: TrafficProvider,
-        reverse_geocode_provider: ReverseGeocodeProvider
+        reverse_geocode_provider: ReverseGeocodeProvider,
+        route_cache: Optional[RouteResultCache] = None,
+        min_budget_for_traffic_sec: float = 3.0,
+        min_budget_for_section_addresses_sec: float = 1.0,
+        destination_writer: Optional[DestinationWriteBehind] = None
     ):
         self._destination_repository = destination_repository
         self._geocoding_provider = geocoding_provider
         self._routing_provider = routing_provider
-        self._traffic_provider = traffic_provider
         self._reverse_geocode_provider = reverse_geocode_provider
+        self._route_cache = route_cache
+        self._min_budget_for_traffic_sec = min_budget_for_traffic_sec
+        self._min_budget_for_section_addresses_sec = min_budget_for_section_addresses_sec
+        self._destination_writer = destination_writer
+        self._single_flight: SingleFlight[DetailedRouteResponse] = SingleFlight()
     
     async def execute(self, request: DetailedRouteRequest) -> DetailedRouteResponse:
-        """Execute detailed route calculation."""
+        """Execute detailed route calculation.
+        
+        Các request giống nhau (sau chuẩn hóa) đang chạy đồng thời dùng chung một lần thực thi.
+        """
+        return await self._single_flight.do(self._request_key(request), lambda: self._execute(request))
+    
+    @staticmethod
+    def _request_key(request: DetailedRouteRequest) -> tuple:
+        """Chuẩn hóa request thành single-flight key (gộp khoảng trắng, không phân biệt hoa thường)."""
+        def normalize(value) -> str:
+            return " ".join(str(value or "").split()).casefold()
+        
+        return (
+            normalize(request.origin_address),
+            normalize(request.destination_address),
+            normalize(request.travel_mode),
+            normalize(request.country_set),
+            normalize(request.language),
+        )
+    
+    async def _execute(self, request: DetailedRouteRequest) -> DetailedRouteResponse:
+        """Thực thi pipeline detailed route.
+        
+        Các bước được tổ chức thành StageGraph: hai lần geocode chạy song song,
+        route + traffic chờ cả hai (hoặc lấy từ route cache nếu có), sau đó
+        reverse geocode các traffic sections và trích xuất instructions chạy song song.
+        Traffic và địa chỉ sections là tùy chọn: bị bỏ qua khi latency budget còn lại không đủ.
+        """
         try:
             logger.info(f"Calculating detailed route from {request.origin_address} to {request.destination_address}")
             
-            # Step 1: Get origin coordinates
-            origin_coords, origin_name = await self._get_coordinates(
-                request.origin_address,
-                request.country_set,
-                request.language
-            )
-            
-            # Step 2: Get destination coordinates
-            dest_coords, dest_name = await self._get_coordinates(
-                request.destination_address,
-                request.country_set,
-                request.language
-            )
-            
-            # Step 3: Calculate route
-            logger.info(f"Requesting route from routing provider")
             # Fixed: Convert travel_mode string to TravelMode enum
             travel_mode_enum = TravelMode[request.travel_mode.upper()] if isinstance(request.travel_mode, str) else request.travel_mode
-            route_cmd = CalculateRouteCommand(
-                origin=origin_coords,
-                destination=dest_coords,
-                travel_mode=travel_mode_enum # Fixed type error
-            )
-            # Use calculate_route_with_guidance to get turn-by-turn instructions
-            route_plan = await self._routing_provider.calculate_route_with_guidance(route_cmd)
+            degraded: List[str] = []
             
-            # Step 4: Check traffic conditions (BLK-1-15)
-            logger.info("Checking traffic conditions")
-            traffic_cmd = TrafficCheckCommand(
-                origin=origin_coords,
-                destination=dest_coords,
-                travel_mode=request.travel_mode,
-                language=request.language
-            )
-            traffic_response = await self._traffic_provider.check_severe_traffic(traffic_cmd)
+            async def origin_stage():
+                # Step 1: Get origin coordinates
+                return await self._get_coordinates(request.origin_address, request.country_set, request.language)
             
-            # DEBUG: Log traffic response
-            logger.info(f"🚦 TRAFFIC RESPONSE DEBUG:")
-            logger.info(f"  - Success: {traffic_response.success}")
-            logger.info(f"  - Has traffic_sections: {hasattr(traffic_response, 'traffic_sections')}")
-            if hasattr(traffic_response, 'traffic_sections'):
-                logger.info(f"  - Traffic sections count: {len(traffic_response.traffic_sections) if traffic_response.traffic_sections else 0}")
-                if traffic_response.traffic_sections:
-                    logger.info(f"  - First section: {traffic_response.traffic_sections[0]}")
+            async def destination_stage():
+                # Step 2: Get destination coordinates
+                return await self._get_coordinates(request.destination_address, request.country_set, request.language)
+            
+            async def cached_stage(origin, destination):
+                # Route cache theo tọa độ lượng tử hóa + travel mode + language + departure bucket
+                if self._route_cache is None:
+                    return None
+                key = self._route_cache.make_key(origin[0], destination[0], request.travel_mode, request.language)
+                return key, self._route_cache.get(key)
             
-            # Step 5: Build traffic sections with address information (BLK-1-16, BLK-1-17)
-            traffic_sections_data = []
-            if traffic_response.success and traffic_response.traffic_sections:
-                logger.info(f"Found {len(traffic_response.traffic_sections)} traffic sections")
-                
-                # Get route legs points for coordinate mapping
-                if route_plan.legs and len(route_plan.legs) > 0:
-                    leg_points = route_plan.legs[0].points
-                    logger.info(f"Route has {len(leg_points)} points for coordinate mapping")
-                    
-                    # Collect all coordinates that need reverse geocoding
-                    coords_to_geocode = []
-                    for section in traffic_response.traffic_sections:
-                        start_idx = section.start_point_index
-                        end_idx = section.end_point_index
-                        
-                        # Validate indices
-                        if start_idx < len(leg_points) and end_idx < len(leg_points):
-                            start_coord = leg_points[start_idx]
-                            end_coord = leg_points[end_idx]
-                            coords_to_geocode.extend([start_coord, end_coord])
-                    
-                    # Batch reverse geocode all coordinates
-                    if coords_to_geocode:
-                        logger.info(f"Reverse geocoding {len(coords_to_geocode)} coordinates")
-                        geocode_cmd = ReverseGeocodeCommand(
-                            coordinates=coords_to_geocode,
+            async def route_stage(cached, origin, destination):
+                if cached and cached[1]:
+                    logger.info("Route cache hit")
+                    return cached[1].route
+                # Step 3-4: Route + traffic conditions (BLK-1-15) từ một lần gọi upstream
+                logger.info("Requesting route from routing provider")
+                route_cmd = CalculateRouteCommand(
+                    origin=origin[0],
+                    destination=destination[0],
+                    travel_mode=travel_mode_enum # Fixed type error
+                )
+                if not self._has_budget(self._min_budget_for_traffic_sec):
+                    logger.warning("Latency budget too small for traffic enrichment, requesting route without traffic")
+                    degraded.append(self.DEGRADED_TRAFFIC)
+                    return RouteWithTrafficResult(
+                        route_plan=await self._routing_provider.calculate_route_without_traffic(
+                            route_cmd,
                             language=request.language
+                        ),
+                        traffic=TrafficResponse(
+                            success=False,
+                            traffic_sections=[],
+                            total_delay_seconds=0,
+                            total_traffic_length_meters=0,
+                            error_message="Skipped: latency budget exhausted"
                         )
-                        geocode_response = await self._reverse_geocode_provider.reverse_geocode(geocode_cmd)
-                        
-                        if geocode_response.success:
-                            logger.info(f"Successfully geocoded {len(geocode_response.addresses)} addresses")
-                            
-                            # Build traffic sections with addresses
-                            addr_idx = 0
-                            for idx, section in enumerate(traffic_response.traffic_sections):
-                                start_idx = section.start_point_index
-                                end_idx = section.end_point_index
-                                
-                                if start_idx < len(leg_points) and end_idx < len(leg_points):
-                                    start_coord = leg_points[start_idx]
-                                    end_coord = leg_points[end_idx]
-                                    
-                                    # Get addresses from geocode response
-                                    start_address = geocode_response.addresses[addr_idx].freeform_address if addr_idx < len(geocode_response.addresses) else "Địa chỉ không xác định"
-                                    end_address = geocode_response.addresses[addr_idx + 1].freeform_address if (addr_idx + 1) < len(geocode_response.addresses) else "Địa chỉ không xác định"
-                                    addr_idx += 2
-                                    
-                                    traffic_sections_data.append(RouteSection(
-                                        section_index=idx,
-                                        section_type="traffic",
-                                        start_point_index=start_idx,
-                                        end_point_index=end_idx,
-                                        start_coordinate={"lat": start_coord.lat, "lon": start_coord.lon},
-                                        end_coordinate={"lat": end_coord.lat, "lon": end_coord.lon},
-                                        start_address=start_address,
-                                        end_address=end_address,
-                                        delay_seconds=section.delay_seconds,
-                                        magnitude=section.magnitude_of_delay,
-                                        simple_category=section.simple_category,
-                                        effective_speed_kmh=section.effective_speed_kmh
-                                    ))
-                            logger.info(f"Built {len(traffic_sections_data)} traffic sections with addresses")
-                        else:
-                            logger.warning(f"Reverse geocoding failed: {geocode_response.error_message}")
-                            # Fallback: build sections without addresses
-                            for idx, section in enumerate(traffic_response.traffic_sections):
-                                start_idx = section.start_point_index
-                                end_idx = section.end_point_index
-                                
-                                if start_idx < len(leg_points) and end_idx < len(leg_points):
-                                    start_coord = leg_points[start_idx]
-                                    end_coord = leg_points[end_idx]
-                                    
-                                    traffic_sections_data.append(RouteSection(
-                                        section_index=idx,
-                                        section_type="traffic",
-                                        start_point_index=start_idx,
-                                        end_point_index=end_idx,
-                                        start_coordinate={"lat": start_coord.lat, "lon": start_coord.lon},
-                                        end_coordinate={"lat": end_coord.lat, "lon": end_coord.lon},
-                                        start_address="Địa chỉ không xác định",
-                                        end_address="Địa chỉ không xác định",
-                                        delay_seconds=section.delay_seconds,
-                                        magnitude=section.magnitude_of_delay,
-                                        simple_category=section.simple_category,
-                                        effective_speed_kmh=section.effective_speed_kmh
-                                    ))
-                else:
-                    logger.warning("No leg points available for coordinate mapping")
-            else:
-                logger.warning("No traffic sections found in response")
+                    )
+                return await self._routing_provider.calculate_route_with_traffic(
+                    route_cmd,
+                    language=request.language
+                )
+            
+            async def sections_stage(cached, route):
+                if cached and cached[1]:
+                    return cached[1].sections
+                # Step 5: Build traffic sections with address information (BLK-1-16, BLK-1-17)
+                return await self._build_traffic_sections(route.route_plan, route.traffic, request.language, degraded)
+            
+            async def instructions_stage(cached, route):
+                if cached and cached[1]:
+                    return cached[1].instructions
+                return self._extract_instructions(route.route_plan)
+            
+            graph = (
+                StageGraph()
+                .add("origin", origin_stage)
+                .add("destination", destination_stage)
+                .add("cached", cached_stage, deps=("origin", "destination"))
+                .add("route", route_stage, deps=("cached", "origin", "destination"))
+                .add("sections", sections_stage, deps=("cached", "route"))
+                .add("instructions", instructions_stage, deps=("cached", "route"))
+            )
+            results = await graph.run()
+            
+            cached = results["cached"]
+            if cached and cached[1] is None and not degraded:
+                self._route_cache.put(cached[0], CachedRoute(
+                    route=results["route"],
+                    sections=results["sections"],
+                    instructions=results["instructions"]
+                ))
+            
+            origin_coords, origin_name = results["origin"]
+            dest_coords, dest_name = results["destination"]
+            route_plan = results["route"].route_plan
+            traffic_response = results["route"].traffic
+            traffic_sections_data = results["sections"]
             
             # Step 6: Build response
             origin_point = RoutePoint(
@@ -211,19 +207,15 @@ class GetDetailedRouteUseCase:
             # Build main route from route plan with traffic info
             traffic_description = "Normal traffic"
             delay_minutes = 0
-            if traffic_response.success:
+            if self.DEGRADED_TRAFFIC in degraded:
+                traffic_description = "Traffic information skipped (latency budget exhausted)"
+            elif traffic_response.success:
                 delay_minutes = traffic_response.total_delay_seconds // 60
                 if traffic_response.traffic_sections:
                     traffic_description = f"Traffic delays: {delay_minutes} minutes, {len(traffic_response.traffic_sections)} sections affected"
                 else:
                     traffic_description = "No traffic delays"
             
-            # DEBUG: Log traffic sections before building response
-            logger.info(f"🏗️ BUILDING TRAFFIC SECTIONS:")
-            logger.info(f"  - Traffic sections count: {len(traffic_sections_data)}")
-            if traffic_sections_data:
-                logger.info(f"  - First section: {traffic_sections_data[0]}")
-            
             main_route = MainRoute(
                 summary=f"Route via {request.travel_mode}",
                 total_distance_meters=route_plan.summary.distance_m,
@@ -232,16 +224,10 @@ class GetDetailedRouteUseCase:
                     description=traffic_description,
                     delay_minutes=delay_minutes
                 ),
-                instructions=self._extract_instructions(route_plan),
+                instructions=results["instructions"],
                 sections=traffic_sections_data  # Use traffic sections directly
             )
             
-            # DEBUG: Log final sections
-            logger.info(f"📦 MAIN ROUTE SECTIONS:")
-            logger.info(f"  - Sections count: {len(main_route.sections) if main_route.sections else 0}")
-            if main_route.sections:
-                logger.info(f"  - First section: {main_route.sections[0]}")
-            
             # Build alternative routes if available
             alternative_routes = self._extract_alternative_routes(route_plan)
             
@@ -251,10 +237,12 @@ class GetDetailedRouteUseCase:
                 main_route=main_route,
                 alternative_routes=alternative_routes,
                 travel_mode=request.travel_mode,
-                total_alternative_count=len(alternative_routes)
+                total_alternative_count=len(alternative_routes),
+                stage_timings_ms=graph.timings_ms,
+                degraded=degraded
             )
             
-            logger.info(f"Successfully calculated detailed route with {len(alternative_routes)} alternatives")
+            logger.info(f"Successfully calculated detailed route with {len(alternative_routes)} alternatives, stage timings: {graph.timings_ms}")
             return response
             
         except ApplicationError as e:
@@ -264,14 +252,103 @@ class GetDetailedRouteUseCase:
             logger.error(f"Error calculating detailed route: {str(e)}")
             raise ApplicationError(f"Failed to calculate detailed route: {str(e)}")
     
+    @staticmethod
+    def _has_budget(seconds: float) -> bool:
+        """Latency budget hiện tại còn ít nhất `seconds` giây (luôn True nếu không có budget)."""
+        deadline = current_deadline()
+        return deadline is None or deadline.has_at_least(seconds)
+    
+    async def _build_traffic_sections(self, route_plan, traffic_response, language: str, degraded: List[str]) -> List[RouteSection]:
+        """Build traffic sections kèm địa chỉ (reverse geocode start/end point của mỗi section).
+        
+        Địa chỉ bị bỏ qua (UNKNOWN_ADDRESS) và ghi vào degraded khi thiếu budget hoặc reverse geocode lỗi/timeout.
+        """
+        if not (traffic_response.success and traffic_response.traffic_sections):
+            logger.warning("No traffic sections found in response")
+            return []
+        
+        logger.info(f"Found {len(traffic_response.traffic_sections)} traffic sections")
+        if not route_plan.legs:
+            logger.warning("No leg points available for coordinate mapping")
+            return []
+        
+        # Get route legs points for coordinate mapping
+        leg_points = route_plan.legs[0].points
+        
+        # Chỉ giữ sections có index hợp lệ
+        valid_sections = [
+            (idx, section)
+            for idx, section in enumerate(traffic_response.traffic_sections)
+            if section.start_point_index < len(leg_points) and section.end_point_index < len(leg_points)
+        ]
+        if not valid_sections:
+            return []
+        
+        # Batch reverse geocode all coordinates
+        coords_to_geocode = []
+        for _, section in valid_sections:
+            coords_to_geocode.extend([leg_points[section.start_point_index], leg_points[section.end_point_index]])
+        
+        addresses = []
+        if not self._has_budget(self._min_budget_for_section_addresses_sec):
+            logger.warning("Latency budget too small for reverse geocoding, building sections without addresses")
+            degraded.append(self.DEGRADED_SECTION_ADDRESSES)
+        else:
+            logger.info(f"Reverse geocoding {len(coords_to_geocode)} coordinates")
+            deadline = current_deadline()
+            try:
+                async with asyncio.timeout(deadline.remaining() if deadline else None):
+                    geocode_response = await self._reverse_geocode_provider.reverse_geocode(
+                        ReverseGeocodeCommand(coordinates=coords_to_geocode, language=language)
+                    )
+            except TimeoutError:
+                logger.warning("Reverse geocoding exceeded the latency budget, building sections without addresses")
+                degraded.append(self.DEGRADED_SECTION_ADDRESSES)
+            else:
+                if geocode_response.success:
+                    addresses = [address.freeform_address for address in geocode_response.addresses]
+                else:
+                    # Fallback: build sections without addresses
+                    logger.warning(f"Reverse geocoding failed: {geocode_response.error_message}")
+                    degraded.append(self.DEGRADED_SECTION_ADDRESSES)
+        
+        def address_at(i: int) -> str:
+            return addresses[i] if i < len(addresses) else DefaultValues.UNKNOWN_ADDRESS
+        
+        traffic_sections_data = []
+        for position, (idx, section) in enumerate(valid_sections):
+            start_coord = leg_points[section.start_point_index]
+            end_coord = leg_points[section.end_point_index]
+            traffic_sections_data.append(RouteSection(
+                section_index=idx,
+                section_type="traffic",
+                start_point_index=section.start_point_index,
+                end_point_index=section.end_point_index,
+                start_coordinate={"lat": start_coord.lat, "lon": start_coord.lon},
+                end_coordinate={"lat": end_coord.lat, "lon": end_coord.lon},
+                start_address=address_at(2 * position),
+                end_address=address_at(2 * position + 1),
+                delay_seconds=section.delay_seconds,
+                magnitude=section.magnitude_of_delay,
+                simple_category=section.simple_category,
+                effective_speed_kmh=section.effective_speed_kmh
+            ))
+        logger.info(f"Built {len(traffic_sections_data)} traffic sections with addresses")
+        return traffic_sections_data
+    
     async def _get_coordinates(self, address: str, country_set: str, language: str):
         """Get coordinates for an address, checking saved destinations first."""
-        # Try to find in saved destinations first via search
+        # Destination vừa geocode đang chờ write-behind ghi xuống database
+        if self._destination_writer is not None:
+            pending = self._destination_writer.pending(address)
+            if pending is not None:
+                return pending.coordinates, pending.name
+        
+        # Try to find in saved destinations first (exact address lookup, dùng index)
         try:
-            saved_dests = await self._destination_repository.search_by_name_and_address(address=address)
-            if saved_dests:
+            saved_dest = await self._destination_repository.find_by_address(address)
+            if saved_dest:
                 logger.info(f"Found saved destination for {address}")
-                saved_dest = saved_dests[0]
                 # Ensure name equals input address string as per spec
                 if str(saved_dest.name) != address.strip():
                     try:
@@ -284,7 +361,7 @@ class GetDetailedRouteUseCase:
                             created_at=saved_dest.created_at,
                             updated_at=now
                         )
-                        await self._destination_repository.save(updated)
+                        await self._save_best_effort(updated)
                         logger.info("Updated saved destination name to input address string")
                     except Exception as e:
                         logger.warning(f"Failed to normalize destination name for '{address}': {e}")
@@ -324,14 +401,21 @@ class GetDetailedRouteUseCase:
                 created_at=now,
                 updated_at=now
             )
-            await self._destination_repository.save(destination_to_save)
-            logger.info(f"Saved destination to database: {address}")
+            await self._save_best_effort(destination_to_save)
+            logger.info(f"Saved destination (best-effort): {address}")
         except Exception as e:
             # Do not block main flow if persistence fails per spec
             logger.warning(f"Failed to save destination '{address}': {e}")
 
         return coordinates, geocoded_address
     
+    async def _save_best_effort(self, destination: Destination) -> None:
+        """Lưu destination tự động: qua write-behind (không chờ commit) nếu có, nếu không thì ghi trực tiếp."""
+        if self._destination_writer is not None:
+            self._destination_writer.submit(destination)
+            return
+        await self._destination_repository.save(destination)
+    
     def _extract_instructions(self, route_plan) -> list:
         """Extract turn-by-turn instructions from route plan."""
         instructions = []
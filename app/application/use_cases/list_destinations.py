@@ -0,0 +1,56 @@
+"""Use case for listing saved destinations page by page."""
+
+from app.application.constants.validation_constants import ValidationLimits, ValidationMessages
+from app.application.dto.list_destinations_dto import ListDestinationsRequest, ListDestinationsResponse
+from app.application.ports.destination_repository import DestinationRepository
+from app.domain.errors import InvalidPageCursorError
+from app.domain.value_objects.page_cursor import PageCursor
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ListDestinationsUseCase:
+    """Use case: list destinations (mới nhất trước) theo trang với cursor mờ."""
+    
+    def __init__(self, destination_repository: DestinationRepository):
+        self._destination_repository = destination_repository
+    
+    async def execute(self, request: ListDestinationsRequest) -> ListDestinationsResponse:
+        """Execute list destinations (một trang)."""
+        try:
+            if not ValidationLimits.MIN_LIMIT_VALUE <= request.limit <= ValidationLimits.MAX_LIMIT_VALUE:
+                raise ValueError(ValidationMessages.OUT_OF_RANGE.format(
+                    field_name="limit",
+                    min_val=ValidationLimits.MIN_LIMIT_VALUE,
+                    max_val=ValidationLimits.MAX_LIMIT_VALUE,
+                    value=request.limit
+                ))
+            after = PageCursor.decode(request.cursor) if request.cursor else None
+            
+            # Projection thẳng sang DTO (không tạo entity cho dữ liệu chỉ đọc)
+            destination_summaries, next_cursor = await self._destination_repository.list_summary_page(request.limit, after)
+            
+            logger.info(f"Listed {len(destination_summaries)} destinations (more: {next_cursor is not None})")
+            
+            return ListDestinationsResponse(
+                success=True,
+                destinations=destination_summaries,
+                total_count=len(destination_summaries),
+                next_cursor=next_cursor.encode() if next_cursor is not None else None,
+                message=f"Trả về {len(destination_summaries)} điểm đến"
+            )
+            
+        except (ValueError, InvalidPageCursorError) as e:
+            logger.error(f"Validation error: {str(e)}")
+            return ListDestinationsResponse(
+                success=False,
+                error=f"Validation error: {str(e)}"
+            )
+        except Exception as e:
+            logger.error(f"Error listing destinations: {str(e)}")
+            return ListDestinationsResponse(
+                success=False,
+                message="Lỗi khi liệt kê điểm đến",
+                error=str(e)
+            )
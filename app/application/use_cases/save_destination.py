@@ -6,6 +6,7 @@ from app.application.dto.save_destination_dto import SaveDestinationRequest, Sav
 from app.application.dto.geocoding_dto import GeocodeAddressCommandDTO
 from app.application.ports.destination_repository import DestinationRepository
 from app.application.ports.geocoding_provider import GeocodingProvider
+from app.application.services.route_cache import RouteResultCache
 from app.domain.entities.destination import Destination
 from app.domain.value_objects.latlon import LatLon
 from app.domain.value_objects.destination_name import DestinationName
@@ -18,16 +19,25 @@ logger = get_logger(__name__)
 class SaveDestinationUseCase:
     """Use case for saving a destination"""
     
-    def __init__(self, destination_repository: DestinationRepository, geocoding_provider: GeocodingProvider):
+    def __init__(
+        self,
+        destination_repository: DestinationRepository,
+        geocoding_provider: GeocodingProvider,
+        route_cache: Optional[RouteResultCache] = None
+    ):
         self._destination_repository = destination_repository
         self._geocoding_provider = geocoding_provider
+        self._route_cache = route_cache
     
     async def execute(self, request: SaveDestinationRequest) -> SaveDestinationResponse:
         """Execute save destination use case"""
         try:
             logger.info(f"Saving destination: {request.name}")
             
-            # Check if destination with same name already exists (only if name is provided)
+            # Check if destination with same name already exists (only if name is provided).
+            # Giữ bước này trước geocoding: tên trùng bị từ chối mà không tốn một lần gọi geocoding.
+            # UPSERT của repository coi trùng tên là cập nhật, nên không thay được kiểm tra này -
+            # mỗi lần save là một lookup theo index + một câu lệnh UPSERT.
             if request.name is not None and request.name.strip():
                 existing_destination = await self._destination_repository.find_by_name(request.name)
                 if existing_destination:
@@ -79,30 +89,16 @@ class SaveDestinationUseCase:
             
             logger.info(f"Successfully saved destination with ID: {saved_destination.id}")
             
-            # Verify that the destination was actually saved to database
-            logger.info(f"Verifying destination was saved to database...")
-            if saved_destination.id is None:
-                logger.error("❌ Database verification failed - destination ID is None")
-                return SaveDestinationResponse(
-                    success=False,
-                    error="Database verification failed - destination ID is None"
-                )
+            # Route đã cache tới/từ tọa độ này được tính lại ở lần gọi sau
+            if self._route_cache is not None:
+                self._route_cache.invalidate_endpoint(saved_destination.coordinates)
             
-            verification_destination = await self._destination_repository.find_by_id(saved_destination.id)
-            
-            if verification_destination:
-                logger.info("✅ Database verification successful - destination found in database")
-                return SaveDestinationResponse(
-                    success=True,
-                    destination_id=saved_destination.id,
-                    message=f"Destination '{final_name_str}' saved successfully at {coordinates.lat}, {coordinates.lon}"
-                )
-            else:
-                logger.error("❌ Database verification failed - destination not found in database")
-                return SaveDestinationResponse(
-                    success=False,
-                    error="Database verification failed - destination was not saved properly"
-                )
+            # Repository trả về bản ghi đã lưu (UPSERT ... RETURNING) nên không cần đọc lại để xác minh
+            return SaveDestinationResponse(
+                success=True,
+                destination_id=saved_destination.id,
+                message=f"Destination '{final_name_str}' saved successfully at {coordinates.lat}, {coordinates.lon}"
+            )
             
         except ValueError as e:
             logger.error(f"Validation error: {str(e)}")
@@ -1,6 +1,6 @@
 """Use case for searching destinations by name and/or address."""
 
-from app.application.dto.search_destinations_dto import SearchDestinationsRequest, SearchDestinationsResponse, DestinationSummary
+from app.application.dto.search_destinations_dto import SearchDestinationsRequest, SearchDestinationsResponse
 from app.application.ports.destination_repository import DestinationRepository
 from app.infrastructure.logging.logger import get_logger
 
@@ -21,27 +21,13 @@ class SearchDestinationsUseCase:
             # Nếu tất cả parameters đều None, lấy tất cả destinations (list all)
             # Không cần validation vì có thể list all destinations
             
-            # Search destinations using repository
-            destinations = await self._destination_repository.search_by_name_and_address(
+            # Search destinations using repository (projection thẳng sang DTO, không tạo entity)
+            destination_summaries = await self._destination_repository.search_summaries(
                 id=request.id,
                 name=request.name,
                 address=request.address
             )
             
-            # Convert to DTOs
-            destination_summaries = [
-                DestinationSummary(
-                    id=dest.id or "",
-                    name=str(dest.name),
-                    address=str(dest.address),
-                    latitude=dest.coordinates.lat,
-                    longitude=dest.coordinates.lon,
-                    created_at=dest.created_at.isoformat(),
-                    updated_at=dest.updated_at.isoformat()
-                )
-                for dest in destinations
-            ]
-            
             logger.info(f"Found {len(destination_summaries)} destinations matching search criteria")
             
             return SearchDestinationsResponse(
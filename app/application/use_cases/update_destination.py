@@ -7,6 +7,7 @@ from app.application.dto.update_destination_dto import UpdateDestinationRequest,
 from app.application.dto.geocoding_dto import GeocodeAddressCommandDTO
 from app.application.ports.destination_repository import DestinationRepository
 from app.application.ports.geocoding_provider import GeocodingProvider
+from app.application.services.route_cache import RouteResultCache
 from app.domain.entities.destination import Destination
 from app.domain.value_objects.latlon import LatLon
 from app.domain.value_objects.destination_name import DestinationName
@@ -19,9 +20,15 @@ logger = get_logger(__name__)
 class UpdateDestinationUseCase:
     """Use case for updating a destination."""
     
-    def __init__(self, destination_repository: DestinationRepository, geocoding_provider: GeocodingProvider):
+    def __init__(
+        self,
+        destination_repository: DestinationRepository,
+        geocoding_provider: GeocodingProvider,
+        route_cache: Optional[RouteResultCache] = None
+    ):
         self._destination_repository = destination_repository
         self._geocoding_provider = geocoding_provider
+        self._route_cache = route_cache
     
     async def execute(self, request: UpdateDestinationRequest) -> UpdateDestinationResponse:
         """Execute update destination use case."""
@@ -91,30 +98,18 @@ class UpdateDestinationUseCase:
             
             logger.info(f"Successfully updated destination with ID: {saved_destination.id}")
             
-            # Verify that the destination was actually updated in database
-            logger.info(f"Verifying destination was updated in database...")
-            if saved_destination.id is None:
-                logger.error("❌ Database verification failed - destination ID is None")
-                return UpdateDestinationResponse(
-                    success=False,
-                    error="Database verification failed - destination ID is None"
-                )
+            # Route đã cache tới/từ tọa độ cũ và mới của destination được tính lại ở lần gọi sau
+            if self._route_cache is not None:
+                self._route_cache.invalidate_endpoint(existing_destination.coordinates)
+                if saved_destination.coordinates != existing_destination.coordinates:
+                    self._route_cache.invalidate_endpoint(saved_destination.coordinates)
             
-            verification_destination = await self._destination_repository.find_by_id(saved_destination.id)
-            
-            if verification_destination:
-                logger.info("✅ Database verification successful - destination found in database")
-                return UpdateDestinationResponse(
-                    success=True,
-                    destination_id=saved_destination.id,
-                    message=f"Destination '{saved_destination.name}' updated successfully"
-                )
-            else:
-                logger.error("❌ Database verification failed - destination not found in database")
-                return UpdateDestinationResponse(
-                    success=False,
-                    error="Database verification failed - destination was not updated properly"
-                )
+            # Repository trả về bản ghi đã lưu (UPSERT ... RETURNING) nên không cần đọc lại để xác minh
+            return UpdateDestinationResponse(
+                success=True,
+                destination_id=saved_destination.id,
+                message=f"Destination '{saved_destination.name}' updated successfully"
+            )
             
         except Exception as e:
             logger.error(f"Error updating destination: {str(e)}")
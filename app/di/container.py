@@ -10,23 +10,41 @@ from app.application.use_cases.get_detailed_route import GetDetailedRouteUseCase
 from app.application.use_cases.get_weather import GetWeatherUseCase
 from app.application.use_cases.save_destination import SaveDestinationUseCase
 from app.application.use_cases.search_destinations import SearchDestinationsUseCase
+from app.application.use_cases.list_destinations import ListDestinationsUseCase
+from app.application.use_cases.find_nearby_destinations import FindNearbyDestinationsUseCase
 from app.application.use_cases.update_destination import UpdateDestinationUseCase
 
 # Infrastructure
 from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
-from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
 from app.infrastructure.persistence.migrations.create_destinations_table import run_migrations
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.http.adaptive_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimitConfig
+from app.infrastructure.http.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry
 from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.http.connection_pool_config import ConnectionPoolConfig
+from app.infrastructure.http.hedging import Hedger, HedgingConfig
+from app.infrastructure.http.rate_limiter import RateLimitConfig, RateLimiter
+from app.infrastructure.http.retry_policy import RetryPolicy
 from app.infrastructure.logging.logger import get_logger
 from app.infrastructure.tomtom.adapters.geocoding_adapter import TomTomGeocodingAdapter
 from app.infrastructure.tomtom.adapters.routing_adapter import TomTomRoutingAdapter
 from app.infrastructure.tomtom.adapters.traffic_adapter import TomTomTrafficAdapter
 from app.infrastructure.tomtom.adapters.reverse_geocode_adapter import TomTomReverseGeocodeAdapter
+from app.infrastructure.tomtom.adapters.batch_search_adapter import TomTomBatchSearchAdapter
 from app.infrastructure.adapters.weather_adapter import WeatherAPIAdapter
 from app.infrastructure.adapters.weather_geocoding_adapter import WeatherAPIGeocodingAdapter
+from app.infrastructure.cache.caching_geocoding_provider import CachingGeocodingProvider
+from app.infrastructure.cache.caching_reverse_geocode_provider import CachingReverseGeocodeProvider
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+# Factories
+from app.di.factories.repository_factory import RepositoryFactoryManager
 
 # Services
+from app.application.services.destination_write_behind import DestinationWriteBehind
+from app.application.services.route_cache import RouteResultCache
 from app.application.services.validation_service import get_validation_service
 from app.application.services.request_handler import get_request_handler_service
 from app.infrastructure.config.api_config import get_config_service
@@ -52,8 +70,26 @@ class Container:
         self.settings = settings or Settings()
         self.settings.validate()
 
-        # Infrastructure layer - HTTP client
-        self.http = AsyncApiClient()
+        # Infrastructure layer - HTTP client (một pooled session dùng chung cho mọi adapter)
+        self.http = AsyncApiClient(
+            pool_config=ConnectionPoolConfig(
+                limit=self.settings.http_pool_limit,
+                limit_per_host=self.settings.http_pool_limit_per_host,
+                keepalive_timeout_sec=self.settings.http_keepalive_timeout_sec,
+                dns_cache_ttl_sec=self.settings.http_dns_cache_ttl_sec,
+            ),
+            coalesce_gets=self.settings.http_coalesce_gets,
+            retry_policy=RetryPolicy(
+                max_retries=self.settings.http_retry_max_retries,
+                base_delay_sec=self.settings.http_retry_base_delay_sec,
+                max_delay_sec=self.settings.http_retry_max_delay_sec
+            ),
+            rate_limiter=self._create_rate_limiter(),
+            circuit_breakers=self._create_circuit_breakers(),
+            stale_cache=self._create_stale_cache(),
+            hedger=self._create_hedger(),
+            concurrency_limiter=self._create_concurrency_limiter()
+        )
         
         # Services
         self.config_service = get_config_service()
@@ -77,7 +113,32 @@ class Container:
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {str(e)}")
             raise
-    
+
+    async def startup(self):
+        """Khởi động resources dùng chung (mở kết nối SQLite, pre-connect HTTP pool tới các upstream)."""
+        await self.database.connect()
+        if self.settings.http_warmup_enabled:
+            urls = [self.settings.tomtom_base_url]
+            if self.weather_adapter:
+                urls.append(WeatherAPIAdapter.BASE_URL)
+            await self.http.warmup(urls)
+
+    async def shutdown(self):
+        """Giải phóng resources dùng chung khi server dừng (ghi nốt write-behind trước khi đóng database)."""
+        self.logger.info(f"Runtime stats: {self.stats()}")
+        await self.http.aclose()
+        if self.destination_writer is not None:
+            await self.destination_writer.close()
+        await self.database.close()
+
+    def stats(self) -> dict:
+        """Thống kê runtime của các component có cache / hàng đợi (None nếu component bị tắt)."""
+        return {
+            "http": self.http.stats(),
+            "route_cache": self.route_cache.stats() if self.route_cache is not None else None,
+            "destination_writer": self.destination_writer.stats() if self.destination_writer is not None else None,
+        }
+
     def _init_adapters(self):
         """Khởi tạo tất cả TomTom adapters."""
         base_config = {
@@ -90,14 +151,32 @@ class Container:
         # Routing adapter (đã có sẵn)
         self.routing_adapter = TomTomRoutingAdapter(**base_config)
         
-        # Geocoding adapter (mới)
-        self.geocoding_adapter = TomTomGeocodingAdapter(**base_config)
+        # Geocoding adapter (mới) - bọc cache theo địa chỉ đã chuẩn hóa
+        self.geocoding_adapter = self._with_geocode_cache(TomTomGeocodingAdapter(**base_config))
         
         # Traffic adapter (mới)
         self.traffic_adapter = TomTomTrafficAdapter(**base_config)
         
-        # Reverse Geocode adapter (mới)
-        self.reverse_geocode_adapter = TomTomReverseGeocodeAdapter(**base_config)
+        # Batch Search adapter - gom nhiều reverse geocode vào một request
+        self.batch_search_adapter = TomTomBatchSearchAdapter(**base_config)
+        
+        # Reverse Geocode adapter - batch search (mặc định) hoặc từng điểm, cache theo ô geohash
+        if self.settings.tomtom_batch_search_enabled:
+            self.reverse_geocode_adapter = self.batch_search_adapter
+        else:
+            self.reverse_geocode_adapter = TomTomReverseGeocodeAdapter(
+                **base_config,
+                max_concurrency=self.settings.reverse_geocode_max_concurrency
+            )
+        if self.settings.reverse_geocode_cache_enabled:
+            self.reverse_geocode_adapter = CachingReverseGeocodeProvider(
+                inner=self.reverse_geocode_adapter,
+                cache=LruTtlCache(
+                    max_size=self.settings.reverse_geocode_cache_max_size,
+                    ttl_sec=self.settings.reverse_geocode_cache_ttl_sec
+                ),
+                precision=self.settings.reverse_geocode_cache_precision
+            )
         
         # Weather adapter (WeatherAPI.com)
         if self.settings.weatherapi_api_key:
@@ -111,47 +190,156 @@ class Container:
             self.weather_adapter = None
             self.logger.warning("WeatherAPI.com API key not configured - weather feature will be disabled")
     
+    def _create_rate_limiter(self):
+        """Token bucket cho từng nhóm upstream (mỗi TomTom API một bucket riêng, WeatherAPI một bucket)."""
+        if not self.settings.http_rate_limit_enabled:
+            return None
+        tomtom = RateLimitConfig(
+            rate_per_sec=self.settings.tomtom_rate_limit_rps,
+            burst=self.settings.tomtom_rate_limit_burst
+        )
+        return RateLimiter({
+            "routing": tomtom,
+            "search": tomtom,
+            "traffic": tomtom,
+            "weather": RateLimitConfig(
+                rate_per_sec=self.settings.weather_rate_limit_rps,
+                burst=self.settings.weather_rate_limit_burst
+            ),
+        })
+    
+    def _create_circuit_breakers(self):
+        """Circuit breaker theo upstream host (TomTom, WeatherAPI)."""
+        if not self.settings.http_circuit_breaker_enabled:
+            return None
+        return CircuitBreakerRegistry(CircuitBreakerConfig(
+            failure_rate_threshold=self.settings.http_circuit_failure_rate,
+            slow_call_sec=self.settings.http_circuit_slow_call_sec,
+            open_sec=self.settings.http_circuit_open_sec
+        ))
+    
+    def _create_stale_cache(self):
+        """Cache response GET gần nhất để trả về khi mạch của upstream đang mở."""
+        if not self.settings.http_circuit_breaker_enabled or self.settings.http_stale_cache_max_size == 0:
+            return None
+        return LruTtlCache(
+            max_size=self.settings.http_stale_cache_max_size,
+            ttl_sec=self.settings.http_stale_cache_ttl_sec
+        )
+    
+    def _create_hedger(self):
+        """Hedging cho GET theo percentile latency của từng endpoint (opt-in)."""
+        if not self.settings.http_hedging_enabled:
+            return None
+        return Hedger(HedgingConfig(
+            percentile=self.settings.http_hedge_percentile,
+            budget_ratio=self.settings.http_hedge_budget_ratio
+        ))
+    
+    def _create_concurrency_limiter(self):
+        """Adaptive (AIMD) concurrency limit cho từng nhóm upstream."""
+        if not self.settings.http_adaptive_concurrency_enabled:
+            return None
+        return AdaptiveConcurrencyLimiter(AdaptiveLimitConfig(
+            initial_limit=self.settings.http_concurrency_initial_limit,
+            min_limit=self.settings.http_concurrency_min_limit,
+            max_limit=self.settings.http_concurrency_max_limit
+        ))
+    
+    def _with_geocode_cache(self, provider):
+        """Bọc geocoding provider bằng LRU/TTL cache nếu được bật trong settings."""
+        if not self.settings.geocode_cache_enabled:
+            return provider
+        return CachingGeocodingProvider(
+            inner=provider,
+            cache=LruTtlCache(
+                max_size=self.settings.geocode_cache_max_size,
+                ttl_sec=self.settings.geocode_cache_ttl_sec
+            ),
+            negative_ttl_sec=self.settings.geocode_cache_negative_ttl_sec
+        )
+    
     def _init_repositories(self):
         """Khởi tạo tất cả repositories."""
         # Use SQLite repository instead of memory repository
-        self.destination_repository = SQLiteDestinationRepository(
-            database_path=self.settings.database_path
+        sqlite_config = SQLiteConfig(
+            cache_size_kib=self.settings.sqlite_cache_size_kib,
+            mmap_size_bytes=self.settings.sqlite_mmap_size_mb * 1024 * 1024,
+            busy_timeout_ms=self.settings.sqlite_busy_timeout_ms,
+            read_pool_size=self.settings.sqlite_read_pool_size
+        )
+        self.database = DatabaseConnection.get_instance(self.settings.database_path, sqlite_config)
+        # DESTINATION_REPOSITORY_BACKEND: sqlite (mặc định), tiered (memory tier trước SQLite), memory
+        self.repository_factory = RepositoryFactoryManager.for_backend(
+            self.settings.destination_repository_backend,
+            database_path=self.settings.database_path,
+            config=sqlite_config
+        )
+        self.destination_repository = self.repository_factory.create_destination_repository()
+        self.destination_writer = self._create_destination_writer()
+    
+    def _create_destination_writer(self):
+        """Write-behind cho destination lưu tự động từ route requests (gom lô, ghi ngoài request path)."""
+        if not self.settings.destination_write_behind_enabled:
+            return None
+        return DestinationWriteBehind(
+            repository=self.destination_repository,
+            flush_interval_sec=self.settings.destination_write_behind_flush_ms / 1000,
+            max_batch_size=self.settings.destination_write_behind_batch_size
         )
     
     
     def _init_use_cases(self):
         """Khởi tạo tất cả Use Cases với dependency injection."""
         
+        # Route result cache (traffic-aware TTL) - các use case ghi destination invalidate route liên quan
+        self.route_cache = None
+        if self.settings.route_cache_enabled:
+            self.route_cache = RouteResultCache(
+                store=LruTtlCache(max_size=self.settings.route_cache_max_size),
+                min_ttl_sec=self.settings.route_cache_min_ttl_sec,
+                max_ttl_sec=self.settings.route_cache_max_ttl_sec,
+                departure_bucket_sec=self.settings.route_cache_departure_bucket_sec
+            )
+        
         # Destination Use Cases
         self.save_destination = SaveDestinationUseCase(
             destination_repository=self.destination_repository,
-            geocoding_provider=self.geocoding_adapter
+            geocoding_provider=self.geocoding_adapter,
+            route_cache=self.route_cache
         )
         self.search_destinations = SearchDestinationsUseCase(self.destination_repository)
-        self.delete_destination = DeleteDestinationUseCase(self.destination_repository)
-        self.update_destination = UpdateDestinationUseCase(
+        self.list_destinations = ListDestinationsUseCase(self.destination_repository)
+        self.find_nearby_destinations = FindNearbyDestinationsUseCase(
             destination_repository=self.destination_repository,
             geocoding_provider=self.geocoding_adapter
         )
+        self.delete_destination = DeleteDestinationUseCase(self.destination_repository, route_cache=self.route_cache)
+        self.update_destination = UpdateDestinationUseCase(
+            destination_repository=self.destination_repository,
+            geocoding_provider=self.geocoding_adapter,
+            route_cache=self.route_cache
+        )
         
         # Detailed Route Use Case (composite use case with traffic processing)
         self.get_detailed_route = GetDetailedRouteUseCase(
             destination_repository=self.destination_repository,
             geocoding_provider=self.geocoding_adapter,
             routing_provider=self.routing_adapter,
-            traffic_provider=self.traffic_adapter,
-            reverse_geocode_provider=self.reverse_geocode_adapter  # BLK-1-17
+            reverse_geocode_provider=self.reverse_geocode_adapter,  # BLK-1-17
+            route_cache=self.route_cache,
+            destination_writer=self.destination_writer
         )
         
         # Weather Use Case (optional - only if weather adapter is configured)
         if self.weather_adapter:
             # Use WeatherAPI.com geocoding adapter for weather feature
             # This keeps weather feature independent from TomTom Maps
-            weather_geocoding_adapter = WeatherAPIGeocodingAdapter(
+            weather_geocoding_adapter = self._with_geocode_cache(WeatherAPIGeocodingAdapter(
                 api_key=self.settings.weatherapi_api_key,
                 http=self.http,
                 timeout_sec=self.settings.http_timeout_sec
-            )
+            ))
             
             self.get_weather = GetWeatherUseCase(
                 geocoding_provider=weather_geocoding_adapter,
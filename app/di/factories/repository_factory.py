@@ -1,8 +1,11 @@
 """Repository factory patterns."""
 
-from typing import Dict, Any, Type, Protocol
+from typing import Dict, Any, Optional, Type, Protocol
 from app.application.ports.destination_repository import DestinationRepository
 from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
+from app.infrastructure.adapters.tiered_destination_repository import TieredDestinationRepository
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
 
 
 class RepositoryFactory(Protocol):
@@ -33,14 +36,70 @@ class MemoryRepositoryFactory:
         }
 
 
+class SQLiteRepositoryFactory:
+    """SQLite repository factory."""
+    
+    def __init__(self, database_path: str = "destinations.db", config: Optional[SQLiteConfig] = None):
+        """Initialize SQLite repository factory."""
+        self._database_path = database_path
+        self._config = config
+        self._repositories: Dict[str, Any] = {}
+    
+    def create_destination_repository(self) -> DestinationRepository:
+        """Create SQLite destination repository."""
+        if "destination_repository" not in self._repositories:
+            self._repositories["destination_repository"] = SQLiteDestinationRepository(
+                database_path=self._database_path,
+                config=self._config
+            )
+        return self._repositories["destination_repository"]
+    
+    def get_all_repositories(self) -> Dict[str, Any]:
+        """Get all repositories."""
+        return {
+            "destination_repository": self.create_destination_repository()
+        }
+
+
+class TieredRepositoryFactory(SQLiteRepositoryFactory):
+    """Memory tier (hash + n-gram index) đứng trước SQLite repository."""
+    
+    def create_destination_repository(self) -> DestinationRepository:
+        """Create tiered destination repository (read-through / write-through SQLite)."""
+        if "destination_repository" not in self._repositories:
+            self._repositories["destination_repository"] = TieredDestinationRepository(
+                primary=SQLiteDestinationRepository(
+                    database_path=self._database_path,
+                    config=self._config
+                )
+            )
+        return self._repositories["destination_repository"]
+
+
 class RepositoryFactoryManager:
     """Repository factory manager."""
     
-    def __init__(self):
-        """Initialize repository factory manager."""
-        self._factory = MemoryRepositoryFactory()
+    # DESTINATION_REPOSITORY_BACKEND -> factory
+    BACKENDS: Dict[str, Type] = {
+        "memory": MemoryRepositoryFactory,
+        "sqlite": SQLiteRepositoryFactory,
+        "tiered": TieredRepositoryFactory,
+    }
+    
+    def __init__(self, factory: Optional[RepositoryFactory] = None):
+        """Initialize repository factory manager (mặc định memory factory)."""
+        self._factory = factory if factory is not None else MemoryRepositoryFactory()
+    
+    @classmethod
+    def for_backend(cls, backend: str, database_path: str, config: Optional[SQLiteConfig] = None) -> "RepositoryFactoryManager":
+        """Create manager cho backend "memory", "sqlite" hoặc "tiered"."""
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"Unknown repository backend '{backend}', expected one of: {sorted(cls.BACKENDS)}")
+        if backend == "memory":
+            return cls(MemoryRepositoryFactory())
+        return cls(cls.BACKENDS[backend](database_path, config))
     
-    def get_factory(self) -> MemoryRepositoryFactory:
+    def get_factory(self) -> RepositoryFactory:
         """Get repository factory."""
         return self._factory
     
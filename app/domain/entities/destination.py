@@ -29,6 +29,29 @@ class Destination:
         self._validate_coordinates()
         self._validate_datetimes()
     
+    @classmethod
+    def trusted(
+        cls,
+        id: Optional[str],
+        name: DestinationName,
+        address: Address,
+        coordinates: LatLon,
+        created_at: datetime,
+        updated_at: datetime
+    ) -> "Destination":
+        """Rehydrate an entity whose data was validated on write (e.g. a row from our own database).
+        
+        Skips __post_init__ validation - never use for data coming from outside the system.
+        """
+        instance = object.__new__(cls)
+        instance.id = id
+        instance.name = name
+        instance.address = address
+        instance.coordinates = coordinates
+        instance.created_at = created_at
+        instance.updated_at = updated_at
+        return instance
+    
     def _validate_name(self) -> None:
         """Validate destination name"""
         if not isinstance(self.name, DestinationName):
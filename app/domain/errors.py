@@ -95,5 +95,6 @@ from app.domain.value_objects.humidity import InvalidHumidityError
 from app.domain.value_objects.pressure import InvalidPressureError
 from app.domain.value_objects.wind_speed import InvalidWindSpeedError
 from app.domain.value_objects.location_name import InvalidLocationNameError
+from app.domain.value_objects.page_cursor import InvalidPageCursorError
 # Note: InvalidWeatherDataError is defined in app.domain.entities.weather
-# Import it directly from there if needed to avoid circular imports
\ No newline at end of file
+# Import it directly from there if needed to avoid circular imports
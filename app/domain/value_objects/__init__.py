@@ -9,6 +9,7 @@ from .humidity import Humidity
 from .pressure import Pressure
 from .wind_speed import WindSpeed
 from .location_name import LocationName
+from .page_cursor import PageCursor
 
 __all__ = [
     'LatLon', 
@@ -21,4 +22,5 @@ __all__ = [
     'Pressure',
     'WindSpeed',
     'LocationName',
+    'PageCursor',
 ]
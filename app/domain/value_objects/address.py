@@ -45,6 +45,13 @@ class Address:
         # Update the value with trimmed version
         object.__setattr__(self, 'value', address_trimmed)
     
+    @classmethod
+    def trusted(cls, value: str) -> "Address":
+        """Create from an address that was already validated and trimmed (e.g. read back from storage), skipping validation"""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        return instance
+    
     def __str__(self) -> str:
         """String representation"""
         return self.value
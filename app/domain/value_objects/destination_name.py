@@ -45,6 +45,13 @@ class DestinationName:
         # Update the value with trimmed version
         object.__setattr__(self, 'value', name_trimmed)
     
+    @classmethod
+    def trusted(cls, value: str) -> "DestinationName":
+        """Create from a name that was already validated and trimmed (e.g. read back from storage), skipping validation"""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'value', value)
+        return instance
+    
     def __str__(self) -> str:
         """String representation"""
         return self.value
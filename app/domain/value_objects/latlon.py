@@ -1,9 +1,14 @@
 
+import math
 from dataclasses import dataclass
 
 from app.domain.errors import InvalidCoordinateError
 
 
+# Bán kính trung bình của Trái Đất (mét)
+EARTH_RADIUS_M = 6_371_008.8
+
+
 @dataclass(frozen=True)
 class LatLon:
     lat: float
@@ -24,3 +29,24 @@ class LatLon:
                 field="lon",
                 value=self.lon
             )
+
+    @classmethod
+    def trusted(cls, lat: float, lon: float) -> "LatLon":
+        """Create from coordinates that were already validated (e.g. read back from storage), skipping range checks."""
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "lat", lat)
+        object.__setattr__(instance, "lon", lon)
+        return instance
+
+    def distance_to(self, other: "LatLon") -> float:
+        """Great-circle distance (haversine) to another point, in meters."""
+        return haversine_m(self.lat, self.lon, other.lat, other.lon)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance (haversine) giữa hai tọa độ độ thập phân, in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(h)))
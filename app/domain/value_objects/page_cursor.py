@@ -0,0 +1,46 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.errors import DomainError
+
+
+class InvalidPageCursorError(DomainError):
+    """Raised when a pagination cursor cannot be decoded."""
+    
+    def __init__(self, message: str, entity_id: str = None, field: str = "cursor", value: Any = None):
+        super().__init__(message, entity_id, field, value)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Value object for keyset pagination cursor theo (created_at DESC, id DESC).
+
+    Trỏ tới destination cuối cùng của trang trước; trang kế tiếp bắt đầu ngay sau nó.
+    Client chỉ thấy token mờ (opaque) từ encode().
+    """
+    created_at: str
+    id: str
+
+    def encode(self) -> str:
+        """Token base64url (không padding) của [created_at, id]."""
+        raw = json.dumps([self.created_at, self.id], separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Parse token từ encode(); token không hợp lệ raise InvalidPageCursorError."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(created_at, str) or not isinstance(id, str):
+                raise ValueError("cursor fields must be strings")
+        except (UnicodeError, binascii.Error, ValueError, TypeError) as e:
+            raise InvalidPageCursorError(
+                f"Invalid page cursor: {e}",
+                entity_id="page_cursor",
+                value=token
+            ) from e
+        return cls(created_at, id)
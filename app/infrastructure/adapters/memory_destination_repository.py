@@ -1,40 +1,101 @@
-from typing import List, Optional
+import heapq
+from itertools import count
+from typing import AbstractSet, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+from app.application.dto.search_destinations_dto import DestinationSummary
 from app.application.ports.destination_repository import DestinationRepository
 from app.domain.entities.destination import Destination
+from app.domain.value_objects.latlon import LatLon, haversine_m
+from app.domain.value_objects.page_cursor import PageCursor
 from app.infrastructure.logging.logger import get_logger
+import unicodedata
 import uuid
 
 logger = get_logger(__name__)
 
+# Độ dài n-gram của index tìm kiếm chuỗi con
+NGRAM_SIZE = 3
+
+
+def _exact_key(text: str) -> str:
+    """Key cho lookup chính xác: bỏ khoảng trắng đầu/cuối, không phân biệt hoa thường."""
+    return text.strip().lower()
+
+
+def _search_key(text: str) -> str:
+    """Key cho tìm kiếm chuỗi con: không phân biệt hoa thường và dấu tiếng Việt (kể cả đ -> d)."""
+    decomposed = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    return "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
 
 class MemoryDestinationRepository(DestinationRepository):
-    """In-memory implementation of destination repository"""
-    
+    """In-memory implementation of destination repository
+
+    Hash index theo name/address (chuẩn hóa strip + lower) cho find_by_name/find_by_address,
+    và index trigram (không dấu) cho search_by_name_and_address: ứng viên là giao các posting
+    list của trigram trong term, sau đó kiểm tra chuỗi con. Term ngắn hơn 3 ký tự quét toàn bộ.
+    Index trigram chỉ phục vụ backend "memory": backend "tiered" chuyển search tới primary (SQLite FTS5).
+    Entity trả về là object được lưu trong repository - caller không được mutate.
+    """
+
     def __init__(self):
         self._destinations: dict[str, Destination] = {}
+        self._by_name: Dict[str, Dict[str, None]] = {}
+        self._by_address: Dict[str, Dict[str, None]] = {}
+        self._name_grams: Dict[str, Set[str]] = {}
+        self._address_grams: Dict[str, Set[str]] = {}
+        # Giá trị đã index theo id (thứ tự lưu, name, address) - gỡ index đúng kể cả khi entity bị mutate
+        self._indexed: Dict[str, Tuple[int, str, str]] = {}
+        self._sequence = count()
         logger.info("Initialized MemoryDestinationRepository")
-    
+
+    def __len__(self) -> int:
+        return len(self._destinations)
+
     async def save(self, destination: Destination) -> Destination:
         """Save a destination and return the saved entity with ID"""
         try:
             # Generate ID if not provided
             if destination.id is None:
                 destination.id = str(uuid.uuid4())
-            
-            # Update timestamps
-            now = destination.updated_at
-            destination.updated_at = now
-            
-            # Store in memory
+
+            # Store in memory (thay bản cũ trong các index nếu đã tồn tại)
+            self._unindex(destination.id)
             self._destinations[destination.id] = destination
-            
+            self._index(destination)
+
             logger.info(f"Saved destination with ID: {destination.id}")
             return destination
-            
+
         except Exception as e:
             logger.error(f"Error saving destination: {str(e)}")
             raise
-    
+
+    async def save_many(self, destinations: List[Destination]) -> List[Destination]:
+        """Save several destinations, skipping (and logging) the ones that fail"""
+        saved = []
+        for destination in destinations:
+            try:
+                saved.append(await self.save(destination))
+            except Exception as e:
+                logger.warning(f"Skipped destination in batch save: {str(e)}")
+        return saved
+
+    def preload(self, destinations: Iterable[Destination], exclude: AbstractSet[str] = frozenset()) -> int:
+        """Nạp hàng loạt các entity đã có id (bỏ qua id đã tồn tại hoặc nằm trong exclude); trả về số entity đã nạp"""
+        loaded = 0
+        for destination in destinations:
+            if destination.id in self._destinations or destination.id in exclude:
+                continue
+            self._destinations[destination.id] = destination
+            self._index(destination)
+            loaded += 1
+        logger.info(f"Preloaded {loaded} destinations")
+        return loaded
+
     async def find_by_id(self, destination_id: str) -> Optional[Destination]:
         """Find a destination by its ID"""
         try:
@@ -47,21 +108,33 @@ class MemoryDestinationRepository(DestinationRepository):
         except Exception as e:
             logger.error(f"Error finding destination by ID: {str(e)}")
             raise
-    
+
     async def find_by_name(self, name: str) -> Optional[Destination]:
         """Find a destination by its name"""
         try:
-            for destination in self._destinations.values():
-                if str(destination.name).lower() == name.lower():
-                    logger.info(f"Found destination by name: {name}")
-                    return destination
-            
-            logger.info(f"Destination not found by name: {name}")
-            return None
+            destination = self._first(self._by_name.get(_exact_key(name)))
+            if destination:
+                logger.info(f"Found destination by name: {name}")
+            else:
+                logger.info(f"Destination not found by name: {name}")
+            return destination
         except Exception as e:
             logger.error(f"Error finding destination by name: {str(e)}")
             raise
-    
+
+    async def find_by_address(self, address: str) -> Optional[Destination]:
+        """Find a destination by its exact address (case-insensitive, ignoring surrounding whitespace)"""
+        try:
+            destination = self._first(self._by_address.get(_exact_key(address)))
+            if destination:
+                logger.info(f"Found destination by address: {address}")
+            else:
+                logger.info(f"Destination not found by address: {address}")
+            return destination
+        except Exception as e:
+            logger.error(f"Error finding destination by address: {str(e)}")
+            raise
+
     async def list_all(self) -> List[Destination]:
         """List all saved destinations"""
         try:
@@ -71,12 +144,46 @@ class MemoryDestinationRepository(DestinationRepository):
         except Exception as e:
             logger.error(f"Error listing destinations: {str(e)}")
             raise
-    
+
+    async def list_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[Destination], Optional[PageCursor]]:
+        """List one page of destinations ordered by (created_at, id) descending (sắp xếp toàn bộ mỗi lần gọi)"""
+        try:
+            keyed = sorted(
+                ((destination.created_at.isoformat(), destination.id, destination) for destination in self._destinations.values()),
+                key=lambda item: (item[0], item[1]),
+                reverse=True
+            )
+            if after is not None:
+                keyed = [item for item in keyed if (item[0], item[1]) < (after.created_at, after.id)]
+            page = keyed[:limit]
+            next_cursor = PageCursor(page[-1][0], page[-1][1]) if len(keyed) > limit else None
+            logger.info(f"Listed page of {len(page)} destinations (more: {next_cursor is not None})")
+            return [destination for _, _, destination in page], next_cursor
+        except Exception as e:
+            logger.error(f"Error listing destinations page: {str(e)}")
+            raise
+
+    async def list_summary_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[DestinationSummary], Optional[PageCursor]]:
+        """Same page as list_page, as DestinationSummary"""
+        destinations, next_cursor = await self.list_page(limit, after)
+        return [DestinationSummary.from_destination(destination) for destination in destinations], next_cursor
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Destination]:
+        """Stream all destinations in list_page order"""
+        after = None
+        while True:
+            destinations, after = await self.list_page(chunk_size, after)
+            for destination in destinations:
+                yield destination
+            if after is None:
+                return
+
     async def delete(self, destination_id: str) -> bool:
         """Delete a destination by ID, return True if deleted"""
         try:
-            if destination_id in self._destinations:
-                del self._destinations[destination_id]
+            destination = self._destinations.pop(destination_id, None)
+            if destination is not None:
+                self._unindex(destination_id, keep_order=False)
                 logger.info(f"Deleted destination with ID: {destination_id}")
                 return True
             else:
@@ -85,23 +192,109 @@ class MemoryDestinationRepository(DestinationRepository):
         except Exception as e:
             logger.error(f"Error deleting destination: {str(e)}")
             raise
-    
+
+    async def find_nearby(self, center: LatLon, limit: int = 10, radius_m: Optional[float] = None) -> List[Tuple[Destination, float]]:
+        """Find the destinations nearest to center (quét toàn bộ, tính haversine cho từng destination)"""
+        try:
+            distances = (
+                (destination, haversine_m(center.lat, center.lon, destination.coordinates.lat, destination.coordinates.lon))
+                for destination in self._destinations.values()
+            )
+            if radius_m is not None:
+                distances = ((d, meters) for d, meters in distances if meters <= radius_m)
+            nearest = heapq.nsmallest(limit, distances, key=lambda item: item[1])
+            logger.info(f"Found {len(nearest)} destinations near {center.lat}, {center.lon}")
+            return nearest
+        except Exception as e:
+            logger.error(f"Error finding nearby destinations: {str(e)}")
+            raise
+
     async def search_by_name_and_address(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[Destination]:
-        """Search destinations by ID, name and/or address (partial matching, case-insensitive)"""
+        """Search destinations by ID, name and/or address (partial matching, case- and diacritic-insensitive)"""
         try:
-            matching_destinations = []
-            
-            for destination in self._destinations.values():
-                id_match = not id or (destination.id == id)
-                name_match = not name or (name.lower() in str(destination.name).lower())
-                address_match = not address or (address.lower() in str(destination.address).lower())
-                
-                if id_match and name_match and address_match:
-                    matching_destinations.append(destination)
-            
+            if id:
+                candidates = {id} if id in self._destinations else set()
+            else:
+                candidates = None
+
+            name_key = _search_key(name) if name else None
+            address_key = _search_key(address) if address else None
+            for key, grams in ((name_key, self._name_grams), (address_key, self._address_grams)):
+                if key is not None:
+                    candidates = self._narrow(candidates, key, grams)
+
+            # Giữ thứ tự lưu; kiểm tra chuỗi con trên các ứng viên còn lại
+            ids = self._destinations.keys() if candidates is None else sorted(candidates, key=lambda i: self._indexed[i][0])
+            matching_destinations = [
+                destination for destination in (self._destinations[i] for i in ids)
+                if (name_key is None or name_key in _search_key(str(destination.name)))
+                and (address_key is None or address_key in _search_key(str(destination.address)))
+            ]
+
             logger.info(f"Found {len(matching_destinations)} destinations matching id='{id}', name='{name}', address='{address}'")
             return matching_destinations
-            
+
         except Exception as e:
             logger.error(f"Error searching destinations: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def search_summaries(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[DestinationSummary]:
+        """Same results as search_by_name_and_address, as DestinationSummary"""
+        destinations = await self.search_by_name_and_address(id=id, name=name, address=address)
+        return [DestinationSummary.from_destination(destination) for destination in destinations]
+
+    def _first(self, ids: Optional[Dict[str, None]]) -> Optional[Destination]:
+        if not ids:
+            return None
+        return self._destinations[next(iter(ids))]
+
+    @staticmethod
+    def _narrow(candidates: Optional[Set[str]], key: str, grams: Dict[str, Set[str]]) -> Optional[Set[str]]:
+        """Giao ứng viên với posting list của các trigram trong key (None = chưa lọc)."""
+        postings = sorted((grams.get(gram, set()) for gram in _ngrams(key)), key=len)
+        for posting in postings:
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                break
+        return candidates
+
+    def _index(self, destination: Destination) -> None:
+        name, address = str(destination.name), str(destination.address)
+        previous = self._indexed.get(destination.id)
+        sequence = previous[0] if previous is not None else next(self._sequence)
+        self._indexed[destination.id] = (sequence, name, address)
+        self._by_name.setdefault(_exact_key(name), {})[destination.id] = None
+        self._by_address.setdefault(_exact_key(address), {})[destination.id] = None
+        self._add_grams(self._name_grams, name, destination.id)
+        self._add_grams(self._address_grams, address, destination.id)
+
+    def _unindex(self, destination_id: str, keep_order: bool = True) -> None:
+        indexed = self._indexed.get(destination_id)
+        if indexed is None:
+            return
+        _, name, address = indexed
+        for index, value in ((self._by_name, name), (self._by_address, address)):
+            key = _exact_key(value)
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(destination_id, None)
+                if not ids:
+                    del index[key]
+        self._remove_grams(self._name_grams, name, destination_id)
+        self._remove_grams(self._address_grams, address, destination_id)
+        if not keep_order:
+            del self._indexed[destination_id]
+
+    @staticmethod
+    def _add_grams(grams: Dict[str, Set[str]], text: str, destination_id: str) -> None:
+        for gram in _ngrams(_search_key(text)):
+            grams.setdefault(gram, set()).add(destination_id)
+
+    @staticmethod
+    def _remove_grams(grams: Dict[str, Set[str]], text: str, destination_id: str) -> None:
+        for gram in _ngrams(_search_key(text)):
+            posting = grams.get(gram)
+            if posting is not None:
+                posting.discard(destination_id)
+                if not posting:
+                    del grams[gram]
@@ -0,0 +1,149 @@
+"""Tiered destination repository - memory tier có index đứng trước repository bền vững (SQLite)."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.application.dto.search_destinations_dto import DestinationSummary
+from app.application.ports.destination_repository import DestinationRepository
+from app.application.services.single_flight import SingleFlight
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.latlon import LatLon
+from app.domain.value_objects.page_cursor import PageCursor
+from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TieredDestinationRepository(DestinationRepository):
+    """Read-through / write-through memory tier cho một DestinationRepository.
+
+    Đầu vào: primary (nguồn dữ liệu bền vững), cache (MemoryDestinationRepository)
+    Chức năng: lần đọc đầu tiên nạp toàn bộ destinations từ primary vào memory tier
+    (các lần đọc đồng thời dùng chung một lần nạp); sau đó mọi lệnh đọc chỉ dùng memory
+    (trừ find_nearby, list_page, list_summary_page, iter_all và search - đi thẳng tới index của primary,
+    để thứ tự và ngữ nghĩa match giống hệt backend primary).
+    Lệnh ghi đi qua primary trước, rồi cập nhật memory bằng entity primary trả về.
+    Memory tier chỉ đồng bộ khi mọi lệnh ghi đi qua repository này (một process).
+    Nếu nạp thất bại, lệnh đọc fallback về primary và lần đọc sau thử nạp lại.
+    """
+
+    def __init__(self, primary: DestinationRepository, cache: Optional[MemoryDestinationRepository] = None):
+        self._primary = primary
+        self._cache = cache if cache is not None else MemoryDestinationRepository()
+        self._loaded = False
+        self._loading = False
+        self._deleted_while_loading: Set[str] = set()
+        self._load_flight: SingleFlight[int] = SingleFlight()
+        self._memory_reads = 0
+        self._primary_reads = 0
+
+    async def warm(self) -> int:
+        """Nạp toàn bộ destinations từ primary vào memory tier; trả về số entity trong tier."""
+        return await self._load_flight.do("load", self._load)
+
+    async def save(self, destination: Destination) -> Destination:
+        """Save qua primary, sau đó cập nhật memory tier"""
+        saved = await self._primary.save(destination)
+        await self._cache.save(saved)
+        return saved
+
+    async def save_many(self, destinations: List[Destination]) -> List[Destination]:
+        """Save nhiều destination qua primary (một transaction), sau đó cập nhật memory tier"""
+        saved = await self._primary.save_many(destinations)
+        await self._cache.save_many(saved)
+        return saved
+
+    async def delete(self, destination_id: str) -> bool:
+        """Delete qua primary, sau đó xóa khỏi memory tier"""
+        deleted = await self._primary.delete(destination_id)
+        await self._cache.delete(destination_id)
+        if self._loading:
+            self._deleted_while_loading.add(destination_id)
+        return deleted
+
+    async def find_by_id(self, destination_id: str) -> Optional[Destination]:
+        """Find a destination by its ID"""
+        if not await self._ensure_loaded():
+            return await self._primary.find_by_id(destination_id)
+        return await self._cache.find_by_id(destination_id)
+
+    async def find_by_name(self, name: str) -> Optional[Destination]:
+        """Find a destination by its name"""
+        if not await self._ensure_loaded():
+            return await self._primary.find_by_name(name)
+        return await self._cache.find_by_name(name)
+
+    async def find_by_address(self, address: str) -> Optional[Destination]:
+        """Find a destination by its exact address (case-insensitive, ignoring surrounding whitespace)"""
+        if not await self._ensure_loaded():
+            return await self._primary.find_by_address(address)
+        return await self._cache.find_by_address(address)
+
+    async def list_all(self) -> List[Destination]:
+        """List all saved destinations (mới nhất trước, như SQLite repository)"""
+        if not await self._ensure_loaded():
+            return await self._primary.list_all()
+        destinations = await self._cache.list_all()
+        return sorted(destinations, key=lambda d: d.created_at, reverse=True)
+
+    async def list_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[Destination], Optional[PageCursor]]:
+        """List one page qua primary (keyset trên index của primary, không sắp xếp lại memory tier mỗi trang)"""
+        return await self._primary.list_page(limit, after)
+
+    async def list_summary_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[DestinationSummary], Optional[PageCursor]]:
+        """List one page of summaries qua primary (như list_page)"""
+        return await self._primary.list_summary_page(limit, after)
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Destination]:
+        """Stream all destinations qua primary"""
+        async for destination in self._primary.iter_all(chunk_size):
+            yield destination
+
+    async def find_nearby(self, center: LatLon, limit: int = 10, radius_m: Optional[float] = None) -> List[Tuple[Destination, float]]:
+        """Find nearby destinations qua primary (spatial index của primary nhanh hơn quét memory tier)"""
+        return await self._primary.find_nearby(center, limit=limit, radius_m=radius_m)
+
+    async def search_by_name_and_address(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[Destination]:
+        """Search destinations through the primary, so results and ranking match the primary's full-text index"""
+        return await self._primary.search_by_name_and_address(id=id, name=name, address=address)
+
+    async def search_summaries(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[DestinationSummary]:
+        """Same results as search_by_name_and_address (through the primary), as DestinationSummary"""
+        return await self._primary.search_summaries(id=id, name=name, address=address)
+
+    def stats(self) -> Dict[str, Any]:
+        """Trạng thái memory tier và số lệnh đọc phục vụ từ memory / primary."""
+        return {
+            "loaded": self._loaded,
+            "size": len(self._cache),
+            "memory_reads": self._memory_reads,
+            "primary_reads": self._primary_reads,
+        }
+
+    async def _ensure_loaded(self) -> bool:
+        """True nếu memory tier đã sẵn sàng phục vụ lệnh đọc."""
+        if not self._loaded:
+            try:
+                await self.warm()
+            except Exception as e:
+                logger.warning(f"Failed to load destinations into memory tier, reading from primary: {e}")
+                self._primary_reads += 1
+                return False
+        self._memory_reads += 1
+        return True
+
+    async def _load(self) -> int:
+        if self._loaded:
+            return len(self._cache)
+        self._loading = True
+        self._deleted_while_loading.clear()
+        try:
+            destinations = await self._primary.list_all()
+            # Lệnh ghi trong lúc nạp đã cập nhật memory tier - bản đó mới hơn snapshot
+            self._cache.preload(destinations, exclude=self._deleted_while_loading)
+            self._loaded = True
+        finally:
+            self._loading = False
+            self._deleted_while_loading.clear()
+        logger.info(f"Loaded {len(self._cache)} destinations into memory tier")
+        return len(self._cache)
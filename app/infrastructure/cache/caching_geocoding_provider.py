@@ -0,0 +1,84 @@
+"""Caching decorator cho GeocodingProvider - tránh geocode lại các địa chỉ vừa resolve."""
+
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+from app.application.dto.geocoding_dto import (
+    GeocodeAddressCommandDTO,
+    GeocodeResponseDTO,
+    StructuredGeocodeCommandDTO,
+)
+from app.application.ports.geocoding_provider import GeocodingProvider
+from app.domain.constants.api_constants import CountryConstants
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+GeocodeCacheKey = Tuple[str, str, str, int]
+
+
+class CachingGeocodingProvider(GeocodingProvider):
+    """Bọc một GeocodingProvider bằng LRU/TTL cache cho geocode_address.
+
+    Đầu vào: inner provider, cache (LruTtlCache), negative_ttl_sec
+    Chức năng: Key là (address, country_set, language, limit) đã chuẩn hóa.
+    Kết quả rỗng được cache ngắn hạn (negative caching) để địa chỉ sai
+    không bị gọi lại liên tục; lỗi từ upstream không được cache.
+    """
+
+    def __init__(
+        self,
+        inner: GeocodingProvider,
+        cache: Optional[LruTtlCache[GeocodeResponseDTO]] = None,
+        negative_ttl_sec: float = 60.0,
+    ):
+        self._inner = inner
+        self._cache: LruTtlCache[GeocodeResponseDTO] = cache if cache is not None else LruTtlCache()
+        self._negative_ttl_sec = negative_ttl_sec
+
+    async def geocode_address(self, cmd: GeocodeAddressCommandDTO) -> GeocodeResponseDTO:
+        """Geocode địa chỉ, ưu tiên kết quả trong cache."""
+        key = self.cache_key(cmd)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug(f"Geocode cache hit: {cmd.address}")
+            return cached
+
+        response = await self._inner.geocode_address(cmd)
+        ttl = None if response.results else self._negative_ttl_sec
+        self._cache.set(key, response, ttl_sec=ttl)
+        return response
+
+    async def structured_geocode(self, cmd: StructuredGeocodeCommandDTO) -> GeocodeResponseDTO:
+        """Structured geocoding - không cache, chuyển thẳng tới inner provider."""
+        return await self._inner.structured_geocode(cmd)
+
+    async def search_street_center(
+        self,
+        street_name: str,
+        country_set: str = CountryConstants.DEFAULT,
+        language: str = "vi-VN"
+    ) -> GeocodeResponseDTO:
+        """Tìm trung tâm đường phố - không cache, chuyển thẳng tới inner provider."""
+        return await self._inner.search_street_center(street_name, country_set, language)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê hit/miss của geocode cache."""
+        return self._cache.stats()
+
+    @staticmethod
+    def cache_key(cmd: GeocodeAddressCommandDTO) -> GeocodeCacheKey:
+        """Chuẩn hóa command thành cache key (NFC, gộp khoảng trắng, không phân biệt hoa thường)."""
+        return (
+            normalize_address(cmd.address),
+            (cmd.country_set or "").strip().upper(),
+            (cmd.language or "").strip().lower(),
+            int(cmd.limit),
+        )
+
+
+def normalize_address(address: str) -> str:
+    """Chuẩn hóa địa chỉ free-text để các biến thể gõ khác nhau dùng chung một key."""
+    normalized = unicodedata.normalize("NFC", address or "")
+    return " ".join(normalized.split()).casefold()
@@ -0,0 +1,83 @@
+"""Caching decorator cho ReverseGeocodeProvider - cache địa chỉ theo ô geohash."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.application.constants.validation_constants import DefaultValues
+from app.application.dto.traffic_dto import GeocodedAddress, ReverseGeocodeCommand, ReverseGeocodeResponse
+from app.application.ports.reverse_geocode_provider import ReverseGeocodeProvider
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.cache import geohash
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (address, freeform_address) đã resolve cho một ô geohash
+CachedAddress = Tuple[str, str]
+
+
+class CachingReverseGeocodeProvider(ReverseGeocodeProvider):
+    """Bọc ReverseGeocodeProvider bằng cache theo ô geohash + language.
+
+    Đầu vào: inner provider, cache (LruTtlCache), precision (độ dài geohash)
+    Chức năng: Mặc định precision=7 (ô ~150m), khớp với radius=100 mà adapter gửi
+    lên TomTom nên các điểm trong cùng ô gần như luôn resolve ra cùng con đường.
+    Chỉ gửi xuống inner các ô chưa có trong cache (mỗi ô một lần), kết quả
+    fallback "không xác định" không được cache.
+    """
+
+    def __init__(
+        self,
+        inner: ReverseGeocodeProvider,
+        cache: Optional[LruTtlCache[CachedAddress]] = None,
+        precision: int = 7,
+    ):
+        self._inner = inner
+        self._cache: LruTtlCache[CachedAddress] = cache if cache is not None else LruTtlCache()
+        self._precision = precision
+
+    async def reverse_geocode(self, cmd: ReverseGeocodeCommand) -> ReverseGeocodeResponse:
+        """Reverse geocode, chỉ gọi upstream cho các ô geohash bị miss."""
+        keys = [self._cache_key(coord, cmd.language) for coord in cmd.coordinates]
+
+        resolved: Dict[Tuple[str, str], CachedAddress] = {}
+        miss_coords: Dict[Tuple[str, str], LatLon] = {}
+        for key, coord in zip(keys, cmd.coordinates):
+            if key in resolved or key in miss_coords:
+                continue
+            cached = self._cache.get(key)
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                miss_coords[key] = coord
+
+        success = True
+        error_message = None
+        if miss_coords:
+            logger.debug(
+                f"Reverse geocode cache: {len(cmd.coordinates) - len(miss_coords)} hits, {len(miss_coords)} cells to fetch"
+            )
+            response = await self._inner.reverse_geocode(
+                ReverseGeocodeCommand(coordinates=list(miss_coords.values()), language=cmd.language)
+            )
+            success = response.success or bool(resolved)
+            error_message = response.error_message
+            for key, address in zip(miss_coords.keys(), response.addresses):
+                value = (address.address, address.freeform_address)
+                resolved[key] = value
+                if address.freeform_address != DefaultValues.UNKNOWN_ADDRESS:
+                    self._cache.set(key, value)
+
+        addresses: List[GeocodedAddress] = []
+        for key, coord in zip(keys, cmd.coordinates):
+            address, freeform = resolved.get(key, (DefaultValues.UNKNOWN_ADDRESS, DefaultValues.UNKNOWN_ADDRESS))
+            addresses.append(GeocodedAddress(coordinate=coord, address=address, freeform_address=freeform))
+
+        return ReverseGeocodeResponse(success=success, addresses=addresses, error_message=error_message)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê hit/miss của reverse geocode cache."""
+        return {**self._cache.stats(), "precision": self._precision}
+
+    def _cache_key(self, coord: LatLon, language: str) -> Tuple[str, str]:
+        return geohash.encode(coord.lat, coord.lon, self._precision), (language or "").lower()
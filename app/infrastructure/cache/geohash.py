@@ -0,0 +1,48 @@
+"""Geohash encoding - lượng tử hóa tọa độ thành ô lưới để làm cache key không gian."""
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Kích thước ô xấp xỉ (mét) theo precision, dùng để chọn precision khớp với radius
+CELL_SIZE_METERS = {
+    5: 4_900,
+    6: 1_200,
+    7: 153,
+    8: 38,
+    9: 5,
+}
+
+
+def encode(lat: float, lon: float, precision: int = 7) -> str:
+    """Mã hóa (lat, lon) thành geohash với số ký tự precision.
+
+    Đầu vào: lat, lon, precision (1-12)
+    Đầu ra: chuỗi geohash; các điểm trong cùng ô có cùng geohash
+    """
+    if not 1 <= precision <= 12:
+        raise ValueError("precision must be between 1 and 12")
+
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # Bit chẵn chia kinh độ, bit lẻ chia vĩ độ
+
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
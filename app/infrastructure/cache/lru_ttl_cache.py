@@ -0,0 +1,91 @@
+"""LRU cache có TTL cho từng entry - dùng chung cho các caching decorator."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class LruTtlCache(Generic[V]):
+    """Bounded LRU cache với TTL, hỗ trợ TTL riêng cho từng entry.
+
+    Đầu vào: max_size (số entry tối đa), ttl_sec (TTL mặc định), clock (để test)
+    Chức năng: get/set O(1); entry hết hạn được coi là miss và bị xóa khi đọc;
+    khi đầy thì loại entry ít dùng nhất. Không thread-safe - dùng trong một event loop.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_sec: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._max_size = max_size
+        self._ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Lấy value còn hạn theo key, None nếu miss hoặc đã hết hạn."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl_sec: Optional[float] = None) -> None:
+        """Lưu value với TTL mặc định hoặc TTL riêng (ví dụ negative caching)."""
+        ttl = self._ttl_sec if ttl_sec is None else ttl_sec
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Xóa một entry, trả về True nếu entry tồn tại."""
+        return self._entries.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Xóa mọi entry có key thỏa predicate, trả về số entry đã xóa."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Xóa toàn bộ entries (giữ nguyên counters)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thống kê hit/miss để theo dõi hiệu quả cache."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
@@ -20,12 +20,204 @@ class Settings(BaseModel):
         default_factory=lambda: int(os.getenv("HTTP_TIMEOUT_SEC", "12")),
         ge=1, le=300
     )
+    detailed_route_budget_sec: float = Field(
+        default_factory=lambda: float(os.getenv("DETAILED_ROUTE_BUDGET_SEC", "15")),
+        gt=0, le=300
+    )
+    http_pool_limit: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_POOL_LIMIT", "100")),
+        ge=1, le=1000
+    )
+    http_pool_limit_per_host: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20")),
+        ge=1, le=1000
+    )
+    http_keepalive_timeout_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_KEEPALIVE_TIMEOUT_SEC", "30")),
+        ge=0, le=600
+    )
+    http_dns_cache_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_DNS_CACHE_TTL_SEC", "300")),
+        ge=0, le=86400
+    )
+    http_warmup_enabled: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_WARMUP_ENABLED", "true").lower() == "true"
+    )
+    http_coalesce_gets: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_COALESCE_GETS", "true").lower() == "true"
+    )
+    http_retry_max_retries: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_RETRY_MAX_RETRIES", "3")),
+        ge=0, le=10
+    )
+    http_retry_base_delay_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_RETRY_BASE_DELAY_SEC", "0.25")),
+        ge=0, le=60
+    )
+    http_retry_max_delay_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_RETRY_MAX_DELAY_SEC", "5")),
+        ge=0, le=300
+    )
+    http_rate_limit_enabled: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    )
+    tomtom_rate_limit_rps: float = Field(
+        default_factory=lambda: float(os.getenv("TOMTOM_RATE_LIMIT_RPS", "50")),
+        gt=0, le=10000
+    )
+    tomtom_rate_limit_burst: int = Field(
+        default_factory=lambda: int(os.getenv("TOMTOM_RATE_LIMIT_BURST", "100")),
+        ge=1, le=10000
+    )
+    weather_rate_limit_rps: float = Field(
+        default_factory=lambda: float(os.getenv("WEATHER_RATE_LIMIT_RPS", "10")),
+        gt=0, le=10000
+    )
+    weather_rate_limit_burst: int = Field(
+        default_factory=lambda: int(os.getenv("WEATHER_RATE_LIMIT_BURST", "20")),
+        ge=1, le=10000
+    )
+    http_circuit_breaker_enabled: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    )
+    http_circuit_failure_rate: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_CIRCUIT_FAILURE_RATE", "0.5")),
+        gt=0, le=1
+    )
+    http_circuit_slow_call_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_CIRCUIT_SLOW_CALL_SEC", "5")),
+        gt=0, le=300
+    )
+    http_circuit_open_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_CIRCUIT_OPEN_SEC", "30")),
+        gt=0, le=3600
+    )
+    http_stale_cache_max_size: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_STALE_CACHE_MAX_SIZE", "256")),
+        ge=0, le=100000
+    )
+    http_stale_cache_ttl_sec: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_STALE_CACHE_TTL_SEC", "3600")),
+        gt=0, le=86400
+    )
+    http_hedging_enabled: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_HEDGING_ENABLED", "false").lower() == "true"
+    )
+    http_hedge_percentile: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_HEDGE_PERCENTILE", "0.95")),
+        gt=0, lt=1
+    )
+    http_hedge_budget_ratio: float = Field(
+        default_factory=lambda: float(os.getenv("HTTP_HEDGE_BUDGET_RATIO", "0.05")),
+        ge=0, le=1
+    )
+    http_adaptive_concurrency_enabled: bool = Field(
+        default_factory=lambda: os.getenv("HTTP_ADAPTIVE_CONCURRENCY_ENABLED", "true").lower() == "true"
+    )
+    http_concurrency_initial_limit: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_CONCURRENCY_INITIAL_LIMIT", "10")),
+        ge=1, le=1000
+    )
+    http_concurrency_min_limit: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_CONCURRENCY_MIN_LIMIT", "1")),
+        ge=1, le=1000
+    )
+    http_concurrency_max_limit: int = Field(
+        default_factory=lambda: int(os.getenv("HTTP_CONCURRENCY_MAX_LIMIT", "50")),
+        ge=1, le=1000
+    )
+    geocode_cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("GEOCODE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    geocode_cache_max_size: int = Field(
+        default_factory=lambda: int(os.getenv("GEOCODE_CACHE_MAX_SIZE", "2048")),
+        ge=1, le=1_000_000
+    )
+    geocode_cache_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("GEOCODE_CACHE_TTL_SEC", "86400")),
+        ge=0, le=2_592_000
+    )
+    geocode_cache_negative_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("GEOCODE_CACHE_NEGATIVE_TTL_SEC", "60")),
+        ge=0, le=86400
+    )
+    tomtom_batch_search_enabled: bool = Field(
+        default_factory=lambda: os.getenv("TOMTOM_BATCH_SEARCH_ENABLED", "true").lower() == "true"
+    )
+    reverse_geocode_max_concurrency: int = Field(
+        default_factory=lambda: int(os.getenv("REVERSE_GEOCODE_MAX_CONCURRENCY", "8")),
+        ge=1, le=100
+    )
+    reverse_geocode_cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("REVERSE_GEOCODE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    reverse_geocode_cache_max_size: int = Field(
+        default_factory=lambda: int(os.getenv("REVERSE_GEOCODE_CACHE_MAX_SIZE", "10000")),
+        ge=1, le=1_000_000
+    )
+    reverse_geocode_cache_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("REVERSE_GEOCODE_CACHE_TTL_SEC", "604800")),
+        ge=0, le=2_592_000
+    )
+    reverse_geocode_cache_precision: int = Field(
+        default_factory=lambda: int(os.getenv("REVERSE_GEOCODE_CACHE_PRECISION", "7")),
+        ge=5, le=9
+    )
+    route_cache_enabled: bool = Field(
+        default_factory=lambda: os.getenv("ROUTE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    route_cache_max_size: int = Field(
+        default_factory=lambda: int(os.getenv("ROUTE_CACHE_MAX_SIZE", "512")),
+        ge=1, le=100_000
+    )
+    route_cache_min_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("ROUTE_CACHE_MIN_TTL_SEC", "60")),
+        ge=0, le=86400
+    )
+    route_cache_max_ttl_sec: int = Field(
+        default_factory=lambda: int(os.getenv("ROUTE_CACHE_MAX_TTL_SEC", "600")),
+        ge=0, le=86400
+    )
+    route_cache_departure_bucket_sec: int = Field(
+        default_factory=lambda: int(os.getenv("ROUTE_CACHE_DEPARTURE_BUCKET_SEC", "1800")),
+        ge=1, le=86400
+    )
     log_level: str = Field(
         default_factory=lambda: os.getenv("LOG_LEVEL", "INFO")
     )
     database_path: str = Field(
         default_factory=lambda: os.getenv("DATABASE_PATH", "app/infrastructure/persistence/database/destinations.db")
     )
+    destination_repository_backend: str = Field(
+        default_factory=lambda: os.getenv("DESTINATION_REPOSITORY_BACKEND", "sqlite")
+    )
+    sqlite_cache_size_kib: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_CACHE_SIZE_KIB", "16384")),
+        ge=0, le=4194304
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_MMAP_SIZE_MB", "128")),
+        ge=0, le=65536
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        ge=0, le=600000
+    )
+    sqlite_read_pool_size: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_READ_POOL_SIZE", "4")),
+        ge=0, le=64
+    )
+    destination_write_behind_enabled: bool = Field(
+        default_factory=lambda: os.getenv("DESTINATION_WRITE_BEHIND_ENABLED", "true").lower() == "true"
+    )
+    destination_write_behind_flush_ms: int = Field(
+        default_factory=lambda: int(os.getenv("DESTINATION_WRITE_BEHIND_FLUSH_MS", "500")),
+        ge=10, le=60000
+    )
+    destination_write_behind_batch_size: int = Field(
+        default_factory=lambda: int(os.getenv("DESTINATION_WRITE_BEHIND_BATCH_SIZE", "100")),
+        ge=1, le=10000
+    )
     weatherapi_api_key: str = Field(
         default_factory=lambda: os.getenv("WEATHERAPI_API_KEY", "")
     )
@@ -53,6 +245,14 @@ class Settings(BaseModel):
             raise ValueError("WEATHERAPI_API_KEY format is invalid (expected min 20 chars)")
         return v
 
+    @field_validator('destination_repository_backend')
+    @classmethod
+    def validate_destination_repository_backend(cls, v: str) -> str:
+        valid_backends = ['sqlite', 'tiered', 'memory']
+        if v.lower() not in valid_backends:
+            raise ValueError(f"Destination repository backend must be one of: {valid_backends}")
+        return v.lower()
+
     @field_validator('log_level')
     @classmethod
     def validate_log_level(cls, v: str) -> str:
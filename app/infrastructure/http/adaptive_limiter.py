@@ -0,0 +1,163 @@
+"""Adaptive concurrency limiter (AIMD) - giới hạn số request đang chạy theo từng nhóm upstream."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .rate_limiter import RateLimiter
+
+
+@dataclass(frozen=True)
+class AdaptiveLimitConfig:
+    """Cấu hình AIMD.
+
+    Limit tăng cộng (+1 sau mỗi ~limit request thành công) khi latency còn gần
+    latency nhỏ nhất quan sát được của cùng endpoint (<= min_latency * latency_tolerance),
+    và giảm nhân (* backoff_ratio) khi timeout, 429/503 hoặc latency tăng vọt.
+    """
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    backoff_ratio: float = 0.7
+    latency_tolerance: float = 2.0
+    latency_window: int = 100
+
+    def __post_init__(self):
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit")
+
+
+class AdaptiveLimit:
+    """Concurrency limit tự điều chỉnh cho một upstream.
+
+    Đầu vào: AdaptiveLimitConfig, clock (để test)
+    Chức năng: acquire() chờ tới khi số request đang chạy < limit; caller gọi
+    on_success()/on_drop()/on_ignore() với thời điểm bắt đầu để trả slot và điều chỉnh limit.
+    Latency baseline được theo dõi riêng cho từng endpoint của nhóm (vd. geocode và batch
+    cùng nhóm "search" nhưng latency khác hẳn nhau).
+    Chỉ giảm limit một lần cho các request bắt đầu trước lần giảm gần nhất,
+    tránh một đợt lỗi đồng thời làm limit rơi về min_limit.
+    """
+
+    def __init__(self, config: AdaptiveLimitConfig, clock: Callable[[], float] = time.monotonic):
+        self._config = config
+        self._clock = clock
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._last_backoff_at = float("-inf")
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._drops = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self, deadline: Optional[float] = None) -> float:
+        """Chờ một slot; trả về thời điểm bắt đầu (truyền lại khi release).
+
+        Raise TimeoutError nếu chưa có slot trước deadline (time.monotonic).
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return self._clock()
+
+        # Xếp hàng FIFO; slot được chuyển thẳng cho waiter khi có request hoàn thành
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # slot đã được cấp nhưng caller không dùng nữa
+            else:
+                waiter.cancel()
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            raise
+        return self._clock()
+
+    def on_success(self, started_at: float, endpoint: str = "", latency_signal: bool = True) -> None:
+        """Request thành công: tăng limit nếu latency ổn định, giảm nếu latency tăng vọt.
+
+        Latency được so với baseline của chính endpoint. latency_signal=False (latency phụ thuộc
+        kích thước request, vd. batch hay route dài) thì request không làm giảm limit.
+        """
+        latency = self._clock() - started_at
+        inflated = False
+        if latency_signal:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self._config.latency_window)
+            inflated = bool(latencies) and latency > min(latencies) * self._config.latency_tolerance
+            latencies.append(latency)
+        if inflated:
+            self._backoff(started_at)
+        elif self._in_flight * 2 >= self.limit:
+            # Chỉ tăng khi limit thực sự đang được dùng, tránh limit phình ra lúc tải thấp
+            self._limit = min(float(self._config.max_limit), self._limit + 1 / self._limit)
+            self._increases += 1
+        self._release()
+
+    def on_drop(self, started_at: float) -> None:
+        """Request bị timeout / 429 / 503: giảm limit theo cấp số nhân."""
+        self._drops += 1
+        self._backoff(started_at)
+        self._release()
+
+    def on_ignore(self) -> None:
+        """Trả slot mà không điều chỉnh limit (lỗi không liên quan tới tải, bị hủy...)."""
+        self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Limit hiện tại, số request đang chạy và latency nhỏ nhất quan sát được theo endpoint."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "min_latency_ms": {
+                endpoint: round(min(latencies) * 1000, 3) for endpoint, latencies in self._latencies.items()
+            },
+            "drops": self._drops,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
+
+    def _backoff(self, started_at: float) -> None:
+        if started_at < self._last_backoff_at:
+            return
+        self._limit = max(float(self._config.min_limit), self._limit * self._config.backoff_ratio)
+        self._last_backoff_at = self._clock()
+        self._decreases += 1
+
+    def _release(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Một AdaptiveLimit cho mỗi nhóm upstream (routing, search, traffic, weather)."""
+
+    def __init__(self, config: AdaptiveLimitConfig | None = None):
+        self._config = config if config is not None else AdaptiveLimitConfig()
+        self._limits: Dict[str, AdaptiveLimit] = {}
+
+    def for_url(self, url: str) -> AdaptiveLimit:
+        family = RateLimiter.family_of(url)
+        limit = self._limits.get(family)
+        if limit is None:
+            limit = self._limits[family] = AdaptiveLimit(self._config)
+        return limit
+
+    def stats(self) -> Dict[str, Any]:
+        """Metrics (gồm limit hiện tại) theo từng nhóm upstream."""
+        return {family: limit.stats() for family, limit in self._limits.items()}
@@ -0,0 +1,160 @@
+"""Circuit breaker theo upstream host - fail fast khi upstream đang lỗi hoặc quá chậm."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Tuple
+from urllib.parse import urlsplit
+
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Upstream đang bị ngắt mạch - request bị từ chối ngay, không gửi đi."""
+
+    def __init__(self, name: str, retry_in_sec: float):
+        super().__init__(f"Circuit open for {name}; retry in {retry_in_sec:.1f}s")
+        self.name = name
+        self.retry_in_sec = retry_in_sec
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Ngưỡng mở mạch và thời gian phục hồi.
+
+    Mạch mở khi trong cửa sổ window_size lời gọi gần nhất (tối thiểu min_calls)
+    tỷ lệ lỗi >= failure_rate_threshold hoặc tỷ lệ gọi chậm (>= slow_call_sec)
+    >= slow_call_rate_threshold. Sau open_sec cho tối đa half_open_max_calls probe.
+    """
+    window_size: int = 20
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_sec: float = 5.0
+    slow_call_rate_threshold: float = 0.8
+    open_sec: float = 30.0
+    half_open_max_calls: int = 2
+
+
+class CircuitBreaker:
+    """Circuit breaker cho một upstream: CLOSED -> OPEN -> HALF_OPEN -> CLOSED/OPEN.
+
+    Caller gọi before_call() trước khi gửi (raise CircuitOpenError nếu đang mở),
+    sau đó record() kết quả, hoặc release() nếu lời gọi bị hủy trước khi có kết quả.
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self._config = config
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=config.window_size)  # (failed, slow)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._opened_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_call(self) -> None:
+        """Cho phép lời gọi đi qua hoặc raise CircuitOpenError."""
+        if self._state is CircuitState.OPEN:
+            remaining = self._opened_at + self._config.open_sec - self._clock()
+            if remaining > 0:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self._config.half_open_max_calls:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, 0.0)
+            self._probes_in_flight += 1
+
+    def record(self, success: bool, duration_sec: float) -> None:
+        """Ghi nhận kết quả của một lời gọi đã được before_call() cho phép."""
+        slow = duration_sec >= self._config.slow_call_sec
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if not success or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self._config.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state is CircuitState.CLOSED:
+            self._window.append((not success, slow))
+            if self._should_trip():
+                self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Trả lại slot probe khi lời gọi bị hủy/không gửi được (không tính là lỗi)."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Trạng thái và metrics của breaker."""
+        calls = len(self._window)
+        return {
+            "state": self._state.value,
+            "window_calls": calls,
+            "failure_rate": round(sum(failed for failed, _ in self._window) / calls, 4) if calls else 0.0,
+            "slow_rate": round(sum(slow for _, slow in self._window) / calls, 4) if calls else 0.0,
+            "rejected": self._rejected,
+            "opened": self._opened_count,
+        }
+
+    def _should_trip(self) -> bool:
+        calls = len(self._window)
+        if calls < self._config.min_calls:
+            return False
+        failure_rate = sum(failed for failed, _ in self._window) / calls
+        slow_rate = sum(slow for _, slow in self._window) / calls
+        return (
+            failure_rate >= self._config.failure_rate_threshold
+            or slow_rate >= self._config.slow_call_rate_threshold
+        )
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is self._state:
+            return
+        logger.warning(f"Circuit {self.name}: {self._state.value} -> {state.value}")
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self._opened_count += 1
+        elif state is CircuitState.CLOSED:
+            self._window.clear()
+
+
+class CircuitBreakerRegistry:
+    """Một CircuitBreaker cho mỗi upstream host, tạo lazy theo URL."""
+
+    def __init__(self, config: CircuitBreakerConfig | None = None):
+        self._config = config or CircuitBreakerConfig()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(host, self._config)
+        return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        return {host: breaker.stats() for host, breaker in self._breakers.items()}
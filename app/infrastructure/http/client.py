@@ -1,24 +1,324 @@
+import asyncio
+import dataclasses
+import time
+from urllib.parse import urlsplit
 
 import aiohttp
 
+from app.application.services.deadline import DeadlineExceededError, current_deadline
+from app.application.services.single_flight import SingleFlight
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.logging.logger import get_logger
+
+from .circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from .connection_pool_config import ConnectionPoolConfig
+from .adaptive_limiter import AdaptiveConcurrencyLimiter
+from .hedging import Hedger
 from .http_method import HttpMethod
+from .rate_limiter import RateLimiter
 from .request_entity import RequestEntity
+from .retry_policy import RetryPolicy
+
+logger = get_logger(__name__)
 
 
 class AsyncApiClient:
-    def __init__(self, default_headers: dict | None = None):
+    """HTTP client dùng chung cho tất cả adapters.
+
+    Giữ một aiohttp.ClientSession duy nhất (tạo lazy, gắn với event loop đang chạy)
+    để tái sử dụng kết nối TCP/TLS giữa các request thay vì bắt tay lại mỗi lần.
+    Các GET giống hệt nhau đang chạy đồng thời được gộp thành một request (single-flight).
+    Mỗi upstream host có circuit breaker; khi mạch mở, GET trả về response cũ
+    (stale cache) nếu có, ngược lại raise CircuitOpenError ngay thay vì chờ timeout.
+    Deadline của request bị chặn bởi latency budget hiện tại (deadline_scope) nếu có.
+    Hedging (opt-in): GET chậm hơn percentile latency của endpoint được gửi thêm một bản sao.
+    Số request đang chạy tới mỗi nhóm upstream bị giới hạn bởi adaptive concurrency limit (AIMD).
+    """
+
+    # Query params không đưa vào single-flight key (credential, không ảnh hưởng kết quả)
+    _COALESCE_EXCLUDED_PARAMS = frozenset({"key"})
+
+    def __init__(
+        self,
+        default_headers: dict | None = None,
+        pool_config: ConnectionPoolConfig | None = None,
+        coalesce_gets: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        stale_cache: LruTtlCache[dict] | None = None,
+        hedger: Hedger | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    ):
         self._default_headers = default_headers or {"Accept": "application/json"}
+        self._pool_config = pool_config or ConnectionPoolConfig()
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._single_flight: SingleFlight[dict] | None = SingleFlight() if coalesce_gets else None
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retries = 0
+        self._rate_limiter = rate_limiter
+        self._circuit_breakers = circuit_breakers
+        self._stale_cache = stale_cache
+        self._stale_served = 0
+        self._hedger = hedger
+        self._concurrency_limiter = concurrency_limiter
 
     async def send(self, req: RequestEntity) -> dict:
+        req = self._with_request_deadline(req)
+        if req.method is HttpMethod.GET and self._single_flight is not None:
+            return await self._single_flight.do(self._coalesce_key(req), lambda: self._send(req))
+        return await self._send(req)
+
+    def stats(self) -> dict:
+        """Thống kê single-flight, retry, rate limit và circuit breaker của client."""
+        return {
+            "single_flight": self._single_flight.stats() if self._single_flight else None,
+            "retries": self._retries,
+            "rate_limit": self._rate_limiter.stats() if self._rate_limiter else None,
+            "circuit_breakers": self._circuit_breakers.stats() if self._circuit_breakers else None,
+            "stale_served": self._stale_served,
+            "hedging": self._hedger.stats() if self._hedger else None,
+            "concurrency": self._concurrency_limiter.stats() if self._concurrency_limiter else None,
+        }
+
+    async def _send(self, req: RequestEntity) -> dict:
+        """Gửi request; khi mạch mở thì GET dùng response cũ trong stale cache nếu có."""
+        use_stale = req.method is HttpMethod.GET and self._stale_cache is not None
+        try:
+            payload = await self._send_with_retry(req)
+        except CircuitOpenError:
+            stale = self._stale_cache.get(self._coalesce_key(req)) if use_stale else None
+            if stale is None:
+                raise
+            self._stale_served += 1
+            logger.warning(f"Circuit open, serving stale response for {req.url}")
+            return stale
+        if use_stale:
+            self._stale_cache.set(self._coalesce_key(req), payload)
+        return payload
+
+    async def _send_with_retry(self, req: RequestEntity) -> dict:
+        """Gửi request; GET lỗi tạm thời được retry theo RetryPolicy trong phạm vi deadline."""
+        policy = self._retry_policy
+        attempt = 0
+        delay: float | None = None
+        while True:
+            try:
+                return await self._send_hedged(req)
+            except Exception as e:
+                if req.method is not HttpMethod.GET or attempt >= policy.max_retries or not policy.is_retryable(e):
+                    raise
+                delay = policy.next_delay(delay)
+                retry_after = policy.retry_after_sec(e)
+                if retry_after is not None:
+                    if retry_after > policy.max_retry_after_sec:
+                        raise
+                    delay = max(delay, retry_after)
+                if req.deadline is not None and time.monotonic() + delay >= req.deadline:
+                    raise
+                attempt += 1
+                self._retries += 1
+                logger.warning(f"Retrying GET {req.url} in {delay:.2f}s (attempt {attempt}/{policy.max_retries}): {e!r}")
+                await asyncio.sleep(delay)
+
+    async def _send_hedged(self, req: RequestEntity) -> dict:
+        """Một lần thử; GET chưa xong sau hedge delay của endpoint thì gửi thêm một bản sao.
+
+        Lấy kết quả thành công về trước và hủy request còn lại. Chỉ khi cả hai lỗi mới raise
+        (lỗi của request đầu). Hedge delay và budget do Hedger quyết định theo endpoint.
+        """
+        if self._hedger is None or req.method is not HttpMethod.GET:
+            return await self._send_once(req)
+
+        endpoint = self._hedger.endpoint(req.url)
+        endpoint.requests += 1
+        delay = endpoint.hedge_delay()
+        primary = asyncio.create_task(self._send_once(req))
+        started = {primary: time.monotonic()}
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if not done and (req.deadline is None or time.monotonic() < req.deadline):
+                    endpoint.hedges += 1
+                    hedge = asyncio.create_task(self._send_once(req))
+                    started[hedge] = time.monotonic()
+                    pending = {primary, hedge}
+                    logger.debug(f"Hedging GET {req.url} after {delay * 1000:.0f}ms")
+                else:
+                    pending |= done
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        endpoint.record(time.monotonic() - started[task])
+                        if task is not primary:
+                            endpoint.hedge_wins += 1
+                        return task.result()
+            return primary.result()  # cả hai đều lỗi: raise lỗi của request đầu
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*started, return_exceptions=True)
+
+    async def _send_once(self, req: RequestEntity) -> dict:
+        """Một lần gửi: kiểm tra circuit breaker, chờ rate limiter và concurrency slot rồi gửi HTTP."""
+        breaker = self._circuit_breakers.for_url(req.url) if self._circuit_breakers else None
+        if breaker is not None:
+            breaker.before_call()
+        slot = self._concurrency_limiter.for_url(req.url) if self._concurrency_limiter else None
+
+        started: float | None = None
+        try:
+            if self._rate_limiter is not None:
+                waited = await self._rate_limiter.acquire(req.url, req.deadline)
+                if waited > 0.1:
+                    logger.debug(f"Rate limiter delayed {req.url} by {waited * 1000:.0f}ms")
+            started = await slot.acquire(req.deadline) if slot is not None else time.monotonic()
+            payload = await self._request(req)
+        except Exception as e:
+            # Hết budget của caller không nói gì về sức khỏe upstream: trả slot / breaker không ghi nhận
+            budget_exhausted = isinstance(e, DeadlineExceededError)
+            if started is not None and slot is not None:
+                if self._is_overload(e) and not budget_exhausted:
+                    slot.on_drop(started)
+                else:
+                    slot.on_ignore()
+            if breaker is not None:
+                if started is None or budget_exhausted:
+                    breaker.release()
+                else:
+                    breaker.record(not self._is_upstream_failure(e), time.monotonic() - started)
+            raise
+        except BaseException:
+            if started is not None and slot is not None:
+                slot.on_ignore()
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        if slot is not None:
+            slot.on_success(started, Hedger.endpoint_of(req.url), req.latency_signal)
+        if breaker is not None:
+            breaker.record(True, time.monotonic() - started)
+        return payload
+
+    async def _request(self, req: RequestEntity) -> dict:
+        """Gửi HTTP; timeout do budget của caller chặn lại được raise thành DeadlineExceededError."""
         headers = {**self._default_headers, **(req.headers or {})}
-        timeout = aiohttp.ClientTimeout(total=req.timeout_sec)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        attempt_timeout = self._attempt_timeout(req)
+        timeout = aiohttp.ClientTimeout(total=attempt_timeout)
+        session = self._get_session()
+        try:
             if req.method is HttpMethod.GET:
-                async with session.get(req.url, headers=headers, params=req.params) as resp:
+                async with session.get(req.url, headers=headers, params=req.params, timeout=timeout) as resp:
                     resp.raise_for_status()
                     return await resp.json()
             if req.method is HttpMethod.POST:
-                async with session.post(req.url, headers=headers, params=req.params, json=req.json) as resp:
+                async with session.post(
+                    req.url, headers=headers, params=req.params, json=req.json, timeout=timeout
+                ) as resp:
                     resp.raise_for_status()
                     return await resp.json()
-            raise ValueError(f"Unsupported method: {req.method}")
+        except asyncio.TimeoutError as e:
+            if attempt_timeout < req.timeout_sec:
+                raise DeadlineExceededError(
+                    f"Request deadline exceeded after {attempt_timeout * 1000:.0f}ms waiting for {req.url}"
+                ) from e
+            raise
+        raise ValueError(f"Unsupported method: {req.method}")
+
+    async def warmup(self, urls: list[str]) -> None:
+        """Pre-connect tới các upstream host để request đầu tiên không phải bắt tay TCP/TLS.
+
+        Lỗi khi warmup chỉ được log, không làm hỏng quá trình khởi động server.
+        """
+        session = self._get_session()
+        timeout = aiohttp.ClientTimeout(total=self._pool_config.warmup_timeout_sec)
+        origins = {self._origin(url) for url in urls if url}
+
+        async def _preconnect(origin: str) -> None:
+            try:
+                async with session.head(origin, timeout=timeout, allow_redirects=False) as resp:
+                    await resp.release()
+                logger.info(f"Pre-connected to {origin}")
+            except Exception as e:
+                logger.warning(f"Pre-connect to {origin} failed: {e}")
+
+        await asyncio.gather(*(_preconnect(origin) for origin in origins))
+
+    async def aclose(self) -> None:
+        """Đóng session và toàn bộ kết nối trong pool (gọi khi shutdown server)."""
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+            logger.info("HTTP client session closed")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lấy session hiện tại, tạo mới nếu chưa có, đã đóng hoặc thuộc event loop khác."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = self._create_session()
+            self._session_loop = loop
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        config = self._pool_config
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout_sec,
+            ttl_dns_cache=config.dns_cache_ttl_sec,
+            use_dns_cache=True,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    @staticmethod
+    def _is_overload(error: BaseException) -> bool:
+        """Tín hiệu quá tải để adaptive limiter giảm concurrency: timeout, 429, 503."""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in (429, 503)
+        return isinstance(error, asyncio.TimeoutError)
+
+    @staticmethod
+    def _is_upstream_failure(error: BaseException) -> bool:
+        """Lỗi tính vào circuit breaker: 5xx, lỗi kết nối, timeout (4xx là lỗi phía client)."""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    @staticmethod
+    def _with_request_deadline(req: RequestEntity) -> RequestEntity:
+        """Chặn deadline của request bởi latency budget của request hiện tại (contextvar)."""
+        deadline = current_deadline()
+        if deadline is None or (req.deadline is not None and req.deadline <= deadline.at):
+            return req
+        return dataclasses.replace(req, deadline=deadline.at)
+
+    @staticmethod
+    def _attempt_timeout(req: RequestEntity) -> float:
+        """Timeout cho một lần gửi: timeout_sec, bị chặn bởi thời gian còn lại tới deadline."""
+        if req.deadline is None:
+            return req.timeout_sec
+        remaining = req.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Request deadline exceeded before sending {req.url}")
+        return min(req.timeout_sec, remaining)
+
+    @classmethod
+    def _coalesce_key(cls, req: RequestEntity) -> tuple:
+        """Key single-flight: method, URL và params (bỏ API key), không phụ thuộc thứ tự params."""
+        params = tuple(sorted(
+            (str(name), str(value))
+            for name, value in (req.params or {}).items()
+            if name not in cls._COALESCE_EXCLUDED_PARAMS
+        ))
+        return req.method.value, req.url, params
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Cấu hình connection pool cho AsyncApiClient.
+
+    limit: tổng số kết nối tối đa trong pool
+    limit_per_host: số kết nối tối đa tới cùng một host (TomTom, WeatherAPI)
+    keepalive_timeout_sec: thời gian giữ kết nối idle để tái sử dụng
+    dns_cache_ttl_sec: thời gian cache kết quả DNS
+    warmup_timeout_sec: timeout cho mỗi request pre-connect lúc khởi động
+    """
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout_sec: float = 30.0
+    dns_cache_ttl_sec: int = 300
+    warmup_timeout_sec: float = 3.0
@@ -0,0 +1,90 @@
+"""Hedged requests - gửi bản sao GET khi request đầu chậm hơn percentile latency của endpoint."""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class HedgingConfig:
+    """Cấu hình hedging.
+
+    Hedge delay = percentile latency của endpoint (cửa sổ window_size mẫu gần nhất,
+    cần tối thiểu min_samples), chặn trong [min_delay_sec, max_delay_sec].
+    Số request hedge của mỗi endpoint không vượt quá budget_ratio * số request.
+    """
+    percentile: float = 0.95
+    window_size: int = 200
+    min_samples: int = 20
+    min_delay_sec: float = 0.05
+    max_delay_sec: float = 2.0
+    budget_ratio: float = 0.05
+
+
+class EndpointLatency:
+    """Latency gần đây và hedge budget của một endpoint."""
+
+    def __init__(self, config: HedgingConfig):
+        self._config = config
+        self._samples: Deque[float] = deque(maxlen=config.window_size)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, latency_sec: float) -> None:
+        self._samples.append(latency_sec)
+
+    def percentile(self) -> Optional[float]:
+        """Latency ở percentile cấu hình, None nếu chưa đủ mẫu."""
+        if len(self._samples) < self._config.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self._config.percentile * len(ordered)))
+        return ordered[index]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Delay trước khi hedge, None nếu chưa đủ mẫu hoặc đã hết budget."""
+        latency = self.percentile()
+        if latency is None or self.hedges + 1 > self._config.budget_ratio * self.requests:
+            return None
+        return min(self._config.max_delay_sec, max(self._config.min_delay_sec, latency))
+
+    def stats(self) -> Dict[str, Any]:
+        latency = self.percentile()
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "samples": len(self._samples),
+            "percentile_ms": round(latency * 1000, 3) if latency is not None else None,
+        }
+
+
+class Hedger:
+    """Theo dõi latency theo endpoint và quyết định hedge delay cho AsyncApiClient.
+
+    Endpoint = host + 3 segment đầu của path (vd. api.tomtom.com/search/2/reverseGeocode),
+    để các URL chứa query/tọa độ trong path vẫn chung một thống kê.
+    """
+
+    def __init__(self, config: HedgingConfig | None = None):
+        self._config = config if config is not None else HedgingConfig()
+        self._endpoints: Dict[str, EndpointLatency] = {}
+
+    def endpoint(self, url: str) -> EndpointLatency:
+        key = self.endpoint_of(url)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = EndpointLatency(self._config)
+        return endpoint
+
+    def stats(self) -> Dict[str, Any]:
+        """Metrics hedging theo endpoint."""
+        return {key: endpoint.stats() for key, endpoint in self._endpoints.items()}
+
+    @staticmethod
+    def endpoint_of(url: str) -> str:
+        parts = urlsplit(url)
+        segments = [segment for segment in parts.path.split("/") if segment][:3]
+        return "/".join([parts.netloc, *segments])
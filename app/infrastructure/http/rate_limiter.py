@@ -0,0 +1,119 @@
+"""Client-side rate limiter - token bucket theo từng nhóm upstream (routing, search, weather...)."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from app.infrastructure.constants.tomtom_constants import TomTomDefaults
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Cấu hình token bucket: tốc độ nạp (request/giây) và dung lượng burst."""
+    rate_per_sec: float = TomTomDefaults.REQUESTS_PER_SECOND
+    burst: int = TomTomDefaults.BURST_LIMIT
+
+
+class TokenBucket:
+    """Async token bucket - request vượt tốc độ được xếp hàng (FIFO) thay vì bị từ chối.
+
+    Đầu vào: RateLimitConfig, clock (để test)
+    Chức năng: acquire() chờ tới khi có token và trả về thời gian đã chờ;
+    ghi lại tổng/max thời gian chờ và số request đang xếp hàng.
+    """
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.monotonic):
+        if config.rate_per_sec <= 0 or config.burst < 1:
+            raise ValueError("rate_per_sec must be > 0 and burst >= 1")
+        self._rate = config.rate_per_sec
+        self._capacity = float(config.burst)
+        self._tokens = float(config.burst)
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+        self._acquired = 0
+        self._waiting = 0
+        self._total_wait_sec = 0.0
+        self._max_wait_sec = 0.0
+
+    async def acquire(self, deadline: Optional[float] = None) -> float:
+        """Lấy một token, chờ nếu bucket rỗng.
+
+        Đầu vào: deadline (time.monotonic) - raise TimeoutError nếu phải chờ quá deadline
+        Đầu ra: số giây đã chờ trong hàng đợi
+        """
+        started = self._clock()
+        self._waiting += 1
+        try:
+            # asyncio.Lock phục vụ FIFO nên thứ tự request được giữ nguyên
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    wait_sec = (1 - self._tokens) / self._rate
+                    if deadline is not None and time.monotonic() + wait_sec >= deadline:
+                        raise asyncio.TimeoutError("Rate limit wait would exceed request deadline")
+                    await asyncio.sleep(wait_sec)
+        finally:
+            self._waiting -= 1
+
+        waited = self._clock() - started
+        self._acquired += 1
+        self._total_wait_sec += waited
+        self._max_wait_sec = max(self._max_wait_sec, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """Metrics của bucket: số request, số đang chờ, thời gian chờ trung bình/lớn nhất."""
+        return {
+            "rate_per_sec": self._rate,
+            "burst": int(self._capacity),
+            "acquired": self._acquired,
+            "waiting": self._waiting,
+            "avg_wait_ms": round(self._total_wait_sec / self._acquired * 1000, 3) if self._acquired else 0.0,
+            "max_wait_ms": round(self._max_wait_sec * 1000, 3),
+        }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Giữ một TokenBucket cho mỗi nhóm upstream và phân loại request theo URL.
+
+    Nhóm: "weather" cho host WeatherAPI.com, còn lại theo segment đầu của path
+    ("routing", "search", "traffic"). Nhóm không có cấu hình thì không bị giới hạn.
+    """
+
+    WEATHER_HOST_SUFFIX = "weatherapi.com"
+
+    def __init__(self, configs: Mapping[str, RateLimitConfig]):
+        self._buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(config) for family, config in configs.items()
+        }
+
+    async def acquire(self, url: str, deadline: Optional[float] = None) -> float:
+        """Chờ token của nhóm tương ứng với URL, trả về thời gian đã chờ (giây)."""
+        bucket = self._buckets.get(self.family_of(url))
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire(deadline)
+
+    def stats(self) -> Dict[str, Any]:
+        """Metrics theo từng nhóm upstream."""
+        return {family: bucket.stats() for family, bucket in self._buckets.items()}
+
+    @classmethod
+    def family_of(cls, url: str) -> str:
+        """Phân loại URL vào nhóm upstream."""
+        parts = urlsplit(url)
+        if (parts.hostname or "").endswith(cls.WEATHER_HOST_SUFFIX):
+            return "weather"
+        segments = [segment for segment in parts.path.split("/") if segment]
+        return segments[0] if segments else ""
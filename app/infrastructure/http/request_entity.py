@@ -1,5 +1,6 @@
 
 from dataclasses import dataclass
+from typing import Optional
 
 from .http_method import HttpMethod
 
@@ -12,3 +13,7 @@ class RequestEntity:
     params: dict[str, str]
     json: dict | None
     timeout_sec: int
+    # Thời điểm hết hạn tuyệt đối theo time.monotonic(); None = chỉ dùng timeout_sec
+    deadline: Optional[float] = None
+    # False khi latency phụ thuộc kích thước request (batch, route dài): không dùng để giảm concurrency limit
+    latency_signal: bool = True
@@ -0,0 +1,71 @@
+"""Retry policy cho AsyncApiClient - backoff có decorrelated jitter và hỗ trợ Retry-After."""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import aiohttp
+
+from app.infrastructure.constants.tomtom_constants import TomTomDefaults
+
+
+class RetryPolicy:
+    """Quyết định có retry hay không và chờ bao lâu trước lần thử tiếp theo.
+
+    Đầu vào: max_retries, base_delay_sec, max_delay_sec, backoff_factor, max_retry_after_sec
+    Chức năng: Chỉ retry lỗi tạm thời (429/5xx gateway, lỗi kết nối, timeout).
+    Delay theo decorrelated jitter: uniform(base, previous * backoff_factor), chặn bởi max_delay_sec;
+    Retry-After từ server là mức chờ tối thiểu, vượt max_retry_after_sec thì không retry.
+    Chỉ áp dụng cho request idempotent (GET) - việc lọc method do client đảm nhận.
+    """
+
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_retries: int = TomTomDefaults.MAX_RETRIES,
+        base_delay_sec: float = 0.25,
+        max_delay_sec: float = 5.0,
+        backoff_factor: float = 3.0,
+        max_retry_after_sec: float = 10.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.base_delay_sec = max(0.0, base_delay_sec)
+        self.max_delay_sec = max(self.base_delay_sec, max_delay_sec)
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.max_retry_after_sec = max_retry_after_sec
+        self._rng = rng or random.Random()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Lỗi tạm thời có thể retry: status 429/500/502/503/504, lỗi kết nối, timeout."""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self.RETRYABLE_STATUS_CODES
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    def next_delay(self, previous_delay: Optional[float]) -> float:
+        """Delay tiếp theo theo decorrelated jitter."""
+        if previous_delay is None:
+            previous_delay = self.base_delay_sec
+        upper = max(self.base_delay_sec, previous_delay * self.backoff_factor)
+        return min(self.max_delay_sec, self._rng.uniform(self.base_delay_sec, upper))
+
+    def retry_after_sec(self, error: BaseException) -> Optional[float]:
+        """Đọc Retry-After (số giây hoặc HTTP-date) từ response lỗi, None nếu không có."""
+        headers = getattr(error, "headers", None)
+        value = headers.get("Retry-After") if headers else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
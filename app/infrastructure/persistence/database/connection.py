@@ -1,10 +1,13 @@
 """Database connection management with Singleton pattern."""
 
+import asyncio
 import aiosqlite
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncContextManager, Optional
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
 
 logger = get_logger(
     name=__name__,
@@ -14,73 +17,269 @@ logger = get_logger(
 
 
 class DatabaseConnection:
-    """SQLite database connection manager with Singleton pattern."""
+    """SQLite database connection manager with Singleton pattern.
+    
+    Giữ một kết nối ghi lâu dài (mở lần đầu khi cần hoặc lúc startup, đóng khi shutdown)
+    cùng một pool kết nối chỉ-đọc (WAL cho phép đọc song song với ghi).
+    - `read()`: mượn một kết nối đọc (round-robin); với ":memory:" dùng kết nối ghi.
+    - `write(fn)`: đưa thao tác ghi vào hàng đợi của writer duy nhất; các job đang chờ
+      được gom vào một transaction (mỗi job một SAVEPOINT, lỗi của job này không ảnh hưởng job khác).
+    - `transaction()`: transaction ghi trực tiếp (migrations), serialize với writer bằng write lock.
+    - `async with db as conn`: mượn kết nối ghi, không đóng nó.
+    """
     
     _instance: Optional["DatabaseConnection"] = None
     _connection: Optional[aiosqlite.Connection] = None
     _database_path: Optional[str] = None
+    _connected_path: Optional[str] = None
+    _config: SQLiteConfig = SQLiteConfig()
+    _write_lock: Optional[asyncio.Lock] = None
+    _write_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    _open_lock: Optional[asyncio.Lock] = None
+    _open_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    _readers: List[aiosqlite.Connection] = []
+    _next_reader: int = 0
+    _write_queue: Optional[asyncio.Queue] = None
+    _writer_task: Optional[asyncio.Task] = None
+    _writer_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    # Số job ghi tối đa gom vào một transaction
+    WRITE_BATCH_MAX = 64
     
-    def __new__(cls, database_path: str = "destinations.db"):
-        """Singleton pattern - chỉ cho phép 1 instance duy nhất."""
+    def __new__(cls, database_path: Optional[str] = None, config: Optional[SQLiteConfig] = None):
+        """Singleton pattern - chỉ cho phép 1 instance duy nhất.
+        
+        Không truyền database_path thì giữ path hiện tại (mặc định "destinations.db" khi chưa có instance).
+        """
+        if database_path is None:
+            database_path = cls._instance._database_path if cls._instance is not None else "destinations.db"
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._database_path = database_path
             logger.info(f"Created singleton DatabaseConnection for: {database_path}")
         elif cls._instance._database_path != database_path:
-            # Update database path if different
+            # Update database path if different (kết nối cũ được mở lại ở lần connect() tiếp theo)
             logger.warning(f"DatabaseConnection path changed from {cls._instance._database_path} to {database_path}")
             cls._instance._database_path = database_path
+        if config is not None:
+            cls._instance._config = config
         return cls._instance
     
     async def connect(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        if self._connection is None:
-            # Ensure database directory exists
-            db_dir = Path(self._database_path).parent
-            db_dir.mkdir(parents=True, exist_ok=True)
-            
-            self._connection = await aiosqlite.connect(self._database_path)
-            logger.info(f"Connected to SQLite database: {self._database_path}")
+        """Get database connection (mở và áp dụng pragmas ở lần đầu)."""
+        if self._connection is not None and self._connected_path == self._database_path:
+            return self._connection
+        # Các coroutine gọi đồng thời lúc chưa có kết nối chỉ mở một lần (kiểm tra lại sau khi có lock)
+        async with self._get_open_lock():
+            if self._connection is not None and self._connected_path != self._database_path:
+                await self._close_connections()
+            if self._connection is None:
+                # Ensure database directory exists
+                db_dir = Path(self._database_path).parent
+                db_dir.mkdir(parents=True, exist_ok=True)
+                
+                connection = await self._open(self._database_path)
+                await self._apply_pragmas(connection)
+                self._connection = connection
+                self._connected_path = self._database_path
+                logger.info(f"Connected to SQLite database: {self._database_path}")
         
         return self._connection
     
+    async def _open(self, database: str, **kwargs) -> aiosqlite.Connection:
+        connection = aiosqlite.connect(
+            database,
+            cached_statements=self._config.cached_statements,
+            **kwargs
+        )
+        # Kết nối sống suốt vòng đời process: worker thread là daemon để process
+        # không bị treo khi thoát mà chưa gọi close() (transaction đã commit vẫn an toàn)
+        getattr(connection, "_thread", connection).daemon = True
+        return await connection
+    
+    async def _open_readers(self) -> None:
+        """Mở pool kết nối chỉ-đọc (URI mode=ro) sau khi kết nối ghi đã tạo file và bật WAL."""
+        uri = f"{Path(self._database_path).resolve().as_uri()}?mode=ro"
+        readers = []
+        for _ in range(self._config.read_pool_size):
+            reader = await self._open(uri, uri=True)
+            await self._apply_pragmas(reader, read_only=True)
+            readers.append(reader)
+        self._readers = readers
+        logger.info(f"Opened {len(readers)} read-only SQLite connections")
+    
+    async def _apply_pragmas(self, connection: aiosqlite.Connection, read_only: bool = False) -> None:
+        """Áp dụng pragmas hiệu năng cho kết nối vừa mở."""
+        config = self._config
+        if read_only:
+            await connection.execute("PRAGMA query_only=ON")
+        elif self._database_path != ":memory:":
+            await connection.execute(f"PRAGMA journal_mode={config.journal_mode}")
+        await connection.execute(f"PRAGMA synchronous={config.synchronous}")
+        await connection.execute(f"PRAGMA cache_size=-{int(config.cache_size_kib)}")
+        await connection.execute(f"PRAGMA mmap_size={int(config.mmap_size_bytes)}")
+        await connection.execute(f"PRAGMA busy_timeout={int(config.busy_timeout_ms)}")
+        await connection.execute("PRAGMA temp_store=MEMORY")
+    
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Mượn một kết nối đọc từ pool (round-robin); ":memory:" hoặc pool rỗng dùng kết nối ghi."""
+        writer = await self.connect()
+        if self._database_path == ":memory:" or self._config.read_pool_size <= 0:
+            yield writer
+            return
+        if not self._readers:
+            async with self._get_open_lock():
+                if not self._readers:
+                    await self._open_readers()
+        self._next_reader = (self._next_reader + 1) % len(self._readers)
+        yield self._readers[self._next_reader]
+    
+    async def write(self, fn: Callable[[aiosqlite.Connection], Awaitable[Any]]) -> Any:
+        """Thực thi `fn(conn)` trên writer duy nhất qua hàng đợi, trả về kết quả sau khi commit."""
+        future = asyncio.get_running_loop().create_future()
+        self._get_write_queue().put_nowait((fn, future))
+        return await future
+    
+    def _get_write_queue(self) -> asyncio.Queue:
+        """Hàng đợi + writer task gắn với event loop đang chạy (tạo lại nếu loop thay đổi)."""
+        loop = asyncio.get_running_loop()
+        if self._write_queue is None or self._writer_loop is not loop or self._writer_task.done():
+            self._write_queue = asyncio.Queue()
+            self._writer_loop = loop
+            self._writer_task = loop.create_task(self._run_writer(self._write_queue))
+        return self._write_queue
+    
+    async def _run_writer(self, queue: asyncio.Queue) -> None:
+        """Writer loop: gom các job đang chờ thành một batch và chạy trong một transaction."""
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            batch = [job]
+            stop = False
+            while len(batch) < self.WRITE_BATCH_MAX and not queue.empty():
+                job = queue.get_nowait()
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+            await self._run_write_batch(batch)
+            if stop:
+                return
+    
+    async def _run_write_batch(self, batch: List[Tuple[Callable, asyncio.Future]]) -> None:
+        outcomes: List[Tuple[asyncio.Future, Any, Optional[BaseException]]] = []
+        try:
+            async with self.transaction() as conn:
+                for fn, future in batch:
+                    if future.done():
+                        continue  # caller đã hủy
+                    await conn.execute("SAVEPOINT write_job")
+                    try:
+                        result = await fn(conn)
+                    except Exception as e:
+                        await conn.execute("ROLLBACK TO write_job")
+                        await conn.execute("RELEASE write_job")
+                        outcomes.append((future, None, e))
+                    else:
+                        await conn.execute("RELEASE write_job")
+                        outcomes.append((future, result, None))
+        except Exception as e:
+            logger.error(f"Write batch failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        # Chỉ trả kết quả sau khi commit thành công
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Mượn kết nối cho một transaction ghi: serialize theo write lock, commit hoặc rollback."""
+        async with self._get_write_lock():
+            conn = await self.connect()
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+    
+    def _get_open_lock(self) -> asyncio.Lock:
+        """Lock cho lần mở kết nối ghi / pool đọc, gắn với event loop đang chạy."""
+        loop = asyncio.get_running_loop()
+        if self._open_lock is None or self._open_lock_loop is not loop:
+            self._open_lock = asyncio.Lock()
+            self._open_lock_loop = loop
+        return self._open_lock
+    
+    def _get_write_lock(self) -> asyncio.Lock:
+        """Write lock gắn với event loop đang chạy (tạo lại nếu loop thay đổi)."""
+        loop = asyncio.get_running_loop()
+        if self._write_lock is None or self._write_lock_loop is not loop:
+            self._write_lock = asyncio.Lock()
+            self._write_lock_loop = loop
+        return self._write_lock
+    
     async def close(self):
-        """Close database connection."""
+        """Close database connection (chờ writer xử lý hết job đang chờ, đóng pool đọc)."""
+        if self._writer_task is not None and not self._writer_task.done():
+            if self._writer_loop is asyncio.get_running_loop():
+                self._write_queue.put_nowait(None)
+                await self._writer_task
+            elif not self._writer_loop.is_closed():
+                self._writer_loop.call_soon_threadsafe(self._writer_task.cancel)
+        self._writer_task = None
+        self._write_queue = None
+        self._writer_loop = None
+        await self._close_connections()
+    
+    async def _close_connections(self):
+        readers, self._readers = self._readers, []
+        for reader in readers:
+            await reader.close()
         if self._connection:
             await self._connection.close()
             self._connection = None
+            self._connected_path = None
             logger.info("Database connection closed")
     
     async def __aenter__(self) -> aiosqlite.Connection:
-        """Async context manager entry."""
+        """Async context manager entry - mượn kết nối dùng chung."""
         return await self.connect()
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.close()
+        """Async context manager exit - kết nối vẫn mở cho các lời gọi sau (đóng bằng close())."""
+        return None
     
     @classmethod
-    def get_instance(cls, database_path: str = "destinations.db") -> "DatabaseConnection":
+    def get_instance(cls, database_path: Optional[str] = None, config: Optional[SQLiteConfig] = None) -> "DatabaseConnection":
         """Get singleton instance."""
-        return cls(database_path)
+        return cls(database_path, config)
     
     @classmethod
     def reset_instance(cls):
-        """Reset singleton instance (for testing)."""
-        if cls._instance and cls._instance._connection:
-            # Close connection synchronously if possible
+        """Reset singleton instance (for testing).
+        
+        Đóng kết nối ghi, pool đọc và dừng writer queue của instance cũ.
+        """
+        instance = cls._instance
+        if instance is not None and (instance._connection or instance._readers or instance._writer_task):
             try:
-                import asyncio
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is running, create a task
-                    loop.create_task(cls._instance.close())
-                else:
-                    # If no loop is running, we can't close async connection
-                    pass
+                loop = asyncio.get_running_loop()
             except RuntimeError:
-                # No event loop, can't close async connection
-                pass
+                # Không có loop đang chạy: đóng đồng bộ trên loop tạm
+                asyncio.run(instance.close())
+            else:
+                loop.create_task(instance.close())
         
         cls._instance = None
         cls._connection = None
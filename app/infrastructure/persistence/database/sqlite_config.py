@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SQLiteConfig:
+    """Cấu hình kết nối SQLite dùng chung (áp dụng một lần khi mở kết nối).
+
+    journal_mode: WAL cho phép đọc song song với ghi, commit không cần fsync toàn file
+    synchronous: NORMAL là đủ an toàn khi dùng WAL (chỉ mất transaction cuối nếu mất điện)
+    cache_size_kib: page cache của SQLite (KiB)
+    mmap_size_bytes: vùng memory-mapped I/O cho đọc (0 = tắt)
+    busy_timeout_ms: thời gian chờ khi database đang bị khóa thay vì lỗi ngay
+    cached_statements: số prepared statement được cache theo kết nối
+    read_pool_size: số kết nối chỉ-đọc (0 = đọc trên kết nối ghi)
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 16384
+    mmap_size_bytes: int = 128 * 1024 * 1024
+    busy_timeout_ms: int = 5000
+    cached_statements: int = 256
+    read_pool_size: int = 4
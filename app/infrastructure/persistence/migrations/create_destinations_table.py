@@ -5,24 +5,40 @@ from app.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# unicode61 (remove_diacritics 2) bỏ dấu tiếng Việt nhưng không gộp "đ" -> "d" (đ là chữ cái riêng),
+# nên trigger tự gộp trước khi đưa vào index; repository gộp query term theo cùng quy tắc.
+_FOLD_NAME = "REPLACE(REPLACE({}.name, 'đ', 'd'), 'Đ', 'D')"
+_FOLD_ADDRESS = "REPLACE(REPLACE({}.address, 'đ', 'd'), 'Đ', 'D')"
+
+
+# seq là INTEGER PRIMARY KEY (alias của rowid) - khóa ổn định của destinations_fts và destinations_rtree.
+# rowid ngầm của bảng có TEXT PRIMARY KEY không được đảm bảo giữ nguyên (VACUUM có thể đánh số lại),
+# khi đó hai index sẽ trỏ sai dòng.
+_DESTINATIONS_COLUMNS = """
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL UNIQUE,
+    address TEXT NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+"""
+
+
+def fold_vietnamese_d(text: str) -> str:
+    """Gộp "đ"/"Đ" thành "d"/"D" giống trigger của destinations_fts."""
+    return text.replace("đ", "d").replace("Đ", "D")
+
 
 async def create_destinations_table():
     """Create destinations table."""
-    async with DatabaseConnection() as conn:
+    async with DatabaseConnection().transaction() as conn:
         cursor = await conn.cursor()
         
         # Create destinations table
-        await cursor.execute("""
-            CREATE TABLE IF NOT EXISTS destinations (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL UNIQUE,
-                address TEXT NOT NULL,
-                latitude REAL NOT NULL,
-                longitude REAL NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
+        await cursor.execute(f"CREATE TABLE IF NOT EXISTS destinations ({_DESTINATIONS_COLUMNS})")
+        await add_destinations_seq(cursor)
         
         # Create indexes for better performance
         await cursor.execute("""
@@ -30,21 +46,156 @@ async def create_destinations_table():
             ON destinations(name)
         """)
         
+        # Keyset pagination (list_page) sắp xếp theo (created_at DESC, id DESC);
+        # index này thay cho idx_destinations_created_at cũ
+        await cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_destinations_created_at_id 
+            ON destinations(created_at DESC, id DESC)
+        """)
+        await cursor.execute("DROP INDEX IF EXISTS idx_destinations_created_at")
+        
+        # Expression indexes cho các lookup không phân biệt hoa thường (idempotent upsert, find_by_address)
         await cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_destinations_created_at 
-            ON destinations(created_at)
+            CREATE INDEX IF NOT EXISTS idx_destinations_name_lower 
+            ON destinations(LOWER(name))
         """)
         
-        await conn.commit()
+        await cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_destinations_address_lower 
+            ON destinations(LOWER(address))
+        """)
+        
+        await create_destinations_fts(cursor)
+        await create_destinations_rtree(cursor)
+        
         logger.info("Destinations table created successfully")
 
 
+async def add_destinations_seq(cursor):
+    """Rebuild bảng destinations cũ (id TEXT PRIMARY KEY, chưa có seq) với cột seq INTEGER PRIMARY KEY.
+    
+    seq nhận đúng rowid hiện tại của mỗi dòng, nên destinations_fts / destinations_rtree đã có
+    (vốn key theo rowid) vẫn khớp mà không cần backfill. Index và trigger bị drop cùng bảng cũ
+    và được tạo lại bởi create_destinations_table.
+    """
+    await cursor.execute("PRAGMA table_info(destinations)")
+    columns = [row[1] for row in await cursor.fetchall()]
+    if "seq" in columns:
+        return
+    
+    await cursor.execute(f"CREATE TABLE destinations_rekeyed ({_DESTINATIONS_COLUMNS})")
+    await cursor.execute("""
+        INSERT INTO destinations_rekeyed (seq, id, name, address, latitude, longitude, created_at, updated_at)
+        SELECT rowid, id, name, address, latitude, longitude, created_at, updated_at FROM destinations
+    """)
+    await cursor.execute("DROP TABLE destinations")
+    await cursor.execute("ALTER TABLE destinations_rekeyed RENAME TO destinations")
+    logger.info("Rebuilt destinations table with stable seq key")
+
+
+async def create_destinations_fts(cursor):
+    """Create FTS5 index for name/address search, kept in sync with destinations via triggers.
+    
+    Rowid của index là destinations.seq; lần tạo đầu tiên backfill các dòng đã có.
+    """
+    await cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'destinations_fts'"
+    )
+    exists = await cursor.fetchone() is not None
+    
+    await cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS destinations_fts USING fts5(
+            name,
+            address,
+            tokenize = "unicode61 remove_diacritics 2"
+        )
+    """)
+    
+    await cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS destinations_fts_insert AFTER INSERT ON destinations BEGIN
+            INSERT INTO destinations_fts(rowid, name, address)
+            VALUES (new.seq, {_FOLD_NAME.format("new")}, {_FOLD_ADDRESS.format("new")});
+        END
+    """)
+    
+    await cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS destinations_fts_delete AFTER DELETE ON destinations BEGIN
+            DELETE FROM destinations_fts WHERE rowid = old.seq;
+        END
+    """)
+    
+    await cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS destinations_fts_update AFTER UPDATE OF name, address ON destinations BEGIN
+            DELETE FROM destinations_fts WHERE rowid = old.seq;
+            INSERT INTO destinations_fts(rowid, name, address)
+            VALUES (new.seq, {_FOLD_NAME.format("new")}, {_FOLD_ADDRESS.format("new")});
+        END
+    """)
+    
+    if not exists:
+        await cursor.execute(f"""
+            INSERT INTO destinations_fts(rowid, name, address)
+            SELECT seq, {_FOLD_NAME.format("destinations")}, {_FOLD_ADDRESS.format("destinations")}
+            FROM destinations
+        """)
+        logger.info(f"Backfilled destinations_fts with {cursor.rowcount} rows")
+
+
+async def create_destinations_rtree(cursor):
+    """Create R*Tree spatial index over (latitude, longitude), kept in sync via triggers.
+    
+    Mỗi destination là một hộp suy biến (min = max) với id = destinations.seq;
+    lần tạo đầu tiên backfill các dòng đã có.
+    """
+    await cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'destinations_rtree'"
+    )
+    exists = await cursor.fetchone() is not None
+    
+    await cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS destinations_rtree USING rtree(
+            id,
+            min_lat, max_lat,
+            min_lon, max_lon
+        )
+    """)
+    
+    await cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS destinations_rtree_insert AFTER INSERT ON destinations BEGIN
+            INSERT INTO destinations_rtree(id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (new.seq, new.latitude, new.latitude, new.longitude, new.longitude);
+        END
+    """)
+    
+    await cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS destinations_rtree_delete AFTER DELETE ON destinations BEGIN
+            DELETE FROM destinations_rtree WHERE id = old.seq;
+        END
+    """)
+    
+    await cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS destinations_rtree_update AFTER UPDATE OF latitude, longitude ON destinations BEGIN
+            UPDATE destinations_rtree
+            SET min_lat = new.latitude, max_lat = new.latitude, min_lon = new.longitude, max_lon = new.longitude
+            WHERE id = new.seq;
+        END
+    """)
+    
+    if not exists:
+        await cursor.execute("""
+            INSERT INTO destinations_rtree(id, min_lat, max_lat, min_lon, max_lon)
+            SELECT seq, latitude, latitude, longitude, longitude FROM destinations
+        """)
+        logger.info(f"Backfilled destinations_rtree with {cursor.rowcount} rows")
+
+
 async def drop_destinations_table():
     """Drop destinations table (for testing)."""
-    async with DatabaseConnection() as conn:
+    async with DatabaseConnection().transaction() as conn:
         cursor = await conn.cursor()
+        await cursor.execute("DROP TABLE IF EXISTS destinations_fts")
+        await cursor.execute("DROP TABLE IF EXISTS destinations_rtree")
         await cursor.execute("DROP TABLE IF EXISTS destinations")
-        await conn.commit()
         logger.info("Destinations table dropped")
 
 
@@ -1,109 +1,146 @@
 """SQLite implementation of destination repository."""
 
-from typing import List, Optional
+import heapq
+import math
+import re
+from typing import AsyncIterator, List, Optional, Tuple
+from app.application.dto.search_destinations_dto import DestinationSummary
 from app.application.ports.destination_repository import DestinationRepository
 from app.domain.entities.destination import Destination
-from app.domain.value_objects.latlon import LatLon
+from app.domain.value_objects.latlon import EARTH_RADIUS_M, LatLon, haversine_m
 from app.domain.value_objects.destination_name import DestinationName
 from app.domain.value_objects.address import Address
+from app.domain.value_objects.page_cursor import PageCursor
 from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
+from app.infrastructure.persistence.migrations.create_destinations_table import fold_vietnamese_d
 from app.infrastructure.logging.logger import get_logger
 from datetime import datetime, timezone
 import uuid
 
 logger = get_logger(__name__)
 
+# Từ trong query FTS (unicode61 coi "_" và dấu câu là ký tự phân tách)
+_FTS_TOKEN = re.compile(r"[^\W_]+")
+
+# k-nearest: bán kính tìm kiếm ban đầu và hệ số nới rộng mỗi vòng
+_NEARBY_INITIAL_RADIUS_M = 2_000.0
+_NEARBY_RADIUS_GROWTH = 4.0
+# Nửa chu vi Trái Đất - bán kính này bao toàn bộ bề mặt
+_MAX_RADIUS_M = math.pi * EARTH_RADIUS_M
+
 
 class SQLiteDestinationRepository(DestinationRepository):
     """SQLite implementation of destination repository."""
     
-    def __init__(self, database_path: str = "destinations.db"):
-        """Initialize SQLite repository."""
+    # Idempotent upsert: ưu tiên id, sau đó trùng NAME, rồi trùng ADDRESS; cập nhật giữ nguyên created_at
+    _UPSERT_SQL = """
+        INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at)
+        VALUES (
+            COALESCE(
+                ?,
+                (SELECT id FROM destinations WHERE LOWER(name) = LOWER(?) LIMIT 1),
+                (SELECT id FROM destinations WHERE LOWER(address) = LOWER(?) LIMIT 1),
+                ?
+            ),
+            ?, ?, ?, ?, ?, ?
+        )
+        ON CONFLICT(id) DO UPDATE SET
+            name = excluded.name,
+            address = excluded.address,
+            latitude = excluded.latitude,
+            longitude = excluded.longitude,
+            updated_at = excluded.updated_at
+        RETURNING id, name, address, latitude, longitude, created_at, updated_at
+    """
+    
+    _FIND_BY_ADDRESS_SQL = (
+        "SELECT id, name, address, latitude, longitude, created_at, updated_at "
+        "FROM destinations WHERE LOWER(address) = LOWER(?) LIMIT 1"
+    )
+    
+    # Ứng viên từ R*Tree (bounding box): chỉ seq + tọa độ, khoảng cách chính xác được tính sau
+    _NEARBY_CANDIDATES_SQL = (
+        "SELECT r.id, d.latitude, d.longitude "
+        "FROM destinations_rtree r JOIN destinations d ON d.seq = r.id "
+        "WHERE r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?"
+    )
+    
+    # Keyset pagination theo (created_at DESC, id DESC) - dùng index idx_destinations_created_at_id
+    _PAGE_SQL = (
+        "SELECT id, name, address, latitude, longitude, created_at, updated_at "
+        "FROM destinations ORDER BY created_at DESC, id DESC LIMIT ?"
+    )
+    _PAGE_AFTER_SQL = (
+        "SELECT id, name, address, latitude, longitude, created_at, updated_at "
+        "FROM destinations WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"
+    )
+    
+    def __init__(self, database_path: str = "destinations.db", config: Optional[SQLiteConfig] = None):
+        """Initialize SQLite repository (mượn kết nối dùng chung, không tự mở/đóng)."""
         self.database_path = database_path
-        self._db_connection = DatabaseConnection.get_instance(database_path)
+        self._db_connection = DatabaseConnection.get_instance(database_path, config)
         logger.info(f"Initialized SQLiteDestinationRepository with database: {database_path}")
     
     async def save(self, destination: Destination) -> Destination:
-        """Save a destination and return the saved entity with ID."""
+        """Save a destination and return the saved entity with ID (qua writer queue)."""
         try:
-            async with self._db_connection as conn:
-                cursor = await conn.cursor()
-                
-                # Idempotent check: prefer unique by NAME, then by ADDRESS
-                # 1) Try match by name (case-insensitive exact)
-                if destination.id is None:
-                    await cursor.execute(
-                        "SELECT id FROM destinations WHERE LOWER(name) = LOWER(?)",
-                        (str(destination.name),)
-                    )
-                    row = await cursor.fetchone()
-                    if row:
-                        destination.id = row[0]
-
-                # 2) If still no id, try match by address (case-insensitive exact)
-                if destination.id is None:
-                    await cursor.execute(
-                        "SELECT id FROM destinations WHERE LOWER(address) = LOWER(?)",
-                        (str(destination.address),)
-                    )
-                    row = await cursor.fetchone()
-                    if row:
-                        destination.id = row[0]
-
-                # 3) If still no id, generate a new one for insert
-                if destination.id is None:
-                    destination.id = str(uuid.uuid4())
-                
-                # Check if destination exists (for updates)
-                await cursor.execute(
-                    "SELECT id FROM destinations WHERE id = ?",
-                    (destination.id,)
-                )
-                existing = await cursor.fetchone()
-                
-                if existing:
-                    # Update existing destination - convert value objects to strings
-                    await cursor.execute("""
-                        UPDATE destinations 
-                        SET name = ?, address = ?, latitude = ?, longitude = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (
-                        str(destination.name),  # Convert DestinationName to string
-                        str(destination.address),  # Convert Address to string
-                        destination.coordinates.lat,
-                        destination.coordinates.lon,
-                        destination.updated_at.isoformat(),
-                        destination.id
-                    ))
-                    logger.info(f"Updated destination with ID: {destination.id}")
-                else:
-                    # Insert new destination - convert value objects to strings
-                    await cursor.execute("""
-                        INSERT INTO destinations 
-                        (id, name, address, latitude, longitude, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        destination.id,
-                        str(destination.name),  # Convert DestinationName to string
-                        str(destination.address),  # Convert Address to string
-                        destination.coordinates.lat,
-                        destination.coordinates.lon,
-                        destination.created_at.isoformat(),
-                        destination.updated_at.isoformat()
-                    ))
-                    logger.info(f"Inserted new destination with ID: {destination.id}")
-                
-                await conn.commit()
-                return destination
-                
+            return await self._db_connection.write(lambda conn: self._save(conn, destination))
         except Exception as e:
             logger.error(f"Error saving destination: {str(e)}")
             raise
     
+    async def save_many(self, destinations: List[Destination]) -> List[Destination]:
+        """Save several destinations in one writer transaction (mỗi dòng một SAVEPOINT, dòng lỗi bị bỏ qua)."""
+        async def _save_many(conn) -> List[Destination]:
+            saved = []
+            for destination in destinations:
+                await conn.execute("SAVEPOINT save_many_row")
+                try:
+                    saved.append(await self._save(conn, destination))
+                except Exception as e:
+                    await conn.execute("ROLLBACK TO save_many_row")
+                    logger.warning(f"Skipped destination in batch save: {str(e)}")
+                await conn.execute("RELEASE save_many_row")
+            return saved
+        
+        try:
+            saved = await self._db_connection.write(_save_many)
+            logger.info(f"Saved {len(saved)}/{len(destinations)} destinations in one batch")
+            return saved
+        except Exception as e:
+            logger.error(f"Error saving destinations batch: {str(e)}")
+            raise
+    
+    async def _save(self, conn, destination: Destination) -> Destination:
+        """Upsert destination bằng một câu lệnh (chạy trong transaction của writer).
+
+        Id được chọn theo thứ tự: id của entity, id của bản ghi trùng tên (không phân biệt hoa thường),
+        id của bản ghi trùng địa chỉ, hoặc uuid mới. RETURNING trả về bản ghi đã lưu nên không cần đọc lại.
+        """
+        cursor = await conn.execute(self._UPSERT_SQL, (
+            destination.id,
+            str(destination.name),
+            str(destination.address),
+            str(uuid.uuid4()),
+            str(destination.name),
+            str(destination.address),
+            destination.coordinates.lat,
+            destination.coordinates.lon,
+            destination.created_at.isoformat(),
+            destination.updated_at.isoformat()
+        ))
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        saved = self._row_to_destination(row)
+        logger.info(f"Upserted destination with ID: {saved.id}")
+        return saved
+    
     async def find_by_id(self, destination_id: str) -> Optional[Destination]:
         """Find a destination by its ID."""
         try:
-            async with self._db_connection as conn:
+            async with self._db_connection.read() as conn:
                 cursor = await conn.cursor()
                 await cursor.execute(
                     "SELECT id, name, address, latitude, longitude, created_at, updated_at FROM destinations WHERE id = ?",
@@ -126,7 +163,7 @@ class SQLiteDestinationRepository(DestinationRepository):
     async def find_by_name(self, name: str) -> Optional[Destination]:
         """Find a destination by its name."""
         try:
-            async with self._db_connection as conn:
+            async with self._db_connection.read() as conn:
                 cursor = await conn.cursor()
                 await cursor.execute(
                     "SELECT id, name, address, latitude, longitude, created_at, updated_at FROM destinations WHERE name = ?",
@@ -146,10 +183,28 @@ class SQLiteDestinationRepository(DestinationRepository):
             logger.error(f"Error finding destination by name: {str(e)}")
             raise
     
+    async def find_by_address(self, address: str) -> Optional[Destination]:
+        """Find a destination by its exact address (case-insensitive, dùng index LOWER(address))."""
+        try:
+            async with self._db_connection.read() as conn:
+                cursor = await conn.execute(self._FIND_BY_ADDRESS_SQL, (address.strip(),))
+                row = await cursor.fetchone()
+                await cursor.close()
+                
+                if row:
+                    logger.info(f"Found destination by address: {address}")
+                    return self._row_to_destination(row)
+                logger.info(f"Destination not found by address: {address}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error finding destination by address: {str(e)}")
+            raise
+    
     async def list_all(self) -> List[Destination]:
         """List all saved destinations."""
         try:
-            async with self._db_connection as conn:
+            async with self._db_connection.read() as conn:
                 cursor = await conn.cursor()
                 await cursor.execute(
                     "SELECT id, name, address, latitude, longitude, created_at, updated_at FROM destinations ORDER BY created_at DESC"
@@ -164,80 +219,268 @@ class SQLiteDestinationRepository(DestinationRepository):
             logger.error(f"Error listing destinations: {str(e)}")
             raise
     
+    async def list_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[Destination], Optional[PageCursor]]:
+        """List one page of destinations (keyset: WHERE (created_at, id) < cursor, không OFFSET).
+        
+        Đọc limit + 1 dòng để biết còn trang sau; cursor lấy từ giá trị created_at lưu trong DB.
+        """
+        try:
+            rows, next_cursor = await self._page_rows(limit, after)
+            destinations = [self._row_to_destination(row) for row in rows]
+            logger.info(f"Listed page of {len(destinations)} destinations (more: {next_cursor is not None})")
+            return destinations, next_cursor
+            
+        except Exception as e:
+            logger.error(f"Error listing destinations page: {str(e)}")
+            raise
+    
+    async def list_summary_page(self, limit: int, after: Optional[PageCursor] = None) -> Tuple[List[DestinationSummary], Optional[PageCursor]]:
+        """Same page as list_page, map dòng SQL thẳng sang DestinationSummary (không tạo entity)."""
+        try:
+            rows, next_cursor = await self._page_rows(limit, after)
+            summaries = [self._row_to_summary(row) for row in rows]
+            logger.info(f"Listed page of {len(summaries)} destination summaries (more: {next_cursor is not None})")
+            return summaries, next_cursor
+            
+        except Exception as e:
+            logger.error(f"Error listing destinations page: {str(e)}")
+            raise
+    
+    async def _page_rows(self, limit: int, after: Optional[PageCursor]) -> Tuple[List[tuple], Optional[PageCursor]]:
+        async with self._db_connection.read() as conn:
+            if after is None:
+                cursor = await conn.execute(self._PAGE_SQL, (limit + 1,))
+            else:
+                cursor = await conn.execute(self._PAGE_AFTER_SQL, (after.created_at, after.id, limit + 1))
+            rows = await cursor.fetchall()
+            await cursor.close()
+        
+        next_cursor = PageCursor(rows[limit - 1][5], rows[limit - 1][0]) if len(rows) > limit else None
+        return rows[:limit], next_cursor
+    
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[Destination]:
+        """Stream all destinations theo từng trang chunk_size (không giữ read connection giữa các trang)."""
+        after = None
+        while True:
+            destinations, after = await self.list_page(chunk_size, after)
+            for destination in destinations:
+                yield destination
+            if after is None:
+                return
+    
     async def delete(self, destination_id: str) -> bool:
-        """Delete a destination by ID, return True if deleted."""
+        """Delete a destination by ID, return True if deleted (qua writer queue)."""
+        async def _delete(conn) -> int:
+            cursor = await conn.execute(
+                "DELETE FROM destinations WHERE id = ?",
+                (destination_id,)
+            )
+            return cursor.rowcount
+        
         try:
-            async with self._db_connection as conn:
-                cursor = await conn.cursor()
-                await cursor.execute(
-                    "DELETE FROM destinations WHERE id = ?",
-                    (destination_id,)
-                )
-                
-                deleted_count = cursor.rowcount
-                await conn.commit()
+            deleted_count = await self._db_connection.write(_delete)
+            
+            if deleted_count > 0:
+                logger.info(f"Deleted destination with ID: {destination_id}")
+                return True
+            else:
+                logger.info(f"Destination not found for deletion: {destination_id}")
+                return False
                 
-                if deleted_count > 0:
-                    logger.info(f"Deleted destination with ID: {destination_id}")
-                    return True
-                else:
-                    logger.info(f"Destination not found for deletion: {destination_id}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"Error deleting destination: {str(e)}")
             raise
     
-    async def search_by_name_and_address(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[Destination]:
-        """Search destinations by ID, name and/or address (partial matching, case-insensitive)."""
+    async def find_nearby(self, center: LatLon, limit: int = 10, radius_m: Optional[float] = None) -> List[Tuple[Destination, float]]:
+        """Find the destinations nearest to center, dùng R*Tree index destinations_rtree.
+        
+        R*Tree trả về các ứng viên trong bounding box của vòng tròn bán kính r; khoảng cách
+        haversine được tính trên tọa độ thô, chỉ top-k được đọc đầy đủ và chuyển thành entity.
+        Có radius_m: một query. Không có: bắt đầu từ 2 km, nới rộng x4 khi box có ít hơn limit
+        ứng viên; khi box đã có đủ, khoảng cách của ứng viên thứ limit là bán kính của vòng cuối.
+        Dừng khi vòng tròn chứa đủ limit destinations (các điểm ngoài chắc chắn xa hơn) hoặc bao cả Trái Đất.
+        """
         try:
-            async with self._db_connection as conn:
-                cursor = await conn.cursor()
-                
-                # Build dynamic query based on provided criteria
-                query = "SELECT id, name, address, latitude, longitude, created_at, updated_at FROM destinations WHERE 1=1"
-                params = []
-                
-                if id:
-                    query += " AND id = ?"
-                    params.append(id)
-                
-                if name:
-                    query += " AND LOWER(name) LIKE LOWER(?)"
-                    params.append(f"%{name}%")
-                
-                if address:
-                    query += " AND LOWER(address) LIKE LOWER(?)"
-                    params.append(f"%{address}%")
+            radius = radius_m if radius_m is not None else _NEARBY_INITIAL_RADIUS_M
+            async with self._db_connection.read() as conn:
+                while True:
+                    cursor = await conn.execute(self._NEARBY_CANDIDATES_SQL, self._bounding_box(center, radius))
+                    candidates = [
+                        (haversine_m(center.lat, center.lon, lat, lon), seq)
+                        for seq, lat, lon in await cursor.fetchall()
+                    ]
+                    await cursor.close()
+                    within = [candidate for candidate in candidates if candidate[0] <= radius]
+                    
+                    if radius_m is not None or len(within) >= limit or radius >= _MAX_RADIUS_M:
+                        break
+                    if len(candidates) >= limit:
+                        radius = heapq.nsmallest(limit, candidates)[-1][0]
+                    else:
+                        radius = min(radius * _NEARBY_RADIUS_GROWTH, _MAX_RADIUS_M)
                 
-                await cursor.execute(query, params)
-                rows = await cursor.fetchall()
+                nearest = heapq.nsmallest(limit, within)
+                rows = {}
+                if nearest:
+                    placeholders = ", ".join("?" for _ in nearest)
+                    cursor = await conn.execute(
+                        "SELECT id, name, address, latitude, longitude, created_at, updated_at, seq "
+                        f"FROM destinations WHERE seq IN ({placeholders})",
+                        [seq for _, seq in nearest]
+                    )
+                    rows = {row[7]: row for row in await cursor.fetchall()}
+                    await cursor.close()
+            
+            destinations = [(self._row_to_destination(rows[seq]), meters) for meters, seq in nearest if seq in rows]
+            logger.info(f"Found {len(destinations)} destinations near {center.lat}, {center.lon} ({len(candidates)} candidates, radius {radius:.0f}m)")
+            return destinations
+            
+        except Exception as e:
+            logger.error(f"Error finding nearby destinations: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _bounding_box(center: LatLon, radius_m: float) -> Tuple[float, float, float, float]:
+        """(min_lat, max_lat, min_lon, max_lon) bao vòng tròn bán kính radius_m quanh center.
+        
+        Vòng tròn chứa cực hoặc cắt kinh tuyến 180 thì dùng toàn bộ dải kinh độ.
+        """
+        angular = radius_m / EARTH_RADIUS_M
+        lat = math.radians(center.lat)
+        min_lat, max_lat = lat - angular, lat + angular
+        if min_lat <= -math.pi / 2 or max_lat >= math.pi / 2 or angular >= math.pi / 2:
+            return max(math.degrees(min_lat), -90.0), min(math.degrees(max_lat), 90.0), -180.0, 180.0
+        
+        spread = math.sin(angular) / math.cos(lat)
+        if spread >= 1.0:
+            return math.degrees(min_lat), math.degrees(max_lat), -180.0, 180.0
+        dlon = math.degrees(math.asin(spread))
+        if center.lon - dlon < -180.0 or center.lon + dlon > 180.0:
+            return math.degrees(min_lat), math.degrees(max_lat), -180.0, 180.0
+        return math.degrees(min_lat), math.degrees(max_lat), center.lon - dlon, center.lon + dlon
+    
+    async def search_by_name_and_address(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[Destination]:
+        """Search destinations by ID, name and/or address (case-insensitive).
+        
+        Name/address được tra qua FTS5 index destinations_fts: không phân biệt dấu, mỗi từ khớp
+        theo tiền tố, kết quả xếp hạng theo bm25. Term không có từ nào (vd. chỉ có dấu câu)
+        fallback về LIKE '%term%'.
+        """
+        try:
+            destinations = [self._row_to_destination(row) for row in await self._search_rows(id, name, address)]
+            logger.info(f"Found {len(destinations)} destinations matching id='{id}', name='{name}', address='{address}'")
+            return destinations
                 
-                destinations = [self._row_to_destination(row) for row in rows]
-                logger.info(f"Found {len(destinations)} destinations matching id='{id}', name='{name}', address='{address}'")
-                return destinations
+        except Exception as e:
+            logger.error(f"Error searching destinations: {str(e)}")
+            raise
+    
+    async def search_summaries(self, id: Optional[str] = None, name: Optional[str] = None, address: Optional[str] = None) -> List[DestinationSummary]:
+        """Same results as search_by_name_and_address, map dòng SQL thẳng sang DestinationSummary (không tạo entity)."""
+        try:
+            summaries = [self._row_to_summary(row) for row in await self._search_rows(id, name, address)]
+            logger.info(f"Found {len(summaries)} destination summaries matching id='{id}', name='{name}', address='{address}'")
+            return summaries
                 
         except Exception as e:
             logger.error(f"Error searching destinations: {str(e)}")
             raise
     
-    def _row_to_destination(self, row: tuple) -> Destination:
-        """Convert database row to Destination entity."""
-        # Parse datetimes and add timezone if not present
-        created_at = datetime.fromisoformat(row[5])
-        updated_at = datetime.fromisoformat(row[6])
+    async def _search_rows(self, id: Optional[str], name: Optional[str], address: Optional[str]) -> List[tuple]:
+        match = self._fts_match_expression(name, address)
+        if match is not None:
+            query = (
+                "SELECT d.id, d.name, d.address, d.latitude, d.longitude, d.created_at, d.updated_at "
+                "FROM destinations_fts JOIN destinations d ON d.seq = destinations_fts.rowid "
+                "WHERE destinations_fts MATCH ?"
+            )
+            params = [match]
+            if id:
+                query += " AND d.id = ?"
+                params.append(id)
+            query += " ORDER BY bm25(destinations_fts)"
+        else:
+            query, params = self._like_search_query(id, name, address)
+        
+        async with self._db_connection.read() as conn:
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
+            await cursor.close()
+        return rows
+    
+    @staticmethod
+    def _like_search_query(id: Optional[str], name: Optional[str], address: Optional[str]) -> Tuple[str, list]:
+        """Query LIKE '%term%' (quét toàn bảng) cho các trường hợp FTS không áp dụng được."""
+        query = "SELECT id, name, address, latitude, longitude, created_at, updated_at FROM destinations WHERE 1=1"
+        params = []
+        
+        if id:
+            query += " AND id = ?"
+            params.append(id)
+        
+        if name:
+            query += " AND LOWER(name) LIKE LOWER(?)"
+            params.append(f"%{name}%")
+        
+        if address:
+            query += " AND LOWER(address) LIKE LOWER(?)"
+            params.append(f"%{address}%")
+        
+        return query, params
+    
+    @staticmethod
+    def _fts_match_expression(name: Optional[str], address: Optional[str]) -> Optional[str]:
+        """FTS5 MATCH expression, vd. name : ("nha"*) AND address : ("le"* "loi"*).
         
-        # Add UTC timezone if datetime is naive
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        if updated_at.tzinfo is None:
-            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        Trả về None khi không có term nào (chỉ lọc theo id) hoặc một term không chứa từ nào.
+        """
+        filters = []
+        for column, term in (("name", name), ("address", address)):
+            if not term:
+                continue
+            tokens = _FTS_TOKEN.findall(fold_vietnamese_d(term))
+            if not tokens:
+                return None
+            phrases = " ".join(f'"{token}"*' for token in tokens)
+            filters.append(f"{column} : ({phrases})")
+        return " AND ".join(filters) if filters else None
+    
+    @staticmethod
+    def _utc_datetime(text: str) -> datetime:
+        """Parse datetime đã lưu; giá trị naive được coi là UTC."""
+        value = datetime.fromisoformat(text)
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    
+    @classmethod
+    def _utc_isoformat(cls, text: str) -> str:
+        """Chuỗi isoformat() của _utc_datetime(text); giá trị đã có offset (như khi ghi bằng isoformat()) giữ nguyên."""
+        if len(text) > 6 and text[-6] in "+-" and text[-3] == ":":
+            return text
+        return cls._utc_datetime(text).isoformat()
+    
+    def _row_to_destination(self, row: tuple) -> Destination:
+        """Convert database row to Destination entity.
         
-        return Destination(
+        Dữ liệu trong bảng đã được validate khi ghi (mọi lệnh ghi đi qua entity Destination),
+        nên dùng các constructor trusted để bỏ qua validation khi đọc lại.
+        """
+        return Destination.trusted(
             id=row[0],
-            name=DestinationName(row[1]),  # Convert string to DestinationName
-            address=Address(row[2]),  # Convert string to Address
-            coordinates=LatLon(row[3], row[4]),
-            created_at=created_at,
-            updated_at=updated_at
+            name=DestinationName.trusted(row[1]),
+            address=Address.trusted(row[2]),
+            coordinates=LatLon.trusted(row[3], row[4]),
+            created_at=self._utc_datetime(row[5]),
+            updated_at=self._utc_datetime(row[6])
+        )
+    
+    def _row_to_summary(self, row: tuple) -> DestinationSummary:
+        """Convert database row straight to DestinationSummary (cùng giá trị như DestinationSummary.from_destination)."""
+        return DestinationSummary(
+            id=row[0] or "",
+            name=row[1],
+            address=row[2],
+            latitude=row[3],
+            longitude=row[4],
+            created_at=self._utc_isoformat(row[5]),
+            updated_at=self._utc_isoformat(row[6])
         )
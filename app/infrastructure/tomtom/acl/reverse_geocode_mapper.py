@@ -0,0 +1,77 @@
+"""TomTom Reverse Geocode ACL Mapper - Chuyển đổi dữ liệu reverse geocoding."""
+
+import re
+
+from app.application.constants.validation_constants import DefaultValues
+from app.application.dto.traffic_dto import GeocodedAddress
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TomTomReverseGeocodeMapper:
+    """Mapper chuyển đổi TomTom reverse geocode responses thành GeocodedAddress.
+
+    Chức năng: Dùng chung cho adapter gọi từng điểm và adapter batch search
+    """
+
+    def to_domain_geocoded_address(self, coord: LatLon, payload: dict) -> GeocodedAddress:
+        """Chuyển đổi TomTom reverse geocode response thành GeocodedAddress.
+
+        Đầu vào: coord (tọa độ đã gửi), payload - Raw response từ TomTom Reverse Geocode API
+        Đầu ra: GeocodedAddress; fallback "không xác định" nếu không có địa chỉ
+        """
+        try:
+            addresses = payload.get("addresses", [])
+            if not addresses:
+                return self.unknown_address(coord)
+
+            # Lấy địa chỉ đầu tiên
+            address_info = addresses[0].get("address", {})
+
+            # Lấy freeform address
+            freeform_address = address_info.get("freeformAddress", "")
+
+            # Tạo địa chỉ đầy đủ từ các thành phần
+            address_parts = []
+            if address_info.get("streetName"):
+                address_parts.append(address_info["streetName"])
+            if address_info.get("municipality"):
+                address_parts.append(address_info["municipality"])
+            if address_info.get("countrySubdivision"):
+                address_parts.append(address_info["countrySubdivision"])
+            if address_info.get("country"):
+                address_parts.append(address_info["country"])
+
+            full_address = ", ".join(address_parts) if address_parts else freeform_address
+
+            # Cắt bỏ các số ở cuối chuỗi địa chỉ
+            return GeocodedAddress(
+                coordinate=coord,
+                address=self._clean_address(full_address),
+                freeform_address=self._clean_address(freeform_address)
+            )
+
+        except Exception as e:
+            logger.error(f"Error parsing geocode response: {e}")
+            return self.unknown_address(coord)
+
+    @staticmethod
+    def unknown_address(coord: LatLon) -> GeocodedAddress:
+        """Địa chỉ fallback khi không reverse geocode được."""
+        return GeocodedAddress(
+            coordinate=coord,
+            address=DefaultValues.UNKNOWN_ADDRESS,
+            freeform_address=DefaultValues.UNKNOWN_ADDRESS
+        )
+
+    @staticmethod
+    def _clean_address(address: str) -> str:
+        """Cắt bỏ các số ở cuối chuỗi địa chỉ."""
+        if not address:
+            return address
+
+        # Tìm pattern số ở cuối chuỗi
+        cleaned = re.sub(r'\s+\d+$', '', address.strip())
+        return cleaned if cleaned else address
@@ -5,9 +5,14 @@ from app.application.dto.traffic_dto import (
     TrafficAnalysisResultDTO,
     TrafficConditionResultDTO,
     TrafficFlowDataDTO,
+    TrafficResponse,
+    TrafficSection,
     TrafficSectionDTO,
 )
 from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class TomTomTrafficMapper:
@@ -73,6 +78,69 @@ class TomTomTrafficMapper:
             sections=sections
         )
     
+    def to_domain_traffic_response(self, payload: dict) -> TrafficResponse:
+        """Chuyển đổi TomTom route response (sectionType=traffic) thành TrafficResponse.
+        
+        Đầu vào: dict - Raw response từ TomTom Routing API với traffic=true
+        Đầu ra: TrafficResponse - Các đoạn TRAFFIC cùng tổng delay và tổng chiều dài
+        Xử lý: Lọc sections có sectionType == "TRAFFIC" của route đầu tiên
+        """
+        try:
+            routes = payload.get("routes", [])
+            if not routes:
+                logger.warning("No routes in TomTom response")
+                return TrafficResponse(
+                    success=True,
+                    traffic_sections=[],
+                    total_delay_seconds=0,
+                    total_traffic_length_meters=0
+                )
+            
+            sections = routes[0].get("sections", [])
+            logger.debug(f"Parsing {len(sections)} route sections for traffic")
+            
+            # Trích xuất traffic sections
+            traffic_sections = []
+            total_delay = 0
+            total_traffic_length = 0
+            for section in sections:
+                if section.get("sectionType") != "TRAFFIC":
+                    continue
+                traffic_section = TrafficSection(
+                    section_type=section.get("sectionType", ""),
+                    start_point_index=section.get("startPointIndex", 0),
+                    end_point_index=section.get("endPointIndex", 0),
+                    simple_category=section.get("simpleCategory", ""),
+                    effective_speed_kmh=section.get("effectiveSpeedInKmh", 0.0),
+                    delay_seconds=section.get("delayInSeconds", 0),
+                    magnitude_of_delay=section.get("magnitudeOfDelay", 0),
+                    event_id=section.get("eventId")
+                )
+                traffic_sections.append(traffic_section)
+                total_delay += traffic_section.delay_seconds
+                total_traffic_length += section.get("lengthInMeters", 0)
+            
+            logger.info(
+                f"Traffic parsing complete: {len(traffic_sections)} sections, "
+                f"{total_delay}s delay, {total_traffic_length}m affected"
+            )
+            return TrafficResponse(
+                success=True,
+                traffic_sections=traffic_sections,
+                total_delay_seconds=total_delay,
+                total_traffic_length_meters=total_traffic_length
+            )
+            
+        except Exception as e:
+            logger.error(f"Error parsing traffic response: {e}")
+            return TrafficResponse(
+                success=False,
+                traffic_sections=[],
+                total_delay_seconds=0,
+                total_traffic_length_meters=0,
+                error_message=f"Failed to parse response: {e}"
+            )
+    
     def to_domain_traffic_analysis(self, payload: dict) -> TrafficAnalysisResultDTO:
         """Chuyển đổi TomTom route response thành phân tích traffic.
         
@@ -0,0 +1,122 @@
+"""TomTom Batch Search Adapter - gom nhiều reverse geocode vào một POST /search/2/batch.json."""
+
+import asyncio
+from typing import List, Optional
+from urllib.parse import urlencode
+
+from app.application.dto.traffic_dto import ReverseGeocodeCommand, ReverseGeocodeResponse
+from app.application.ports.reverse_geocode_provider import ReverseGeocodeProvider
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.http.http_method import HttpMethod
+from app.infrastructure.http.request_entity import RequestEntity
+from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.tomtom.acl.reverse_geocode_mapper import TomTomReverseGeocodeMapper
+from app.infrastructure.tomtom.endpoint import (
+    BATCH_REVERSE_GEOCODE_QUERY,
+    BATCH_SEARCH_MAX_ITEMS,
+    BATCH_SEARCH_PATH,
+    REVERSE_GEOCODE_RADIUS_METERS,
+)
+
+logger = get_logger(__name__)
+
+
+class TomTomBatchSearchAdapter(ReverseGeocodeProvider):
+    """Adapter TomTom Batch Search - một round trip cho tối đa 100 sub-queries.
+
+    Đầu vào: ReverseGeocodeCommand
+    Đầu ra: ReverseGeocodeResponse với địa chỉ theo đúng thứ tự đầu vào
+    Chức năng: Chia input lớn thành các chunk 100 item, gửi song song; item lỗi
+    được map sang fallback "không xác định"
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        http: AsyncApiClient,
+        timeout_sec: int = 12,
+        max_items_per_request: int = BATCH_SEARCH_MAX_ITEMS
+    ):
+        """Khởi tạo adapter với thông tin kết nối TomTom API."""
+        self._base_url = base_url.rstrip("/")
+        self._http = http
+        self._timeout_sec = timeout_sec
+        self._api_key = api_key
+        self._chunk_size = max(1, min(max_items_per_request, BATCH_SEARCH_MAX_ITEMS))
+        self._reverse_mapper = TomTomReverseGeocodeMapper()
+
+    async def reverse_geocode(self, cmd: ReverseGeocodeCommand) -> ReverseGeocodeResponse:
+        """Reverse geocode tất cả coordinates bằng batch request.
+
+        Đầu vào: ReverseGeocodeCommand (coordinates, language)
+        Đầu ra: ReverseGeocodeResponse với địa chỉ theo đúng thứ tự coordinates
+        """
+        if not cmd.coordinates:
+            return ReverseGeocodeResponse(success=True, addresses=[])
+
+        # Loại bỏ coordinates trùng nhau trước khi gửi
+        unique_coords = list(dict.fromkeys(cmd.coordinates))
+        queries = [
+            BATCH_REVERSE_GEOCODE_QUERY.format(position=f"{coord.lat},{coord.lon}")
+            + "?" + urlencode({"radius": REVERSE_GEOCODE_RADIUS_METERS, "language": cmd.language})
+            for coord in unique_coords
+        ]
+        items = await self._send_batch(queries)
+
+        by_coord = {}
+        error_count = 0
+        for coord, item in zip(unique_coords, items):
+            if item is None:
+                error_count += 1
+                by_coord[coord] = self._reverse_mapper.unknown_address(coord)
+            else:
+                by_coord[coord] = self._reverse_mapper.to_domain_geocoded_address(coord, item)
+
+        addresses = [by_coord[coord] for coord in cmd.coordinates]
+        logger.info(
+            f"Batch reverse geocoding completed: {len(unique_coords) - error_count} successful, {error_count} failed"
+        )
+        return ReverseGeocodeResponse(
+            success=error_count < len(unique_coords),  # Success nếu ít nhất 1 coordinate thành công
+            addresses=addresses,
+            error_message=f"{error_count} coordinates failed to geocode" if error_count > 0 else None
+        )
+
+    async def _send_batch(self, queries: List[str]) -> List[Optional[dict]]:
+        """Gửi queries theo từng chunk; trả về response của từng item, None nếu item lỗi."""
+        chunks = [queries[i:i + self._chunk_size] for i in range(0, len(queries), self._chunk_size)]
+        results = await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+        items: List[Optional[dict]] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Batch search chunk of {len(chunk)} items failed: {result}")
+                items.extend([None] * len(chunk))
+            else:
+                items.extend(result)
+        return items
+
+    async def _send_chunk(self, queries: List[str]) -> List[Optional[dict]]:
+        """Gửi một batch request (tối đa 100 items)."""
+        req = RequestEntity(
+            method=HttpMethod.POST,
+            url=f"{self._base_url}{BATCH_SEARCH_PATH}",
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            params={"key": self._api_key},
+            json={"batchItems": [{"query": query} for query in queries]},
+            timeout_sec=self._timeout_sec,
+            latency_signal=False,  # latency tăng theo số items trong batch
+        )
+        payload = await self._http.send(req)
+
+        batch_items = payload.get("batchItems", [])
+        items: List[Optional[dict]] = []
+        for index in range(len(queries)):
+            item = batch_items[index] if index < len(batch_items) else {}
+            if item.get("statusCode") == 200 and isinstance(item.get("response"), dict):
+                items.append(item["response"])
+            else:
+                logger.debug(f"Batch item {index} failed with status {item.get('statusCode')}")
+                items.append(None)
+        return items
@@ -6,6 +6,8 @@ from app.infrastructure.http.client import AsyncApiClient
 from app.infrastructure.http.http_method import HttpMethod
 from app.infrastructure.http.request_entity import RequestEntity
 from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.tomtom.acl.reverse_geocode_mapper import TomTomReverseGeocodeMapper
+from app.infrastructure.tomtom.endpoint import REVERSE_GEOCODE_PATH, REVERSE_GEOCODE_RADIUS_METERS
 import asyncio
 
 logger = get_logger(__name__)
@@ -17,12 +19,24 @@ class TomTomReverseGeocodeAdapter(ReverseGeocodeProvider):
     Chức năng: Gọi TomTom Reverse Geocode API để lấy địa chỉ từ coordinates
     """
     
-    def __init__(self, base_url: str, api_key: str, http: AsyncApiClient, timeout_sec: int = 5):
-        """Khởi tạo adapter với thông tin kết nối TomTom API."""
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        http: AsyncApiClient,
+        timeout_sec: int = 5,
+        max_concurrency: int = 8
+    ):
+        """Khởi tạo adapter với thông tin kết nối TomTom API.
+        
+        max_concurrency: số request reverse geocode tối đa chạy đồng thời (tránh burst gây 429)
+        """
         self._base_url = base_url.rstrip("/")
         self._http = http
         self._timeout_sec = timeout_sec
         self._api_key = api_key
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._mapper = TomTomReverseGeocodeMapper()
 
     async def reverse_geocode(self, cmd: ReverseGeocodeCommand) -> ReverseGeocodeResponse:
         """Reverse geocode coordinates thành địa chỉ.
@@ -35,29 +49,27 @@ class TomTomReverseGeocodeAdapter(ReverseGeocodeProvider):
         """
         logger.info(f"Reverse geocoding {len(cmd.coordinates)} coordinates")
         try:
-            # Xử lý song song nhiều coordinates
-            tasks = []
-            for coord in cmd.coordinates:
-                task = self._reverse_geocode_single(coord, cmd.language)
-                tasks.append(task)
-            
-            # Chờ tất cả tasks hoàn thành
-            logger.debug(f"Starting parallel geocoding of {len(tasks)} coordinates")
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Loại bỏ coordinates trùng nhau (các traffic sections liền kề thường chung điểm đầu/cuối)
+            unique_coords = list(dict.fromkeys(cmd.coordinates))
+            
+            # Xử lý song song, giới hạn số request đồng thời bằng semaphore
+            logger.debug(f"Starting parallel geocoding of {len(unique_coords)} unique coordinates")
+            results = await asyncio.gather(
+                *(self._reverse_geocode_bounded(coord, cmd.language) for coord in unique_coords),
+                return_exceptions=True
+            )
+            result_by_coord = dict(zip(unique_coords, results))
             
-            # Xử lý kết quả
+            # Trả kết quả theo đúng thứ tự ban đầu (use case ghép cặp start/end theo index)
             addresses = []
             error_count = 0
-            for i, result in enumerate(results):
+            for i, coord in enumerate(cmd.coordinates):
+                result = result_by_coord[coord]
                 if isinstance(result, Exception):
                     logger.warning(f"Error geocoding coordinate {i}: {result}")
                     error_count += 1
                     # Tạo địa chỉ mặc định cho lỗi
-                    addresses.append(GeocodedAddress(
-                        coordinate=cmd.coordinates[i],
-                        address="Địa chỉ không xác định",
-                        freeform_address="Địa chỉ không xác định"
-                    ))
+                    addresses.append(self._mapper.unknown_address(coord))
                 else:
                     addresses.append(result)
             
@@ -78,11 +90,15 @@ class TomTomReverseGeocodeAdapter(ReverseGeocodeProvider):
                 error_message=f"Reverse geocoding failed: {str(e)}"
             )
 
+    async def _reverse_geocode_bounded(self, coord, language: str) -> GeocodedAddress:
+        """Reverse geocode một coordinate trong giới hạn concurrency của adapter."""
+        async with self._semaphore:
+            return await self._reverse_geocode_single(coord, language)
+
     async def _reverse_geocode_single(self, coord, language: str) -> GeocodedAddress:
         """Reverse geocode một coordinate đơn lẻ."""
         try:
-            lat, lon = coord.lat, coord.lon
-            path = f"/search/2/reverseGeocode/{lat},{lon}.json"
+            path = REVERSE_GEOCODE_PATH.format(position=f"{coord.lat},{coord.lon}")
             
             # Tạo HTTP request
             req = RequestEntity(
@@ -91,7 +107,7 @@ class TomTomReverseGeocodeAdapter(ReverseGeocodeProvider):
                 headers={"Accept": "application/json"},
                 params={
                     "key": self._api_key,
-                    "radius": "100",
+                    "radius": REVERSE_GEOCODE_RADIUS_METERS,
                     "language": language
                 },
                 json=None,
@@ -100,74 +116,8 @@ class TomTomReverseGeocodeAdapter(ReverseGeocodeProvider):
             
             # Gửi request và parse response
             payload = await self._http.send(req)
-            return self._parse_geocode_response(coord, payload)
+            return self._mapper.to_domain_geocoded_address(coord, payload)
             
         except Exception as e:
             logger.error(f"Error geocoding single coordinate: {e}")
-            return GeocodedAddress(
-                coordinate=coord,
-                address="Địa chỉ không xác định",
-                freeform_address="Địa chỉ không xác định"
-            )
-
-    def _parse_geocode_response(self, coord, payload: dict) -> GeocodedAddress:
-        """Parse TomTom reverse geocode response."""
-        try:
-            addresses = payload.get("addresses", [])
-            if not addresses:
-                return GeocodedAddress(
-                    coordinate=coord,
-                    address="Địa chỉ không xác định",
-                    freeform_address="Địa chỉ không xác định"
-                )
-            
-            # Lấy địa chỉ đầu tiên
-            address_data = addresses[0]
-            address_info = address_data.get("address", {})
-            
-            # Lấy freeform address
-            freeform_address = address_info.get("freeformAddress", "")
-            
-            # Tạo địa chỉ đầy đủ từ các thành phần
-            address_parts = []
-            if address_info.get("streetName"):
-                address_parts.append(address_info["streetName"])
-            if address_info.get("municipality"):
-                address_parts.append(address_info["municipality"])
-            if address_info.get("countrySubdivision"):
-                address_parts.append(address_info["countrySubdivision"])
-            if address_info.get("country"):
-                address_parts.append(address_info["country"])
-            
-            full_address = ", ".join(address_parts) if address_parts else freeform_address
-            
-            # Cắt bỏ các số ở cuối chuỗi địa chỉ
-            cleaned_address = self._clean_address(full_address)
-            cleaned_freeform = self._clean_address(freeform_address)
-            
-            return GeocodedAddress(
-                coordinate=coord,
-                address=cleaned_address,
-                freeform_address=cleaned_freeform
-            )
-            
-        except Exception as e:
-            logger.error(f"Error parsing geocode response: {e}")
-            return GeocodedAddress(
-                coordinate=coord,
-                address="Địa chỉ không xác định",
-                freeform_address="Địa chỉ không xác định"
-            )
-
-    def _clean_address(self, address: str) -> str:
-        """Cắt bỏ các số ở cuối chuỗi địa chỉ."""
-        if not address:
-            return address
-        
-        # Tìm vị trí cuối cùng của số
-        import re
-        # Tìm pattern số ở cuối chuỗi
-        pattern = r'\s+\d+$'
-        cleaned = re.sub(pattern, '', address.strip())
-        
-        return cleaned if cleaned else address
+            return self._mapper.unknown_address(coord)
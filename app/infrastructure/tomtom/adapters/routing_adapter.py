@@ -1,13 +1,19 @@
 """TomTom Routing Adapter - Triển khai routing provider cơ bản."""
 
 from app.application.dto.calculate_route_dto import CalculateRouteCommand, RoutePlan
+from app.application.dto.traffic_dto import RouteWithTrafficResult
 from app.application.ports.routing_provider import RoutingProvider
+from app.domain.constants.api_constants import LanguageConstants
 from app.infrastructure.http.client import AsyncApiClient
 from app.infrastructure.http.http_method import HttpMethod
 from app.infrastructure.http.request_entity import RequestEntity
+from app.infrastructure.logging.logger import get_logger
 from app.infrastructure.tomtom.acl.mappers import TomTomMapper
+from app.infrastructure.tomtom.acl.traffic_mapper import TomTomTrafficMapper
 from app.infrastructure.tomtom.endpoint import CALCULATE_ROUTE_PATH, DEFAULT_TRAVEL_MODE
 
+logger = get_logger(__name__)
+
 
 class TomTomRoutingAdapter(RoutingProvider):
     """Adapter TomTom cho routing cơ bản - tính toán tuyến đường.
@@ -23,6 +29,7 @@ class TomTomRoutingAdapter(RoutingProvider):
         self._timeout_sec = timeout_sec
         self._api_key = api_key
         self._mapper = TomTomMapper()
+        self._traffic_mapper = TomTomTrafficMapper()
 
     async def calculate_route(self, cmd: CalculateRouteCommand) -> RoutePlan:
         """Tính toán tuyến đường cơ bản.
@@ -31,29 +38,7 @@ class TomTomRoutingAdapter(RoutingProvider):
         Đầu ra: RoutePlan với thông tin khoảng cách, thời gian và các đoạn đường
         Xử lý: Gọi TomTom Routing API với traffic=true để có thông tin realtime
         """
-        # Chuyển đổi tọa độ thành format string cho TomTom API
-        origin = f"{cmd.origin.lat},{cmd.origin.lon}"
-        dest = f"{cmd.destination.lat},{cmd.destination.lon}"
-        path = CALCULATE_ROUTE_PATH.format(origin=origin, destination=dest)
-        
-        # Map travel mode từ domain enum sang TomTom format
-        travel_mode = DEFAULT_TRAVEL_MODE.get(cmd.travel_mode.value, "car")
-        # Tạo HTTP request với các tham số routing
-        req = RequestEntity(
-            method=HttpMethod.GET,
-            url=f"{self._base_url}{path}",
-            headers={"Accept": "application/json"},
-            params={
-                "key": self._api_key,
-                "traffic": "true",  # Bật thông tin giao thông realtime
-                "sectionType": "traffic",  # Chia route theo traffic sections
-                "instructionsType": "text",  # Lấy hướng dẫn dạng text
-                "travelMode": travel_mode,
-                "maxAlternatives": "0",  # Chỉ lấy 1 route tốt nhất
-            },
-            json=None,
-            timeout_sec=self._timeout_sec,
-        )
+        req = self._build_route_request(cmd)
         # Gửi request và chuyển đổi response thành domain RoutePlan
         payload = await self._http.send(req)
         return self._mapper.to_domain_route_plan(payload)
@@ -65,30 +50,7 @@ class TomTomRoutingAdapter(RoutingProvider):
         Đầu ra: RoutePlan - Route plan với guidance và instructions chi tiết
         Xử lý: Gọi TomTom Routing API với guidance=true để có hướng dẫn chi tiết
         """
-        # Chuyển đổi tọa độ thành format string cho TomTom API
-        origin = f"{cmd.origin.lat},{cmd.origin.lon}"
-        dest = f"{cmd.destination.lat},{cmd.destination.lon}"
-        path = CALCULATE_ROUTE_PATH.format(origin=origin, destination=dest)
-        
-        # Map travel mode từ domain enum sang TomTom format
-        travel_mode = DEFAULT_TRAVEL_MODE.get(cmd.travel_mode.value, "car")
-        
-        # Tạo HTTP request với các tham số routing và guidance
-        req = RequestEntity(
-            method=HttpMethod.GET,
-            url=f"{self._base_url}{path}",
-            headers={"Accept": "application/json"},
-            params={
-                "key": self._api_key,
-                "traffic": "true",  # Bật thông tin giao thông realtime
-                "sectionType": "traffic",  # Chia route theo traffic sections
-                "instructionsType": "text",  # Lấy hướng dẫn dạng text
-                "travelMode": travel_mode,
-                "maxAlternatives": "0",  # Chỉ lấy 1 route tốt nhất
-            },
-            json=None,
-            timeout_sec=self._timeout_sec,
-        )
+        req = self._build_route_request(cmd)
         
         # Gửi request và chuyển đổi response thành RoutePlan với guidance
         payload = await self._http.send(req)
@@ -115,3 +77,82 @@ class TomTomRoutingAdapter(RoutingProvider):
         print(f"{'='*80}\n")
         
         return self._mapper.to_domain_route_plan_with_guidance(payload)
+    
+    async def calculate_route_without_traffic(
+        self,
+        cmd: CalculateRouteCommand,
+        language: str = LanguageConstants.DEFAULT,
+    ) -> RoutePlan:
+        """Tính toán tuyến đường có guidance nhưng không kèm traffic.
+        
+        Đầu vào: CalculateRouteCommand, language
+        Đầu ra: RoutePlan với guidance, không có traffic sections
+        Xử lý: Gọi TomTom Routing API với traffic=false và không có sectionType=traffic,
+        để upstream không phải tính dữ liệu giao thông realtime khi caller không dùng tới
+        """
+        req = self._build_route_request(cmd, language=language, traffic=False)
+        payload = await self._http.send(req)
+        logger.info(f"Received routing response without traffic with {len(payload.get('routes', []))} routes")
+        return self._mapper.to_domain_route_plan_with_guidance(payload)
+    
+    async def calculate_route_with_traffic(
+        self,
+        cmd: CalculateRouteCommand,
+        language: str = LanguageConstants.DEFAULT,
+        include_analysis: bool = False,
+    ) -> RouteWithTrafficResult:
+        """Tính toán tuyến đường kèm traffic từ một lần gọi calculateRoute.
+        
+        Đầu vào: CalculateRouteCommand, language, include_analysis
+        Đầu ra: RouteWithTrafficResult - RoutePlan, TrafficResponse và (tùy chọn) traffic analysis
+        Xử lý: Gọi TomTom Routing API một lần (traffic=true, sectionType=traffic) rồi
+        suy ra cả route plan lẫn traffic sections từ cùng payload, thay vì gọi lại
+        cùng endpoint từ traffic adapter
+        """
+        req = self._build_route_request(cmd, language=language)
+        payload = await self._http.send(req)
+        logger.info(f"Received routing+traffic response with {len(payload.get('routes', []))} routes")
+        
+        return RouteWithTrafficResult(
+            route_plan=self._mapper.to_domain_route_plan_with_guidance(payload),
+            traffic=self._traffic_mapper.to_domain_traffic_response(payload),
+            traffic_analysis=(
+                self._traffic_mapper.to_domain_traffic_analysis(payload) if include_analysis else None
+            ),
+        )
+    
+    def _build_route_request(
+        self,
+        cmd: CalculateRouteCommand,
+        language: str | None = None,
+        traffic: bool = True,
+    ) -> RequestEntity:
+        """Tạo request calculateRoute với text instructions, kèm traffic sections nếu traffic=True."""
+        # Chuyển đổi tọa độ thành format string cho TomTom API
+        origin = f"{cmd.origin.lat},{cmd.origin.lon}"
+        dest = f"{cmd.destination.lat},{cmd.destination.lon}"
+        path = CALCULATE_ROUTE_PATH.format(origin=origin, destination=dest)
+        
+        # Map travel mode từ domain enum sang TomTom format
+        travel_mode = DEFAULT_TRAVEL_MODE.get(cmd.travel_mode.value, "car")
+        params = {
+            "key": self._api_key,
+            "traffic": "true" if traffic else "false",  # Bật/tắt thông tin giao thông realtime
+            "instructionsType": "text",  # Lấy hướng dẫn dạng text
+            "travelMode": travel_mode,
+            "maxAlternatives": "0",  # Chỉ lấy 1 route tốt nhất
+        }
+        if traffic:
+            params["sectionType"] = "traffic"  # Chia route theo traffic sections
+        if language:
+            params["language"] = language
+        
+        return RequestEntity(
+            method=HttpMethod.GET,
+            url=f"{self._base_url}{path}",
+            headers={"Accept": "application/json"},
+            params=params,
+            json=None,
+            timeout_sec=self._timeout_sec,
+            latency_signal=False,  # latency tăng theo độ dài route
+        )
@@ -1,11 +1,12 @@
 """TomTom Traffic Adapter - Triển khai traffic checking cho BLK-1-15."""
 
-from app.application.dto.traffic_dto import TrafficCheckCommand, TrafficResponse, TrafficSection
+from app.application.dto.traffic_dto import TrafficCheckCommand, TrafficResponse
 from app.application.ports.traffic_provider import TrafficProvider
 from app.infrastructure.http.client import AsyncApiClient
 from app.infrastructure.http.http_method import HttpMethod
 from app.infrastructure.http.request_entity import RequestEntity
 from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.tomtom.acl.traffic_mapper import TomTomTrafficMapper
 
 logger = get_logger(__name__)
 
@@ -22,6 +23,7 @@ class TomTomTrafficAdapter(TrafficProvider):
         self._http = http
         self._timeout_sec = timeout_sec
         self._api_key = api_key
+        self._mapper = TomTomTrafficMapper()
 
     async def check_severe_traffic(self, cmd: TrafficCheckCommand) -> TrafficResponse:
         """Kiểm tra tình trạng giao thông nghiêm trọng trên tuyến đường.
@@ -87,7 +89,7 @@ class TomTomTrafficAdapter(TrafficProvider):
             
             logger.debug(f"Received traffic response with {len(payload.get('routes', []))} routes")
             
-            result = self._parse_traffic_response(payload)
+            result = self._mapper.to_domain_traffic_response(payload)
             logger.info(f"Traffic check completed: {len(result.traffic_sections)} sections found, {result.total_delay_seconds}s total delay")
             return result
             
@@ -100,81 +102,3 @@ class TomTomTrafficAdapter(TrafficProvider):
                 total_traffic_length_meters=0,
                 error_message=f"Traffic check failed: {str(e)}"
             )
-
-    def _parse_traffic_response(self, payload: dict) -> TrafficResponse:
-        """Parse TomTom traffic response thành TrafficResponse."""
-        try:
-            routes = payload.get("routes", [])
-            
-            # DEBUG: Log raw response structure
-            logger.info(f"🔍 RAW TOMTOM RESPONSE DEBUG:")
-            logger.info(f"  - Routes count: {len(routes)}")
-            
-            if not routes:
-                logger.warning("No routes in TomTom response")
-                return TrafficResponse(
-                    success=True,
-                    traffic_sections=[],
-                    total_delay_seconds=0,
-                    total_traffic_length_meters=0
-                )
-            
-            route = routes[0]
-            summary = route.get("summary", {})
-            sections = route.get("sections", [])
-            
-            # DEBUG: Log sections info
-            logger.info(f"  - Sections count: {len(sections)}")
-            logger.info(f"  - Route keys: {list(route.keys())}")
-            if sections:
-                logger.info(f"  - First section type: {sections[0].get('sectionType')}")
-                logger.info(f"  - First section keys: {list(sections[0].keys())}")
-                logger.info(f"  - First section data: {sections[0]}")
-            
-            # Trích xuất traffic sections
-            traffic_sections = []
-            total_delay = 0
-            total_traffic_length = 0
-            
-            logger.info(f"🚦 PARSING TRAFFIC SECTIONS:")
-            for idx, section in enumerate(sections):
-                section_type = section.get("sectionType")
-                logger.info(f"  - Section {idx}: type={section_type}, delayInSeconds={section.get('delayInSeconds', 0)}")
-                
-                if section_type == "TRAFFIC":
-                    traffic_section = TrafficSection(
-                        section_type=section.get("sectionType", ""),
-                        start_point_index=section.get("startPointIndex", 0),
-                        end_point_index=section.get("endPointIndex", 0),
-                        simple_category=section.get("simpleCategory", ""),
-                        effective_speed_kmh=section.get("effectiveSpeedInKmh", 0.0),
-                        delay_seconds=section.get("delayInSeconds", 0),
-                        magnitude_of_delay=section.get("magnitudeOfDelay", 0),
-                        event_id=section.get("eventId")
-                    )
-                    traffic_sections.append(traffic_section)
-                    total_delay += traffic_section.delay_seconds
-                    total_traffic_length += section.get("lengthInMeters", 0)
-                    logger.info(f"    ✓ Added TRAFFIC section with {traffic_section.delay_seconds}s delay")
-            
-            logger.info(f"📊 TRAFFIC PARSING COMPLETE:")
-            logger.info(f"  - Total sections found: {len(traffic_sections)}")
-            logger.info(f"  - Total delay: {total_delay}s")
-            logger.info(f"  - Total traffic length: {total_traffic_length}m")
-            
-            return TrafficResponse(
-                success=True,
-                traffic_sections=traffic_sections,
-                total_delay_seconds=total_delay,
-                total_traffic_length_meters=total_traffic_length
-            )
-            
-        except Exception as e:
-            logger.error(f"Error parsing traffic response: {e}")
-            return TrafficResponse(
-                success=False,
-                traffic_sections=[],
-                total_delay_seconds=0,
-                total_traffic_length_meters=0,
-                error_message=f"Failed to parse response: {e}"
-            )
\ No newline at end of file
@@ -11,6 +11,13 @@ DEFAULT_TRAVEL_MODE = {
 GEOCODE_ADDRESS_PATH = "/search/2/geocode/{address}.json"
 STRUCTURED_GEOCODE_PATH = "/search/2/structuredGeocode.json"
 SEARCH_STREET_PATH = "/search/2/search/{query}.json"
+REVERSE_GEOCODE_PATH = "/search/2/reverseGeocode/{position}.json"
+REVERSE_GEOCODE_RADIUS_METERS = "100"
+
+# Batch search endpoint (synchronous, tối đa 100 sub-queries mỗi request)
+BATCH_SEARCH_PATH = "/search/2/batch.json"
+BATCH_SEARCH_MAX_ITEMS = 100
+BATCH_REVERSE_GEOCODE_QUERY = "/reverseGeocode/{position}.json"
 
 # Traffic endpoints
 TRAFFIC_FLOW_PATH = "/traffic/services/4/flowSegmentData/absolute/{zoom}/json"
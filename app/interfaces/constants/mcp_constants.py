@@ -25,7 +25,7 @@ class MCPServerConstants:
     GEOCODING_TOOLS = ["geocode_address", "get_intersection_position", "get_street_center_position"]
     TRAFFIC_TOOLS = ["get_traffic_condition", "get_route_with_traffic", "analyze_route_traffic"]
     COMPOSITE_TOOLS = ["get_via_route", "check_traffic_between_addresses", "get_detailed_route"]
-    DESTINATION_TOOLS = ["save_destination", "list_destinations", "delete_destination", "update_destination"]
+    DESTINATION_TOOLS = ["save_destination", "list_destinations", "delete_destination", "update_destination", "find_nearby_destinations"]
     WEATHER_TOOLS = ["check_weather"]
 
 
@@ -58,6 +58,7 @@ class MCPToolNames:
     LIST_DESTINATIONS = "list_destinations"
     DELETE_DESTINATION = "delete_destination"
     UPDATE_DESTINATION = "update_destination"
+    FIND_NEARBY_DESTINATIONS = "find_nearby_destinations"
     GET_DETAILED_ROUTE = "get_detailed_route"
     CHECK_WEATHER = "check_weather"
 
@@ -243,13 +244,16 @@ class MCPToolDescriptions:
     """
     
     LIST_DESTINATIONS = """
-    List all saved destinations.
+    List saved destinations, newest first, one page at a time.
     
     INPUT:
-    - None (no parameters required)
+    - limit: int (optional, default: 50, 1-100) - maximum number of destinations in this page
+    - cursor: str (optional) - next_cursor from the previous page; omit to start from the newest
     
     OUTPUT:
-    - JSON with list of all saved destinations including ID, name, address, coordinates, and timestamps
+    - JSON with one page of saved destinations including ID, name, address, coordinates, and timestamps
+    - total_count is the number of destinations in this page
+    - next_cursor: pass it back to get the next page; null on the last page
     - Returns empty list if no destinations are saved
     """
     
@@ -280,6 +284,22 @@ class MCPToolDescriptions:
     - Returns error if destination not found or update failed
     """
     
+    FIND_NEARBY_DESTINATIONS = """
+    Find the saved destinations nearest to a location, sorted by straight-line distance.
+    
+    INPUT:
+    - latitude: float (optional) - latitude of the search center
+    - longitude: float (optional) - longitude of the search center
+    - address: str (optional) - address of the search center (geocoded when coordinates are not given)
+    - radius_meters: float (optional) - only return destinations within this distance
+    - limit: int (optional, default: 10, 1-100) - maximum number of destinations
+    - Note: Provide latitude and longitude, or an address
+    
+    OUTPUT:
+    - JSON with the search center and the nearest destinations including ID, name, address, coordinates and distance_meters
+    - Returns empty list if no saved destination is within the radius
+    """
+    
     # WEATHER TOOLS
     CHECK_WEATHER = """
     Check current weather at a location (address or coordinates).
@@ -360,6 +380,7 @@ class MCPToolErrorMessages:
     LIST_DESTINATIONS_FAILED = "List destinations failed: {error}"
     DELETE_DESTINATION_FAILED = "Delete destination failed: {error}"
     UPDATE_DESTINATION_FAILED = "Update destination failed: {error}"
+    FIND_NEARBY_DESTINATIONS_FAILED = "Find nearby destinations failed: {error}"
     
     # Weather errors
     CHECK_WEATHER_FAILED = "Check weather failed: {error}"
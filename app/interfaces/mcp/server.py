@@ -12,6 +12,7 @@ Server này đã được refactor để tuân thủ Clean Architecture:
 import os
 import sys
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from pathlib import Path
 from typing import Literal
@@ -30,9 +31,12 @@ load_dotenv()
 from app.application.dto.detailed_route_dto import DetailedRouteRequest
 from app.application.dto.save_destination_dto import SaveDestinationRequest
 from app.application.dto.search_destinations_dto import SearchDestinationsRequest
+from app.application.dto.list_destinations_dto import ListDestinationsRequest
+from app.application.dto.find_nearby_dto import FindNearbyDestinationsRequest
 from app.application.dto.delete_destination_dto import DeleteDestinationRequest
 from app.application.dto.update_destination_dto import UpdateDestinationRequest
 from app.application.dto.weather_dto import WeatherCheckRequest
+from app.application.services.deadline import deadline_scope
 
 # DI Container
 from app.di.container import Container
@@ -42,8 +46,17 @@ from fastmcp import FastMCP
 from app.domain.constants.api_constants import TravelModeConstants, CountryConstants, LanguageConstants
 from app.interfaces.constants.mcp_constants import MCPServerConstants, MCPToolDescriptions, MCPErrorMessages, MCPSuccessMessages, MCPToolNames, MCPToolErrorMessages
 
+@asynccontextmanager
+async def _lifespan(server):
+    """Mở/đóng resources dùng chung (HTTP connection pool) theo vòng đời server."""
+    await _container.startup()
+    try:
+        yield
+    finally:
+        await _container.shutdown()
+
 # FastMCP instance
-mcp = FastMCP(MCPServerConstants.SERVER_NAME)
+mcp = FastMCP(MCPServerConstants.SERVER_NAME, lifespan=_lifespan)
 
 # Create Literal type from constants - using string literals from constants
 # Note: "motorcycle" is accepted but will be treated as "car" by TomTom API
@@ -82,13 +95,16 @@ async def save_destination_tool(
         return {"error": MCPToolErrorMessages.SAVE_DESTINATION_FAILED.format(error=str(e))}
 
 @mcp.tool(name=MCPToolNames.LIST_DESTINATIONS)
-async def list_destinations_tool() -> dict:
+async def list_destinations_tool(
+    limit: int = 50,
+    cursor: str | None = None
+) -> dict:
     f"""{MCPToolDescriptions.LIST_DESTINATIONS}"""
     try:
-        # Sử dụng Search Destinations Use Case với default values (list all)
-        request = SearchDestinationsRequest()
+        # Sử dụng List Destinations Use Case (keyset pagination - một trang mỗi lần gọi)
+        request = ListDestinationsRequest(limit=limit, cursor=cursor)
         
-        result = await _container.search_destinations.execute(request)
+        result = await _container.list_destinations.execute(request)
         
         # Trả về response dưới dạng dict
         return asdict(result)
@@ -169,6 +185,32 @@ async def update_destination_tool(
     except Exception as e:
         return {"error": MCPToolErrorMessages.UPDATE_DESTINATION_FAILED.format(error=str(e))}
 
+@mcp.tool(name=MCPToolNames.FIND_NEARBY_DESTINATIONS)
+async def find_nearby_destinations_tool(
+    latitude: float | None = None,
+    longitude: float | None = None,
+    address: str | None = None,
+    radius_meters: float | None = None,
+    limit: int = 10
+) -> dict:
+    f"""{MCPToolDescriptions.FIND_NEARBY_DESTINATIONS}"""
+    try:
+        # Sử dụng Find Nearby Destinations Use Case (R*Tree index trong SQLite)
+        request = FindNearbyDestinationsRequest(
+            latitude=latitude,
+            longitude=longitude,
+            address=address,
+            radius_meters=radius_meters,
+            limit=limit
+        )
+        
+        result = await _container.find_nearby_destinations.execute(request)
+        
+        # Trả về response dưới dạng dict
+        return asdict(result)
+    except Exception as e:
+        return {"error": MCPToolErrorMessages.FIND_NEARBY_DESTINATIONS_FAILED.format(error=str(e))}
+
 @mcp.tool(name=MCPToolNames.GET_DETAILED_ROUTE)
 async def get_detailed_route_tool(
     origin_address: str,
@@ -188,7 +230,9 @@ async def get_detailed_route_tool(
             language=language
         )
         
-        result = await _container.get_detailed_route.execute(request)
+        # Latency budget cho toàn bộ request: mọi HTTP call bên dưới bị chặn bởi deadline này
+        with deadline_scope(_container.settings.detailed_route_budget_sec):
+            result = await _container.get_detailed_route.execute(request)
         
         # Log the result with traffic information
         print(f"\n[ROUTE] Detailed Route: {origin_address} -> {destination_address}")
@@ -285,7 +329,8 @@ def main():
             "save_destination", 
             "list_destinations",
             "delete_destination",
-            "update_destination"
+            "update_destination",
+            "find_nearby_destinations"
         ]
         
         # Add weather tool if enabled
@@ -298,6 +343,7 @@ def main():
         print(f"   • list_destinations - {MCPToolDescriptions.LIST_DESTINATIONS}")
         print(f"   • delete_destination - {MCPToolDescriptions.DELETE_DESTINATION}")
         print(f"   • update_destination - {MCPToolDescriptions.UPDATE_DESTINATION}")
+        print(f"   • find_nearby_destinations - {MCPToolDescriptions.FIND_NEARBY_DESTINATIONS}")
         if _container.get_weather is not None:
             print(f"   • check_weather - {MCPToolDescriptions.CHECK_WEATHER}")
         print("=" * 60)
@@ -0,0 +1,108 @@
+"""Benchmark: chi phí mỗi dòng khi đọc destinations - validated entity, trusted entity, projection DTO.
+
+Chạy: python -m benchmarks.bench_destination_hydration [số dòng]
+
+Phần 1 (microbenchmark, không I/O) đo µs/dòng để chuyển N dòng SQL thành DestinationSummary:
+"validated" dựng value objects + Destination với đầy đủ validation (cách đọc cũ),
+"trusted" dùng các constructor trusted, "projection" map dòng thẳng sang DTO.
+Phần 2 đo listing đầy đủ qua SQLite (mặc định 100k dòng): search_by_name_and_address
++ DestinationSummary.from_destination so với search_summaries.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.application.dto.search_destinations_dto import DestinationSummary
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+
+def _rows(count: int) -> list:
+    return [
+        (
+            f"seed-{i:06d}",
+            f"Điểm {i}",
+            f"{i} Đường số {i % 100}, TP.HCM",
+            10.77,
+            106.70,
+            "2024-01-01T00:00:00+00:00",
+            "2024-01-02T00:00:00+00:00",
+        )
+        for i in range(count)
+    ]
+
+
+def _validated_row_to_destination(row: tuple) -> Destination:
+    """Cách đọc cũ: mọi value object và entity đều chạy validation."""
+    created_at = datetime.fromisoformat(row[5])
+    updated_at = datetime.fromisoformat(row[6])
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return Destination(
+        id=row[0],
+        name=DestinationName(row[1]),
+        address=Address(row[2]),
+        coordinates=LatLon(row[3], row[4]),
+        created_at=created_at,
+        updated_at=updated_at
+    )
+
+
+def _per_row_us(rows: list, convert) -> float:
+    started = time.perf_counter()
+    for row in rows:
+        convert(row)
+    return (time.perf_counter() - started) * 1_000_000 / len(rows)
+
+
+async def main(rows: int) -> None:
+    sample = _rows(rows)
+    DatabaseConnection.reset_instance()
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = SQLiteDestinationRepository(str(Path(tmp) / "hydration.db"))
+
+        paths = [
+            ("validated entity", lambda row: DestinationSummary.from_destination(_validated_row_to_destination(row))),
+            ("trusted entity", lambda row: DestinationSummary.from_destination(repository._row_to_destination(row))),
+            ("projection", repository._row_to_summary),
+        ]
+        for label, convert in paths:
+            print(f"row -> summary  {label:<18} {_per_row_us(sample, convert):8.2f} µs/row")
+
+        await create_destinations_table()
+        async with repository._db_connection.transaction() as conn:
+            await conn.executemany(
+                "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                sample
+            )
+
+        async def via_entities() -> int:
+            return len([DestinationSummary.from_destination(d) for d in await repository.search_by_name_and_address()])
+
+        async def via_projection() -> int:
+            return len(await repository.search_summaries())
+
+        for label, listing in (("entities", via_entities), ("projection", via_projection)):
+            started = time.perf_counter()
+            count = await listing()
+            elapsed = time.perf_counter() - started
+            print(f"list {count} rows {label:<12} {elapsed * 1000:8.1f} ms  ({elapsed * 1_000_000 / count:.2f} µs/row)")
+
+        await repository._db_connection.close()
+    DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
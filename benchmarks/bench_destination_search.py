@@ -0,0 +1,84 @@
+"""Benchmark: search_by_name_and_address qua FTS5 index so với LIKE '%term%' (quét toàn bảng).
+
+Chạy: python -m benchmarks.bench_destination_search [số dòng]
+
+Seed N destinations (mặc định 100k) rồi đo số lượt search/s cho cùng các term:
+"LIKE scan" chạy query cũ (SQLiteDestinationRepository._like_search_query),
+"FTS5" chạy search_by_name_and_address (MATCH + bm25).
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+STREETS = ["Nguyễn Huệ", "Lê Lợi", "Đồng Khởi", "Hai Bà Trưng", "Trần Hưng Đạo", "Điện Biên Phủ", "Võ Văn Tần"]
+DISTRICTS = ["Quận 1", "Quận 3", "Quận 5", "Bình Thạnh", "Phú Nhuận", "Thủ Đức"]
+QUERIES = [
+    ("name prefix", {"name": "Cửa hàng 4521"}),
+    ("address words", {"address": "dien bien phu binh thanh"}),
+    ("name + address", {"name": "kho 77", "address": "đồng khởi"}),
+    ("no match", {"address": "Hoàn Kiếm"}),
+]
+ROUNDS = 20
+
+
+async def _seed(repository: SQLiteDestinationRepository, rows: int) -> None:
+    async with repository._db_connection.transaction() as conn:
+        await conn.executemany(
+            "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"seed-{i}",
+                    f"{('Cửa hàng', 'Kho', 'Văn phòng')[i % 3]} {i}",
+                    f"{i % 500} {STREETS[i % len(STREETS)]}, {DISTRICTS[i % len(DISTRICTS)]}, TP.HCM",
+                    10.77,
+                    106.70,
+                    "2024-01-01T00:00:00+00:00",
+                    "2024-01-01T00:00:00+00:00",
+                )
+                for i in range(rows)
+            ],
+        )
+
+
+async def _like_search(repository: SQLiteDestinationRepository, **criteria) -> int:
+    query, params = repository._like_search_query(None, criteria.get("name"), criteria.get("address"))
+    async with repository._db_connection.read() as conn:
+        async with conn.execute(query, params) as cursor:
+            return len(await cursor.fetchall())
+
+
+async def _fts_search(repository: SQLiteDestinationRepository, **criteria) -> int:
+    return len(await repository.search_by_name_and_address(**criteria))
+
+
+async def main(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(Path(tmp) / "search.db"))
+        await create_destinations_table()
+        started = time.perf_counter()
+        await _seed(repository, rows)
+        print(f"seeded {rows} rows (with FTS triggers) in {time.perf_counter() - started:.1f}s")
+
+        for label, criteria in QUERIES:
+            for method, search in (("LIKE scan", _like_search), ("FTS5", _fts_search)):
+                started = time.perf_counter()
+                for _ in range(ROUNDS):
+                    hits = await search(repository, **criteria)
+                elapsed = time.perf_counter() - started
+                print(f"{label:<16} {method:<10} {ROUNDS / elapsed:10.1f} searches/s  hits={hits}")
+
+        await repository._db_connection.close()
+    DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,79 @@
+"""Benchmark: session-per-request so với pooled AsyncApiClient trên stub server local.
+
+Chạy: python -m benchmarks.bench_http_client [số request]
+
+Stub server chạy HTTP thuần trên localhost nên chỉ đo được chi phí TCP connect;
+với TomTom/WeatherAPI thật (TLS + RTT mạng) chênh lệch còn lớn hơn.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.http.http_method import HttpMethod
+from app.infrastructure.http.request_entity import RequestEntity
+
+PAYLOAD = {"routes": [{"summary": {"lengthInMeters": 1200, "travelTimeInSeconds": 300}}]}
+
+
+async def _handler(request: web.Request) -> web.Response:
+    return web.json_response(PAYLOAD)
+
+
+async def _session_per_request(req: RequestEntity) -> dict:
+    """Hành vi cũ của AsyncApiClient.send: tạo và đóng session cho mỗi request."""
+    timeout = aiohttp.ClientTimeout(total=req.timeout_sec)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with session.get(req.url, headers=req.headers, params=req.params) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+
+async def _measure(send, req: RequestEntity, n: int) -> list[float]:
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await send(req)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<22} n={len(samples):<6} p50={p50:7.3f} ms  p99={p99:7.3f} ms")
+
+
+async def main(n: int) -> None:
+    app = web.Application()
+    app.router.add_get("/routing", _handler)
+    async with TestServer(app) as server:
+        req = RequestEntity(
+            method=HttpMethod.GET,
+            url=str(server.make_url("/routing")),
+            headers={"Accept": "application/json"},
+            params={"key": "bench"},
+            json=None,
+            timeout_sec=5,
+        )
+        client = AsyncApiClient()
+        try:
+            # Warm-up cả hai đường đi để loại bỏ chi phí import/khởi tạo lần đầu
+            await _measure(_session_per_request, req, 20)
+            await _measure(client.send, req, 20)
+
+            _report("session-per-request", await _measure(_session_per_request, req, n))
+            _report("pooled session", await _measure(client.send, req, n))
+        finally:
+            await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,89 @@
+"""Benchmark: list_destinations một trang (keyset) / iter_all so với list_all toàn bảng.
+
+Chạy: python -m benchmarks.bench_list_destinations [số dòng]
+
+Seed N destinations (mặc định 100k) rồi đo thời gian và bộ nhớ đỉnh (tracemalloc) của:
+"list_all" (fetchall + entity cho mọi dòng), "list_page" (trang đầu / trang giữa, 50 dòng)
+và "iter_all" (duyệt toàn bộ theo từng trang 500 dòng, không giữ entity).
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+PAGE_SIZE = 50
+
+
+async def _seed(repository: SQLiteDestinationRepository, rows: int) -> None:
+    async with repository._db_connection.transaction() as conn:
+        await conn.executemany(
+            "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"seed-{i:06d}",
+                    f"Điểm {i}",
+                    f"{i} Đường số {i % 100}, TP.HCM",
+                    10.77,
+                    106.70,
+                    f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}+00:00",
+                    "2024-01-02T00:00:00+00:00",
+                )
+                for i in range(rows)
+            ],
+        )
+
+
+async def _measure(label: str, work) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await work()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {elapsed_ms:10.1f} ms  peak {peak / 1024 / 1024:8.2f} MiB  rows={result}")
+
+
+async def main(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(Path(tmp) / "list.db"))
+        await create_destinations_table()
+        await _seed(repository, rows)
+        print(f"seeded {rows} rows")
+
+        async def list_all() -> int:
+            return len(await repository.list_all())
+
+        async def first_page() -> int:
+            return len((await repository.list_page(PAGE_SIZE))[0])
+
+        _, middle = await repository.list_page(rows // 2)
+
+        async def middle_page() -> int:
+            return len((await repository.list_page(PAGE_SIZE, middle))[0])
+
+        async def iter_all() -> int:
+            count = 0
+            async for _ in repository.iter_all(chunk_size=500):
+                count += 1
+            return count
+
+        await _measure("list_all", list_all)
+        await _measure("list_page (first)", first_page)
+        await _measure("list_page (middle)", middle_page)
+        await _measure("iter_all (500/chunk)", iter_all)
+
+        await repository._db_connection.close()
+    DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,91 @@
+"""Benchmark: find_nearby qua R*Tree index so với list_all + haversine (quét toàn bảng).
+
+Chạy: python -m benchmarks.bench_nearby_destinations [số dòng]
+
+Seed N destinations (mặc định 100k) rải ngẫu nhiên trên lãnh thổ Việt Nam rồi đo thời gian
+mỗi query: "list_all scan" đọc mọi dòng và sắp xếp theo khoảng cách, "R*Tree" chạy find_nearby
+(k-nearest và theo bán kính).
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+CENTERS = [
+    ("TP.HCM", LatLon(10.7769, 106.7009)),
+    ("Hà Nội", LatLon(21.0285, 105.8542)),
+    ("biển Đông", LatLon(12.0, 113.0)),
+]
+QUERIES = [
+    ("k=10", {"limit": 10}),
+    ("k=1", {"limit": 1}),
+    ("r=5km k=100", {"limit": 100, "radius_m": 5_000}),
+]
+ROUNDS = 200
+SCAN_ROUNDS = 3
+
+
+async def _seed(repository: SQLiteDestinationRepository, rows: int) -> None:
+    rng = random.Random(42)
+    async with repository._db_connection.transaction() as conn:
+        await conn.executemany(
+            "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"seed-{i}",
+                    f"Điểm {i}",
+                    f"{i} Đường số {i % 100}",
+                    rng.uniform(8.5, 23.3),
+                    rng.uniform(102.1, 109.5),
+                    "2024-01-01T00:00:00+00:00",
+                    "2024-01-01T00:00:00+00:00",
+                )
+                for i in range(rows)
+            ],
+        )
+
+
+async def _scan(repository: SQLiteDestinationRepository, center: LatLon, limit: int, radius_m: float = None) -> int:
+    distances = [(center.distance_to(d.coordinates), d) for d in await repository.list_all()]
+    if radius_m is not None:
+        distances = [item for item in distances if item[0] <= radius_m]
+    return len(sorted(distances, key=lambda item: item[0])[:limit])
+
+
+async def _rtree(repository: SQLiteDestinationRepository, center: LatLon, limit: int, radius_m: float = None) -> int:
+    return len(await repository.find_nearby(center, limit=limit, radius_m=radius_m))
+
+
+async def main(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(Path(tmp) / "nearby.db"))
+        await create_destinations_table()
+        started = time.perf_counter()
+        await _seed(repository, rows)
+        print(f"seeded {rows} rows (with R*Tree triggers) in {time.perf_counter() - started:.1f}s")
+
+        for place, center in CENTERS:
+            for label, criteria in QUERIES:
+                for method, find, rounds in (("list_all scan", _scan, SCAN_ROUNDS), ("R*Tree", _rtree, ROUNDS)):
+                    started = time.perf_counter()
+                    for _ in range(rounds):
+                        hits = await find(repository, center, **criteria)
+                    elapsed_ms = (time.perf_counter() - started) * 1000 / rounds
+                    print(f"{place:<10} {label:<12} {method:<14} {elapsed_ms:10.3f} ms/query  hits={hits}")
+
+        await repository._db_connection.close()
+    DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,130 @@
+"""Benchmark: SQLiteDestinationRepository với kết nối mở lại mỗi lần so với kết nối dùng chung (WAL + pragmas).
+
+Chạy: python -m benchmarks.bench_sqlite_repository [số thao tác]
+
+"reopen per call" tái hiện hành vi cũ: DatabaseConnection đóng kết nối sau mỗi lần
+`async with` và dùng pragmas mặc định của SQLite (rollback journal, synchronous=FULL).
+"concurrent reads" đo search_by_name_and_address (bảng SEED_ROWS dòng) từ nhiều
+coroutine đồng thời trong khi có writer chạy nền, với read pool tắt (mọi thao tác qua một
+thread) so với read pool 4 kết nối - SQLite nhả GIL khi chạy query nên các reader chạy song song.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+LEGACY_CONFIG = SQLiteConfig(
+    journal_mode="DELETE", synchronous="FULL", cache_size_kib=2000, mmap_size_bytes=0, read_pool_size=0
+)
+READERS = 8
+SEED_ROWS = 20000
+
+
+def _destination(i: int) -> Destination:
+    now = datetime.now(timezone.utc)
+    return Destination(
+        id=None,
+        name=DestinationName(f"Điểm {i}"),
+        address=Address(f"{i} Nguyễn Huệ, Quận 1, TP.HCM"),
+        coordinates=LatLon(10.77 + i * 1e-5, 106.70 + i * 1e-5),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def _ops_per_sec(label: str, n: int, op: Callable[[int], Awaitable[object]]) -> None:
+    started = time.perf_counter()
+    for i in range(n):
+        await op(i)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} n={n:<6} {n / elapsed:10.0f} ops/s")
+
+
+async def _run(label: str, path: Path, config: SQLiteConfig, reopen: bool, n: int) -> None:
+    DatabaseConnection.reset_instance()
+    repository = SQLiteDestinationRepository(str(path), config)
+    db = DatabaseConnection.get_instance(str(path))
+    await create_destinations_table()
+
+    async def call(fn):
+        try:
+            return await fn
+        finally:
+            if reopen:
+                await db.close()
+
+    saved = []
+
+    async def save(i: int):
+        saved.append(await call(repository.save(_destination(i))))
+
+    await _ops_per_sec(f"{label}: save", n, save)
+    await _ops_per_sec(f"{label}: find_by_id", n, lambda i: call(repository.find_by_id(saved[i].id)))
+    await _ops_per_sec(f"{label}: search_by_address", n, lambda i: call(
+        repository.search_by_name_and_address(address=f"{i} Nguyễn Huệ")
+    ))
+    await db.close()
+
+
+async def _run_concurrent_reads(label: str, path: Path, config: SQLiteConfig, n: int) -> None:
+    DatabaseConnection.reset_instance()
+    repository = SQLiteDestinationRepository(str(path), config)
+    db = DatabaseConnection.get_instance(str(path))
+    await create_destinations_table()
+    async with db.transaction() as conn:
+        await conn.executemany(
+            "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (f"seed-{i}", f"Seed {i}", f"{i} Hai Bà Trưng, Quận 3", 10.78, 106.69, "2024-01-01", "2024-01-01")
+                for i in range(SEED_ROWS)
+            ],
+        )
+
+    async def writer():
+        i = 0
+        while True:
+            await repository.save(_destination(i))
+            i += 1
+
+    async def reader(offset: int):
+        for i in range(n // READERS):
+            await repository.search_by_name_and_address(address=f"{(offset * 97 + i) % SEED_ROWS} Hai")
+
+    background = asyncio.create_task(writer())
+    started = time.perf_counter()
+    await asyncio.gather(*(reader(r) for r in range(READERS)))
+    elapsed = time.perf_counter() - started
+    background.cancel()
+    await asyncio.gather(background, return_exceptions=True)
+    print(f"{label:<34} n={n:<6} {n / elapsed:10.0f} searches/s ({READERS} readers + 1 writer)")
+    await db.close()
+
+
+async def main(n: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        await _run("reopen per call", Path(tmp) / "legacy.db", LEGACY_CONFIG, True, n)
+        await _run("shared connection", Path(tmp) / "shared.db", SQLiteConfig(), False, n)
+        reads = max(READERS, n // 5)
+        await _run_concurrent_reads("concurrent reads, no read pool", Path(tmp) / "single.db",
+                                    SQLiteConfig(read_pool_size=0), reads)
+        await _run_concurrent_reads("concurrent reads, read pool", Path(tmp) / "pooled.db",
+                                    SQLiteConfig(read_pool_size=4), reads)
+    DatabaseConnection.reset_instance()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
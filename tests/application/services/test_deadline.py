@@ -0,0 +1,60 @@
+"""Tests cho Deadline và deadline_scope."""
+
+import asyncio
+
+import pytest
+
+from app.application.services.deadline import Deadline, current_deadline, deadline_scope
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadline:
+    """Test suite cho Deadline."""
+
+    def test_remaining_and_budget_checks(self):
+        clock = FakeClock()
+        deadline = Deadline(5.0, clock)
+
+        clock.now += 3.0
+        assert deadline.remaining() == pytest.approx(2.0)
+        assert deadline.has_at_least(2.0)
+        assert not deadline.has_at_least(2.5)
+
+        clock.now += 10.0
+        assert deadline.remaining() == 0.0
+        assert deadline.expired
+
+
+class TestDeadlineScope:
+    """Test suite cho deadline_scope."""
+
+    @pytest.mark.asyncio
+    async def test_scope_propagates_to_child_tasks_and_resets(self):
+        assert current_deadline() is None
+
+        with deadline_scope(5.0) as deadline:
+            child = await asyncio.create_task(self._read_deadline())
+
+            assert child is deadline
+
+        assert current_deadline() is None
+
+    def test_nested_scope_keeps_tighter_outer_deadline(self):
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(10.0) as inner:
+                assert inner is outer
+            with deadline_scope(0.5) as tighter:
+                assert tighter is not outer
+                assert current_deadline() is tighter
+            assert current_deadline() is outer
+
+    @staticmethod
+    async def _read_deadline():
+        return current_deadline()
@@ -0,0 +1,173 @@
+"""Tests cho DestinationWriteBehind."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.application.services.destination_write_behind import DestinationWriteBehind
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
+
+from tests.fixtures.destinations import make_destination
+
+
+class RecordingRepository(MemoryDestinationRepository):
+    """Memory repository ghi lại từng lô save_many."""
+
+    def __init__(self, delay_sec: float = 0.0):
+        super().__init__()
+        self.batches: List[int] = []
+        self._delay_sec = delay_sec
+
+    async def save_many(self, destinations):
+        await asyncio.sleep(self._delay_sec)
+        self.batches.append(len(destinations))
+        return await super().save_many(destinations)
+
+
+class TestDestinationWriteBehind:
+    """Test suite cho DestinationWriteBehind."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_flushes_on_timer(self):
+        repository = RecordingRepository()
+        writer = DestinationWriteBehind(repository, flush_interval_sec=0.02)
+
+        writer.submit(make_destination("1 Lê Lợi"))
+        writer.submit(make_destination("2 Lê Lợi"))
+        assert repository.batches == []
+
+        await asyncio.sleep(0.05)
+
+        assert repository.batches == [2]
+        assert len(await repository.list_all()) == 2
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_coalesced_by_normalized_address(self):
+        repository = RecordingRepository()
+        writer = DestinationWriteBehind(repository, flush_interval_sec=10)
+
+        writer.submit(make_destination("1 Lê Lợi", coordinates=LatLon(10.0, 106.70)))
+        writer.submit(make_destination("  1 LÊ LỢI ", coordinates=LatLon(11.0, 106.70)))
+
+        assert writer.pending("1 lê lợi").coordinates.lat == 11.0
+        await writer.close()
+        assert repository.batches == [1]
+        assert writer.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_early_flush(self):
+        repository = RecordingRepository()
+        writer = DestinationWriteBehind(repository, flush_interval_sec=10, max_batch_size=3)
+
+        for i in range(3):
+            writer.submit(make_destination(f"{i} Lê Lợi"))
+        await asyncio.sleep(0.01)
+
+        assert repository.batches == [3]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_drains_in_flight_and_pending_writes(self):
+        repository = RecordingRepository(delay_sec=0.02)
+        writer = DestinationWriteBehind(repository, flush_interval_sec=0.01)
+
+        writer.submit(make_destination("1 Lê Lợi"))
+        await asyncio.sleep(0.015)  # lô đầu đang ghi
+        writer.submit(make_destination("2 Lê Lợi"))
+        await writer.close()
+
+        assert sum(repository.batches) == 2
+        assert writer.stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_batch_stays_visible_until_committed(self):
+        repository = RecordingRepository(delay_sec=0.05)
+        writer = DestinationWriteBehind(repository, flush_interval_sec=10)
+        writer.submit(make_destination("1 Lê Lợi"))
+
+        flush = asyncio.create_task(writer.flush())
+        await asyncio.sleep(0.01)  # save_many chưa commit
+
+        assert await repository.find_by_address("1 Lê Lợi") is None
+        assert writer.pending("1 Lê Lợi") is not None
+        await flush
+        assert writer.pending("1 Lê Lợi") is None
+        assert await repository.find_by_address("1 Lê Lợi") is not None
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_requeued_then_dropped_after_max_retries(self):
+        class FlakyRepository(MemoryDestinationRepository):
+            def __init__(self, failures: int):
+                super().__init__()
+                self.failures = failures
+
+            async def save_many(self, destinations):
+                if self.failures > 0:
+                    self.failures -= 1
+                    raise RuntimeError("database is locked")
+                return await super().save_many(destinations)
+
+        repository = FlakyRepository(failures=1)
+        writer = DestinationWriteBehind(repository, flush_interval_sec=10, max_retries=2)
+        writer.submit(make_destination("1 Lê Lợi"))
+
+        assert await writer.flush() == 0
+        assert writer.pending("1 Lê Lợi") is not None
+        assert await writer.flush() == 1
+        assert writer.stats()["failed"] == 0
+
+        repository.failures = 10
+        writer.submit(make_destination("2 Lê Lợi"))
+        for _ in range(3):
+            assert await writer.flush() == 0
+
+        assert writer.pending("2 Lê Lợi") is None
+        assert writer.stats()["requeued"] == 3
+        assert writer.stats()["failed"] == 1
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_newer_submission(self):
+        class SlowFailingRepository(MemoryDestinationRepository):
+            async def save_many(self, destinations):
+                await asyncio.sleep(0.02)
+                raise RuntimeError("database is locked")
+
+        writer = DestinationWriteBehind(SlowFailingRepository(), flush_interval_sec=10)
+        writer.submit(make_destination("1 Lê Lợi", coordinates=LatLon(10.0, 106.70)))
+        flush = asyncio.create_task(writer.flush())
+        await asyncio.sleep(0.005)
+        writer.submit(make_destination("1 Lê Lợi", coordinates=LatLon(11.0, 106.70)))
+        await flush
+
+        assert writer.pending("1 Lê Lợi").coordinates.lat == 11.0
+        assert writer.stats()["requeued"] == 0
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_writer_does_not_poll(self):
+        class CountingWriteBehind(DestinationWriteBehind):
+            flushes = 0
+
+            async def flush(self) -> int:
+                self.flushes += 1
+                return await super().flush()
+
+        repository = RecordingRepository()
+        writer = CountingWriteBehind(repository, flush_interval_sec=0.005)
+        writer.submit(make_destination("1 Lê Lợi"))
+        await asyncio.sleep(0.02)
+        flushes_after_write = writer.flushes
+
+        await asyncio.sleep(0.05)  # ~10 flush interval khi rỗng
+        assert writer.flushes == flushes_after_write
+        assert repository.batches == [1]
+
+        writer.submit(make_destination("2 Lê Lợi"))
+        await asyncio.sleep(0.02)
+        assert repository.batches == [1, 1]
+        await writer.close()
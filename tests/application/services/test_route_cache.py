@@ -0,0 +1,168 @@
+"""
+Tests for RouteResultCache.
+"""
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto.calculate_route_dto import RoutePlan, RouteSummary
+from app.application.dto.traffic_dto import RouteWithTrafficResult, TrafficResponse
+from app.application.dto.delete_destination_dto import DeleteDestinationRequest
+from app.application.dto.geocoding_dto import AddressDTO, GeocodeResponseDTO, GeocodingResultDTO
+from app.application.dto.update_destination_dto import UpdateDestinationRequest
+from app.application.services.route_cache import CachedRoute, RouteResultCache
+from app.application.use_cases.delete_destination import DeleteDestinationUseCase
+from app.application.use_cases.update_destination import UpdateDestinationUseCase
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+def _cached_route(total_delay_seconds: int) -> CachedRoute:
+    return CachedRoute(
+        route=RouteWithTrafficResult(
+            route_plan=RoutePlan(summary=RouteSummary(distance_m=1000, duration_s=120), sections=[]),
+            traffic=TrafficResponse(
+                success=True,
+                traffic_sections=[],
+                total_delay_seconds=total_delay_seconds,
+                total_traffic_length_meters=0
+            )
+        )
+    )
+
+
+class TestRouteResultCache:
+    """Test cases for RouteResultCache."""
+
+    def test_nearby_coordinates_share_a_key_within_a_departure_bucket(self):
+        now = [1_000.0]
+        cache = RouteResultCache(LruTtlCache(), departure_bucket_sec=300, coordinate_precision=4, clock=lambda: now[0])
+        origin, destination = LatLon(10.77691, 106.70091), LatLon(10.8231, 106.6297)
+
+        key = cache.make_key(origin, destination, "car", "vi-VN")
+        assert cache.make_key(LatLon(10.77689, 106.70089), destination, "CAR", "VI-vn") == key
+        assert cache.make_key(origin, destination, "bicycle", "vi-VN") != key
+
+        now[0] = 1_250.0
+        assert cache.make_key(origin, destination, "car", "vi-VN") != key
+
+    def test_ttl_shrinks_as_traffic_delay_grows(self):
+        cache = RouteResultCache(LruTtlCache(), min_ttl_sec=60, max_ttl_sec=600, heavy_delay_sec=600)
+
+        assert cache.ttl_for(0) == 600
+        assert cache.ttl_for(300) == 330
+        assert cache.ttl_for(3600) == 60
+
+    def test_put_get_and_stats(self):
+        cache = RouteResultCache(LruTtlCache(), clock=lambda: 0.0)
+        key = cache.make_key(LatLon(10.0, 106.0), LatLon(10.1, 106.1), "car", "vi-VN")
+
+        assert cache.get(key) is None
+        assert cache.put(key, _cached_route(0)) == 600
+        assert cache.get(key) is not None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_free_flow_entry_is_hit_for_its_full_ttl_with_default_settings(self):
+        now = [3_600.0]  # đầu một departure bucket
+        clock = lambda: now[0]
+        cache = RouteResultCache(LruTtlCache(clock=clock), clock=clock)
+        origin, destination = LatLon(10.0, 106.0), LatLon(10.1, 106.1)
+
+        assert cache.put(cache.make_key(origin, destination, "car", "vi-VN"), _cached_route(0)) == 600
+
+        now[0] += 300  # quá departure bucket 300s cũ
+        assert cache.get(cache.make_key(origin, destination, "car", "vi-VN")) is not None
+        now[0] += 301
+        assert cache.get(cache.make_key(origin, destination, "car", "vi-VN")) is None
+
+    def test_ttl_is_capped_by_time_left_in_departure_bucket(self):
+        now = [1_700.0]
+        clock = lambda: now[0]
+        cache = RouteResultCache(LruTtlCache(clock=clock), departure_bucket_sec=1800, clock=clock)
+        key = cache.make_key(LatLon(10.0, 106.0), LatLon(10.1, 106.1), "car", "vi-VN")
+
+        assert cache.put(key, _cached_route(0)) == 100
+
+        stale_key = cache.make_key(LatLon(10.2, 106.2), LatLon(10.1, 106.1), "car", "vi-VN")
+        now[0] = 1_800.0  # bucket của key đã kết thúc: không lưu entry không bao giờ được đọc
+        assert cache.put(stale_key, _cached_route(0)) == 0
+        assert cache.stats()["size"] == 1
+
+    def test_invalidate_by_endpoint(self):
+        cache = RouteResultCache(LruTtlCache())
+        a, b, c = LatLon(10.0, 106.0), LatLon(10.1, 106.1), LatLon(10.2, 106.2)
+        cache.put(cache.make_key(a, b, "car", "vi-VN"), _cached_route(0))
+        cache.put(cache.make_key(a, c, "car", "vi-VN"), _cached_route(0))
+        cache.put(cache.make_key(b, c, "car", "vi-VN"), _cached_route(0))
+
+        assert cache.invalidate(origin=a) == 2
+        assert cache.invalidate(destination=c) == 1
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate_endpoint_removes_routes_from_and_to_point(self):
+        cache = RouteResultCache(LruTtlCache())
+        a, b, c = LatLon(10.0, 106.0), LatLon(10.1, 106.1), LatLon(10.2, 106.2)
+        cache.put(cache.make_key(a, b, "car", "vi-VN"), _cached_route(0))
+        cache.put(cache.make_key(b, c, "car", "vi-VN"), _cached_route(0))
+        cache.put(cache.make_key(a, c, "car", "vi-VN"), _cached_route(0))
+
+        assert cache.invalidate_endpoint(b) == 2
+        assert cache.stats()["size"] == 1
+
+
+class TestRouteCacheInvalidationOnDestinationWrites:
+    """Route cache entries touching a saved destination are dropped when it changes."""
+
+    HOME, OFFICE, NEW_HOME = LatLon(10.0, 106.0), LatLon(10.1, 106.1), LatLon(10.2, 106.2)
+
+    @pytest.fixture
+    def route_cache(self):
+        cache = RouteResultCache(LruTtlCache())
+        cache.put(cache.make_key(self.HOME, self.OFFICE, "car", "vi-VN"), _cached_route(0))
+        cache.put(cache.make_key(self.OFFICE, self.NEW_HOME, "car", "vi-VN"), _cached_route(0))
+        return cache
+
+    async def _repository_with_home(self) -> MemoryDestinationRepository:
+        repository = MemoryDestinationRepository()
+        now = datetime.now(timezone.utc)
+        await repository.save(Destination(
+            id="home",
+            name=DestinationName("Nhà"),
+            address=Address("1 Lê Lợi, Quận 1"),
+            coordinates=self.HOME,
+            created_at=now,
+            updated_at=now
+        ))
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_routes_of_deleted_destination(self, route_cache):
+        repository = await self._repository_with_home()
+        use_case = DeleteDestinationUseCase(repository, route_cache=route_cache)
+
+        result = await use_case.execute(DeleteDestinationRequest(destination_id="home"))
+
+        assert result.success is True
+        assert route_cache.stats()["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_address_update_invalidates_old_and_new_coordinates(self, route_cache):
+        repository = await self._repository_with_home()
+        geocoding_provider = AsyncMock()
+        geocoding_provider.geocode_address.return_value = GeocodeResponseDTO(results=[
+            GeocodingResultDTO(position=self.NEW_HOME, address=AddressDTO(freeform_address="9 Hai Bà Trưng"))
+        ])
+        use_case = UpdateDestinationUseCase(repository, geocoding_provider, route_cache=route_cache)
+
+        result = await use_case.execute(UpdateDestinationRequest(destination_id="home", address="9 Hai Bà Trưng"))
+
+        assert result.success is True
+        assert route_cache.stats()["size"] == 0
@@ -0,0 +1,71 @@
+"""Tests cho SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from app.application.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite cho SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_with_same_key_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_completed_key_is_not_cached(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", work) == 1
+        assert await flight.do("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_by_all_waiters(self):
+        flight = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_does_not_cancel_the_others(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.03)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
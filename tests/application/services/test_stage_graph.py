@@ -0,0 +1,59 @@
+"""
+Tests for StageGraph.
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.application.services.stage_graph import StageGraph
+
+
+class TestStageGraph:
+    """Test cases for StageGraph."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """Independent stages overlap, so wall-clock follows the critical path."""
+        async def slow(value):
+            await asyncio.sleep(0.05)
+            return value
+
+        async def combine(a, b):
+            return a + b
+
+        graph = (
+            StageGraph()
+            .add("a", lambda: slow(1))
+            .add("b", lambda: slow(2))
+            .add("sum", combine, deps=("a", "b"))
+        )
+
+        started = time.perf_counter()
+        results = await graph.run()
+        elapsed = time.perf_counter() - started
+
+        assert results == {"a": 1, "b": 2, "sum": 3}
+        assert elapsed < 0.09
+        assert set(graph.timings_ms) == {"a", "b", "sum"}
+        assert graph.timings_ms["a"] >= 40
+
+    def test_unknown_dependency_rejected(self):
+        """Dependencies must be registered before the stage using them."""
+        graph = StageGraph()
+        with pytest.raises(ValueError):
+            graph.add("route", lambda origin: origin, deps=("origin",))
+
+    @pytest.mark.asyncio
+    async def test_stage_error_is_reraised_unwrapped(self):
+        """The first failing stage's exception surfaces as-is, not as an ExceptionGroup."""
+        async def boom():
+            raise KeyError("missing")
+
+        async def never(failed):
+            return failed
+
+        graph = StageGraph().add("failed", boom).add("after", never, deps=("failed",))
+
+        with pytest.raises(KeyError):
+            await graph.run()
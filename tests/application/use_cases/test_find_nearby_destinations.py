@@ -0,0 +1,116 @@
+"""Test cases for FindNearbyDestinationsUseCase."""
+
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime, timezone
+
+from app.application.dto.find_nearby_dto import FindNearbyDestinationsRequest
+from app.application.dto.geocoding_dto import GeocodeResponseDTO, GeocodingResultDTO, AddressDTO
+from app.application.use_cases.find_nearby_destinations import FindNearbyDestinationsUseCase
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+
+
+class TestFindNearbyDestinationsUseCase:
+    """Test cases for FindNearbyDestinationsUseCase."""
+    
+    @pytest.fixture
+    def mock_destination_repository(self):
+        """Mock destination repository."""
+        return AsyncMock()
+    
+    @pytest.fixture
+    def mock_geocoding_provider(self):
+        """Mock geocoding provider."""
+        return AsyncMock()
+    
+    @pytest.fixture
+    def use_case(self, mock_destination_repository, mock_geocoding_provider):
+        """Create use case with mocked dependencies."""
+        return FindNearbyDestinationsUseCase(
+            destination_repository=mock_destination_repository,
+            geocoding_provider=mock_geocoding_provider
+        )
+    
+    @pytest.fixture
+    def sample_destination(self):
+        """Sample destination entity."""
+        return Destination(
+            id="dest-1",
+            name=DestinationName("Nhà thờ Đức Bà"),
+            address=Address("01 Công xã Paris, Quận 1"),
+            coordinates=LatLon(10.7798, 106.6990),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_find_nearby_by_coordinates(self, use_case, mock_destination_repository, mock_geocoding_provider, sample_destination):
+        """Test nearby search around given coordinates."""
+        # Arrange
+        mock_destination_repository.find_nearby.return_value = [(sample_destination, 818.04)]
+        request = FindNearbyDestinationsRequest(latitude=10.7725, longitude=106.6980, radius_meters=2000, limit=5)
+        
+        # Act
+        result = await use_case.execute(request)
+        
+        # Assert
+        assert result.success is True
+        assert result.total_count == 1
+        assert result.destinations[0].id == "dest-1"
+        assert result.destinations[0].distance_meters == 818.0
+        assert (result.center_latitude, result.center_longitude) == (10.7725, 106.6980)
+        mock_destination_repository.find_nearby.assert_called_once_with(LatLon(10.7725, 106.6980), limit=5, radius_m=2000)
+        mock_geocoding_provider.geocode_address.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_find_nearby_by_address_geocodes_center(self, use_case, mock_destination_repository, mock_geocoding_provider):
+        """Test address is geocoded when coordinates are not given."""
+        # Arrange
+        mock_geocoding_provider.geocode_address.return_value = GeocodeResponseDTO(results=[
+            GeocodingResultDTO(position=LatLon(10.7725, 106.6980), address=AddressDTO(freeform_address="Chợ Bến Thành"))
+        ])
+        mock_destination_repository.find_nearby.return_value = []
+        
+        # Act
+        result = await use_case.execute(FindNearbyDestinationsRequest(address="Chợ Bến Thành"))
+        
+        # Assert
+        assert result.success is True
+        assert result.destinations == []
+        assert mock_geocoding_provider.geocode_address.call_args[0][0].address == "Chợ Bến Thành"
+        mock_destination_repository.find_nearby.assert_called_once_with(LatLon(10.7725, 106.6980), limit=10, radius_m=None)
+    
+    @pytest.mark.asyncio
+    async def test_find_nearby_address_not_found(self, use_case, mock_destination_repository, mock_geocoding_provider):
+        """Test error when the center address cannot be geocoded."""
+        # Arrange
+        mock_geocoding_provider.geocode_address.return_value = GeocodeResponseDTO(results=[])
+        
+        # Act
+        result = await use_case.execute(FindNearbyDestinationsRequest(address="Không tồn tại"))
+        
+        # Assert
+        assert result.success is False
+        assert "Could not find coordinates" in result.error
+        mock_destination_repository.find_nearby.assert_not_called()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_kwargs", [
+        {"latitude": 10.0, "longitude": 106.0, "limit": 0},
+        {"latitude": 10.0, "longitude": 106.0, "limit": 101},
+        {"latitude": 10.0, "longitude": 106.0, "radius_meters": -1},
+        {"latitude": 95.0, "longitude": 106.0},
+        {},
+    ])
+    async def test_find_nearby_validation_error(self, use_case, mock_destination_repository, request_kwargs):
+        """Test invalid limit, radius, coordinates or missing center."""
+        # Act
+        result = await use_case.execute(FindNearbyDestinationsRequest(**request_kwargs))
+        
+        # Assert
+        assert result.success is False
+        assert result.error.startswith("Validation error")
+        mock_destination_repository.find_nearby.assert_not_called()
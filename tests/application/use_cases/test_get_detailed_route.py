@@ -0,0 +1,248 @@
+"""Test cases for GetDetailedRouteUseCase."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.constants.validation_constants import DefaultValues
+from app.application.dto.calculate_route_dto import RouteLeg, RoutePlan, RouteSummary
+from app.application.dto.detailed_route_dto import DetailedRouteRequest
+from app.application.dto.geocoding_dto import AddressDTO, GeocodeResponseDTO, GeocodingResultDTO
+from app.application.dto.traffic_dto import (
+    GeocodedAddress,
+    ReverseGeocodeResponse,
+    RouteWithTrafficResult,
+    TrafficResponse,
+    TrafficSection,
+)
+from app.application.services.deadline import deadline_scope
+from app.application.services.destination_write_behind import DestinationWriteBehind
+from app.application.services.route_cache import RouteResultCache
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.application.use_cases.get_detailed_route import GetDetailedRouteUseCase
+from app.domain.value_objects.latlon import LatLon
+
+
+class TestGetDetailedRouteUseCase:
+    """Test cases for GetDetailedRouteUseCase."""
+
+    @pytest.fixture
+    def mock_destination_repository(self):
+        """Mock destination repository without saved destinations."""
+        repository = AsyncMock()
+        repository.find_by_address.return_value = None
+        return repository
+
+    @pytest.fixture
+    def mock_geocoding_provider(self):
+        """Mock geocoding provider that takes 50ms per call."""
+        async def geocode(cmd):
+            await asyncio.sleep(0.05)
+            return GeocodeResponseDTO(
+                results=[
+                    GeocodingResultDTO(
+                        position=LatLon(10.7769, 106.7009),
+                        address=AddressDTO(freeform_address=cmd.address)
+                    )
+                ]
+            )
+
+        provider = AsyncMock()
+        provider.geocode_address.side_effect = geocode
+        return provider
+
+    @pytest.fixture
+    def mock_routing_provider(self):
+        """Mock routing provider returning one traffic section."""
+        points = [LatLon(10.7769, 106.7009), LatLon(10.80, 106.66), LatLon(10.8231, 106.6297)]
+        provider = AsyncMock()
+        provider.calculate_route_with_traffic.return_value = RouteWithTrafficResult(
+            route_plan=RoutePlan(
+                summary=RouteSummary(distance_m=12000, duration_s=1500),
+                sections=[],
+                legs=[RouteLeg(points=points)]
+            ),
+            traffic=TrafficResponse(
+                success=True,
+                traffic_sections=[
+                    TrafficSection(
+                        section_type="TRAFFIC",
+                        start_point_index=0,
+                        end_point_index=2,
+                        simple_category="JAM",
+                        effective_speed_kmh=12.0,
+                        delay_seconds=300,
+                        magnitude_of_delay=3
+                    )
+                ],
+                total_delay_seconds=300,
+                total_traffic_length_meters=800
+            )
+        )
+        return provider
+
+    @pytest.fixture
+    def mock_reverse_geocode_provider(self):
+        """Mock reverse geocode provider."""
+        provider = AsyncMock()
+        provider.reverse_geocode.return_value = ReverseGeocodeResponse(
+            success=True,
+            addresses=[
+                GeocodedAddress(coordinate=LatLon(10.7769, 106.7009), address="A", freeform_address="Start street"),
+                GeocodedAddress(coordinate=LatLon(10.8231, 106.6297), address="B", freeform_address="End street"),
+            ]
+        )
+        return provider
+
+    @pytest.fixture
+    def use_case(
+        self,
+        mock_destination_repository,
+        mock_geocoding_provider,
+        mock_routing_provider,
+        mock_reverse_geocode_provider
+    ):
+        """Create use case with mocked dependencies."""
+        return GetDetailedRouteUseCase(
+            destination_repository=mock_destination_repository,
+            geocoding_provider=mock_geocoding_provider,
+            routing_provider=mock_routing_provider,
+            reverse_geocode_provider=mock_reverse_geocode_provider
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_geocodes_origin_and_destination_concurrently(self, use_case, mock_geocoding_provider):
+        """Origin and destination geocoding overlap instead of running back to back."""
+        request = DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp")
+
+        started = time.perf_counter()
+        result = await use_case.execute(request)
+        elapsed = time.perf_counter() - started
+
+        assert mock_geocoding_provider.geocode_address.await_count == 2
+        assert elapsed < 0.09
+        assert result.main_route.total_distance_meters == 12000
+        assert result.main_route.sections[0].start_address == "Start street"
+        assert result.main_route.sections[0].end_address == "End street"
+        assert set(result.stage_timings_ms) == {"origin", "destination", "cached", "route", "sections", "instructions"}
+
+    @pytest.mark.asyncio
+    async def test_repeated_route_is_served_from_route_cache(
+        self,
+        mock_destination_repository,
+        mock_geocoding_provider,
+        mock_routing_provider,
+        mock_reverse_geocode_provider
+    ):
+        """A second identical request skips routing and reverse geocoding."""
+        use_case = GetDetailedRouteUseCase(
+            destination_repository=mock_destination_repository,
+            geocoding_provider=mock_geocoding_provider,
+            routing_provider=mock_routing_provider,
+            reverse_geocode_provider=mock_reverse_geocode_provider,
+            route_cache=RouteResultCache(LruTtlCache())
+        )
+        request = DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp")
+
+        first = await use_case.execute(request)
+        second = await use_case.execute(request)
+
+        assert mock_routing_provider.calculate_route_with_traffic.await_count == 1
+        assert mock_reverse_geocode_provider.reverse_geocode.await_count == 1
+        assert second.main_route.sections == first.main_route.sections
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_coalesced(self, use_case, mock_geocoding_provider, mock_routing_provider):
+        """Identical in-flight requests (after normalization) share one pipeline run."""
+        results = await asyncio.gather(
+            use_case.execute(DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp")),
+            use_case.execute(DetailedRouteRequest(origin_address=" quận  1", destination_address="GÒ VẤP")),
+        )
+
+        assert results[0] is results[1]
+        assert mock_geocoding_provider.geocode_address.await_count == 2
+        assert mock_routing_provider.calculate_route_with_traffic.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_geocoded_destinations_are_saved_by_write_behind(
+        self,
+        mock_destination_repository,
+        mock_geocoding_provider,
+        mock_routing_provider,
+        mock_reverse_geocode_provider
+    ):
+        """Auto-saved destinations are queued instead of written on the request path."""
+        writer = DestinationWriteBehind(mock_destination_repository, flush_interval_sec=10)
+        use_case = GetDetailedRouteUseCase(
+            destination_repository=mock_destination_repository,
+            geocoding_provider=mock_geocoding_provider,
+            routing_provider=mock_routing_provider,
+            reverse_geocode_provider=mock_reverse_geocode_provider,
+            destination_writer=writer
+        )
+
+        await use_case.execute(DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp"))
+        mock_destination_repository.save.assert_not_awaited()
+        assert writer.stats()["pending"] == 2
+
+        # "Quận 1" đang chờ ghi vẫn được dùng lại, không geocode lần nữa
+        await use_case.execute(DetailedRouteRequest(origin_address="Quận 1", destination_address="Bình Thạnh"))
+        assert mock_geocoding_provider.geocode_address.await_count == 3
+
+        await writer.close()
+        mock_destination_repository.save_many.assert_awaited_once()
+        assert len(mock_destination_repository.save_many.await_args[0][0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_small_budget_skips_traffic_enrichment(self, use_case, mock_routing_provider, mock_reverse_geocode_provider):
+        """When the remaining budget is below the traffic threshold only the plain route is requested."""
+        mock_routing_provider.calculate_route_without_traffic.return_value = (
+            mock_routing_provider.calculate_route_with_traffic.return_value.route_plan
+        )
+
+        with deadline_scope(1.0):
+            result = await use_case.execute(DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp"))
+
+        assert result.degraded == ["traffic"]
+        assert mock_routing_provider.calculate_route_with_traffic.await_count == 0
+        mock_routing_provider.calculate_route_without_traffic.assert_awaited_once()
+        assert mock_routing_provider.calculate_route_without_traffic.await_args.kwargs["language"] == "vi-VN"
+        assert mock_reverse_geocode_provider.reverse_geocode.await_count == 0
+        assert result.main_route.total_distance_meters == 12000
+        assert result.main_route.sections == []
+
+    @pytest.mark.asyncio
+    async def test_slow_reverse_geocoding_is_cut_at_deadline(
+        self,
+        mock_destination_repository,
+        mock_geocoding_provider,
+        mock_routing_provider,
+        mock_reverse_geocode_provider
+    ):
+        """Reverse geocoding that outlives the budget is abandoned; sections keep unknown addresses."""
+        async def slow_reverse_geocode(cmd):
+            await asyncio.sleep(5)
+
+        mock_reverse_geocode_provider.reverse_geocode.side_effect = slow_reverse_geocode
+        route_cache = RouteResultCache(LruTtlCache())
+        use_case = GetDetailedRouteUseCase(
+            destination_repository=mock_destination_repository,
+            geocoding_provider=mock_geocoding_provider,
+            routing_provider=mock_routing_provider,
+            reverse_geocode_provider=mock_reverse_geocode_provider,
+            route_cache=route_cache,
+            min_budget_for_traffic_sec=0.1,
+            min_budget_for_section_addresses_sec=0.1
+        )
+        request = DetailedRouteRequest(origin_address="Quận 1", destination_address="Gò Vấp")
+
+        started = time.perf_counter()
+        with deadline_scope(0.3):
+            result = await use_case.execute(request)
+
+        assert time.perf_counter() - started < 0.4
+        assert result.degraded == ["section_addresses"]
+        assert result.main_route.sections[0].start_address == DefaultValues.UNKNOWN_ADDRESS
+        assert route_cache.stats()["size"] == 0  # kết quả degraded không được cache
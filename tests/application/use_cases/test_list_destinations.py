@@ -0,0 +1,85 @@
+"""Test cases for ListDestinationsUseCase."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.dto.list_destinations_dto import ListDestinationsRequest
+from app.application.dto.search_destinations_dto import DestinationSummary
+from app.application.use_cases.list_destinations import ListDestinationsUseCase
+from app.domain.value_objects.page_cursor import PageCursor
+
+
+class TestListDestinationsUseCase:
+    """Test cases for ListDestinationsUseCase."""
+    
+    @pytest.fixture
+    def mock_destination_repository(self):
+        """Mock destination repository."""
+        return AsyncMock()
+    
+    @pytest.fixture
+    def use_case(self, mock_destination_repository):
+        """Create use case with mocked dependencies."""
+        return ListDestinationsUseCase(mock_destination_repository)
+    
+    @pytest.fixture
+    def sample_summary(self):
+        """Sample destination summary."""
+        return DestinationSummary(
+            id="dest-1",
+            name="Văn phòng",
+            address="12 Lê Lợi, Quận 1",
+            latitude=10.77,
+            longitude=106.70,
+            created_at="2024-01-01T00:00:00+00:00",
+            updated_at="2024-01-01T00:00:00+00:00"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_list_first_page_returns_opaque_next_cursor(self, use_case, mock_destination_repository, sample_summary):
+        """Test first page and next_cursor encoding."""
+        # Arrange
+        next_page = PageCursor("2024-01-01T00:00:00+00:00", "dest-1")
+        mock_destination_repository.list_summary_page.return_value = ([sample_summary], next_page)
+        
+        # Act
+        result = await use_case.execute(ListDestinationsRequest(limit=1))
+        
+        # Assert
+        assert result.success is True
+        assert [d.id for d in result.destinations] == ["dest-1"]
+        assert result.total_count == 1
+        assert PageCursor.decode(result.next_cursor) == next_page
+        mock_destination_repository.list_summary_page.assert_called_once_with(1, None)
+    
+    @pytest.mark.asyncio
+    async def test_list_next_page_decodes_cursor(self, use_case, mock_destination_repository):
+        """Test cursor from the previous page is passed to the repository."""
+        # Arrange
+        after = PageCursor("2024-01-01T00:00:00+00:00", "dest-1")
+        mock_destination_repository.list_summary_page.return_value = ([], None)
+        
+        # Act
+        result = await use_case.execute(ListDestinationsRequest(cursor=after.encode()))
+        
+        # Assert
+        assert result.success is True
+        assert result.next_cursor is None
+        mock_destination_repository.list_summary_page.assert_called_once_with(50, after)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("request_kwargs", [
+        {"limit": 0},
+        {"limit": 101},
+        {"cursor": "not-a-cursor"},
+        {"cursor": "WzFd"},  # base64 của [1]
+    ])
+    async def test_list_validation_error(self, use_case, mock_destination_repository, request_kwargs):
+        """Test invalid limit or cursor."""
+        # Act
+        result = await use_case.execute(ListDestinationsRequest(**request_kwargs))
+        
+        # Assert
+        assert result.success is False
+        assert result.error.startswith("Validation error")
+        mock_destination_repository.list_summary_page.assert_not_called()
@@ -140,6 +140,27 @@ class TestSaveDestinationUseCase:
         mock_geocoding_provider.geocode_address.assert_not_called()
         mock_destination_repository.save.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_save_destination_repository_round_trips(
+        self,
+        use_case,
+        mock_destination_repository,
+        mock_geocoding_provider,
+        sample_request,
+        sample_geocode_response
+    ):
+        """Save path: một lookup theo tên rồi một UPSERT, không đọc lại bản ghi đã lưu."""
+        mock_destination_repository.find_by_name.return_value = None
+        mock_geocoding_provider.geocode_address.return_value = sample_geocode_response
+        mock_destination_repository.save.side_effect = lambda destination: destination
+
+        result = await use_case.execute(sample_request)
+
+        assert result.success is True
+        mock_destination_repository.find_by_name.assert_awaited_once_with("Nơi làm việc")
+        mock_destination_repository.save.assert_awaited_once()
+        mock_destination_repository.find_by_id.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_save_destination_geocoding_failed(
         self, 
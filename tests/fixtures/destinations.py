@@ -0,0 +1,28 @@
+"""Destination factory shared by repository, connection and write-behind tests."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+
+
+def make_destination(
+    name: str,
+    address: Optional[str] = None,
+    id: Optional[str] = None,
+    age_days: int = 0,
+    coordinates: LatLon = LatLon(10.77, 106.70),
+) -> Destination:
+    """Destination chưa lưu; address mặc định bằng name, created_at/updated_at lùi về age_days ngày trước."""
+    timestamp = datetime.now(timezone.utc) - timedelta(days=age_days)
+    return Destination(
+        id=id,
+        name=DestinationName(name),
+        address=Address(address if address is not None else name),
+        coordinates=coordinates,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
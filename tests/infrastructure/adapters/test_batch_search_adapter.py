@@ -0,0 +1,81 @@
+"""Tests cho TomTomBatchSearchAdapter."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.application.constants.validation_constants import DefaultValues
+from app.application.dto.traffic_dto import ReverseGeocodeCommand
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.http.http_method import HttpMethod
+from app.infrastructure.tomtom.adapters.batch_search_adapter import TomTomBatchSearchAdapter
+
+
+def _batch_response(req):
+    """Giả lập TomTom batch: coordinate ở vĩ độ 10.5 trả 400, còn lại trả về địa chỉ theo query."""
+    items = []
+    for item in req.json["batchItems"]:
+        query = item["query"]
+        if "0.5,106" in query:
+            items.append({"statusCode": 400, "response": {"errorText": "bad query"}})
+        else:
+            items.append({"statusCode": 200, "response": {
+                "addresses": [{"address": {"freeformAddress": query.split("?")[0]}}]
+            }})
+    return {"batchItems": items}
+
+
+class TestTomTomBatchSearchAdapter:
+    """Test suite cho TomTomBatchSearchAdapter."""
+
+    @pytest.fixture
+    def mock_http_client(self):
+        client = Mock(spec=AsyncApiClient)
+        client.send = AsyncMock(side_effect=_batch_response)
+        return client
+
+    @pytest.fixture
+    def adapter(self, mock_http_client):
+        return TomTomBatchSearchAdapter(
+            base_url="https://api.tomtom.com",
+            api_key="test_api_key",
+            http=mock_http_client,
+            timeout_sec=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_reverse_geocode_uses_one_post_and_keeps_order(self, adapter, mock_http_client):
+        a, b = LatLon(10.1, 106.1), LatLon(10.2, 106.2)
+
+        response = await adapter.reverse_geocode(ReverseGeocodeCommand(coordinates=[a, b, b, a]))
+
+        assert mock_http_client.send.await_count == 1
+        req = mock_http_client.send.call_args[0][0]
+        assert req.method is HttpMethod.POST
+        assert req.url == "https://api.tomtom.com/search/2/batch.json"
+        assert len(req.json["batchItems"]) == 2
+        assert "radius=100" in req.json["batchItems"][0]["query"]
+        assert [addr.coordinate for addr in response.addresses] == [a, b, b, a]
+        assert response.addresses[0].freeform_address == "/reverseGeocode/10.1,106.1.json"
+        assert response.success is True
+
+    @pytest.mark.asyncio
+    async def test_large_inputs_are_chunked_and_item_failures_fall_back(self, adapter, mock_http_client):
+        coords = [LatLon(10 + i / 1000, 106) for i in range(250)] + [LatLon(10.5, 106)]
+
+        response = await adapter.reverse_geocode(ReverseGeocodeCommand(coordinates=coords))
+
+        sizes = sorted(len(call.args[0].json["batchItems"]) for call in mock_http_client.send.call_args_list)
+        assert sizes == [51, 100, 100]
+        assert len(response.addresses) == 251
+        assert response.addresses[-1].freeform_address == DefaultValues.UNKNOWN_ADDRESS
+        assert response.error_message == "1 coordinates failed to geocode"
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_maps_to_unknown_addresses(self, adapter, mock_http_client):
+        mock_http_client.send.side_effect = RuntimeError("503")
+
+        response = await adapter.reverse_geocode(ReverseGeocodeCommand(coordinates=[LatLon(10.1, 106.1)]))
+
+        assert response.success is False
+        assert response.addresses[0].freeform_address == DefaultValues.UNKNOWN_ADDRESS
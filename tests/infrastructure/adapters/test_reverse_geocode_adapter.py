@@ -0,0 +1,67 @@
+"""Tests cho TomTomReverseGeocodeAdapter."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from app.application.dto.traffic_dto import ReverseGeocodeCommand
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.tomtom.adapters.reverse_geocode_adapter import TomTomReverseGeocodeAdapter
+
+
+class TestTomTomReverseGeocodeAdapter:
+    """Test suite cho TomTomReverseGeocodeAdapter."""
+
+    @pytest.fixture
+    def mock_http_client(self):
+        """Mock HTTP client trả về tên đường theo tọa độ và đếm số request đồng thời."""
+        client = Mock(spec=AsyncApiClient)
+        client.in_flight = 0
+        client.max_in_flight = 0
+
+        async def send(req):
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+            await asyncio.sleep(0.01)
+            client.in_flight -= 1
+            position = req.url.rsplit("/", 1)[-1].removesuffix(".json")
+            return {"addresses": [{"address": {"freeformAddress": f"Đường {position}"}}]}
+
+        client.send = Mock(side_effect=send)
+        return client
+
+    def _adapter(self, http, max_concurrency):
+        return TomTomReverseGeocodeAdapter(
+            base_url="https://api.tomtom.com",
+            api_key="test_api_key",
+            http=http,
+            timeout_sec=5,
+            max_concurrency=max_concurrency
+        )
+
+    @pytest.mark.asyncio
+    async def test_duplicate_coordinates_are_geocoded_once_and_order_is_kept(self, mock_http_client):
+        adapter = self._adapter(mock_http_client, max_concurrency=8)
+        a, b, c = LatLon(10.1, 106.1), LatLon(10.2, 106.2), LatLon(10.3, 106.3)
+
+        # Các section liền kề chung điểm: (a, b), (b, c)
+        response = await adapter.reverse_geocode(ReverseGeocodeCommand(coordinates=[a, b, b, c]))
+
+        assert mock_http_client.send.call_count == 3
+        assert [addr.freeform_address for addr in response.addresses] == [
+            "Đường 10.1,106.1", "Đường 10.2,106.2", "Đường 10.2,106.2", "Đường 10.3,106.3"
+        ]
+        assert [addr.coordinate for addr in response.addresses] == [a, b, b, c]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_capped(self, mock_http_client):
+        adapter = self._adapter(mock_http_client, max_concurrency=2)
+        coords = [LatLon(10 + i / 100, 106) for i in range(10)]
+
+        response = await adapter.reverse_geocode(ReverseGeocodeCommand(coordinates=coords))
+
+        assert response.success is True
+        assert mock_http_client.send.call_count == 10
+        assert mock_http_client.max_in_flight == 2
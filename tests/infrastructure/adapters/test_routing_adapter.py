@@ -0,0 +1,122 @@
+"""Tests cho TomTomRoutingAdapter."""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from app.application.dto.calculate_route_dto import CalculateRouteCommand
+from app.domain.enums.travel_mode import TravelMode
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.tomtom.adapters.routing_adapter import TomTomRoutingAdapter
+
+
+class TestTomTomRoutingAdapter:
+    """Test suite cho TomTomRoutingAdapter."""
+
+    @pytest.fixture
+    def mock_http_client(self):
+        """Mock HTTP client."""
+        return Mock(spec=AsyncApiClient)
+
+    @pytest.fixture
+    def adapter(self, mock_http_client):
+        """TomTomRoutingAdapter instance."""
+        return TomTomRoutingAdapter(
+            base_url="https://api.tomtom.com",
+            api_key="test_api_key",
+            http=mock_http_client,
+            timeout_sec=10
+        )
+
+    @pytest.fixture
+    def sample_command(self):
+        """Sample route command."""
+        return CalculateRouteCommand(
+            origin=LatLon(10.7769, 106.7009),
+            destination=LatLon(10.8231, 106.6297),
+            travel_mode=TravelMode.CAR
+        )
+
+    @pytest.fixture
+    def sample_route_response(self):
+        """Sample TomTom calculateRoute response với traffic sections."""
+        return {
+            "routes": [
+                {
+                    "summary": {"lengthInMeters": 12000, "travelTimeInSeconds": 1500, "trafficDelayInSeconds": 300},
+                    "legs": [
+                        {
+                            "points": [
+                                {"latitude": 10.7769, "longitude": 106.7009},
+                                {"latitude": 10.8000, "longitude": 106.6600},
+                                {"latitude": 10.8231, "longitude": 106.6297},
+                            ]
+                        }
+                    ],
+                    "sections": [
+                        {
+                            "sectionType": "TRAFFIC",
+                            "startPointIndex": 0,
+                            "endPointIndex": 2,
+                            "simpleCategory": "JAM",
+                            "magnitudeOfDelay": 3,
+                            "delayInSeconds": 300,
+                            "effectiveSpeedInKmh": 12,
+                        }
+                    ],
+                    "guidance": {"instructions": []},
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_calculate_route_with_traffic_uses_single_upstream_call(
+        self, adapter, mock_http_client, sample_command, sample_route_response
+    ):
+        """Route plan và traffic được suy ra từ cùng một payload."""
+        mock_http_client.send = AsyncMock(return_value=sample_route_response)
+
+        result = await adapter.calculate_route_with_traffic(sample_command, language="vi-VN")
+
+        assert mock_http_client.send.await_count == 1
+        req = mock_http_client.send.call_args[0][0]
+        assert req.params["traffic"] == "true"
+        assert req.params["sectionType"] == "traffic"
+        assert req.params["language"] == "vi-VN"
+        assert req.latency_signal is False
+
+        assert result.route_plan.summary.distance_m == 12000
+        assert result.traffic.success is True
+        assert result.traffic.total_delay_seconds == 300
+        assert len(result.traffic.traffic_sections) == 1
+        assert result.traffic_analysis is None
+
+    @pytest.mark.asyncio
+    async def test_calculate_route_with_traffic_includes_analysis_when_requested(
+        self, adapter, mock_http_client, sample_command, sample_route_response
+    ):
+        """Traffic analysis chỉ được tính khi include_analysis=True."""
+        mock_http_client.send = AsyncMock(return_value=sample_route_response)
+
+        result = await adapter.calculate_route_with_traffic(sample_command, include_analysis=True)
+
+        assert mock_http_client.send.await_count == 1
+        assert result.traffic_analysis is not None
+        assert result.traffic_analysis.total_sections == 1
+
+    @pytest.mark.asyncio
+    async def test_calculate_route_without_traffic_does_not_request_traffic(
+        self, adapter, mock_http_client, sample_command, sample_route_response
+    ):
+        """Request không traffic gửi traffic=false và không yêu cầu traffic sections."""
+        mock_http_client.send = AsyncMock(return_value=sample_route_response)
+
+        route_plan = await adapter.calculate_route_without_traffic(sample_command, language="vi-VN")
+
+        assert mock_http_client.send.await_count == 1
+        req = mock_http_client.send.call_args[0][0]
+        assert req.params["traffic"] == "false"
+        assert "sectionType" not in req.params
+        assert req.params["instructionsType"] == "text"
+        assert req.params["language"] == "vi-VN"
+        assert route_plan.summary.distance_m == 12000
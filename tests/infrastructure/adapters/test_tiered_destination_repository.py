@@ -0,0 +1,193 @@
+"""Test cases for the indexed memory repository and the tiered (memory + SQLite) repository."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.di.factories.repository_factory import RepositoryFactoryManager
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.adapters.memory_destination_repository import MemoryDestinationRepository
+from app.infrastructure.adapters.tiered_destination_repository import TieredDestinationRepository
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+
+from tests.fixtures.destinations import make_destination
+
+
+class TestMemoryDestinationRepositoryIndexes:
+    """Test cases for hash and n-gram indexes of MemoryDestinationRepository."""
+
+    @pytest.mark.asyncio
+    async def test_exact_lookups_use_normalized_keys(self):
+        repository = MemoryDestinationRepository()
+        saved = await repository.save(make_destination("Văn Phòng", "12 Lê Lợi, Quận 1"))
+
+        assert await repository.find_by_name("  văn phòng ") is saved
+        assert await repository.find_by_address("12 LÊ LỢI, QUẬN 1") is saved
+        assert await repository.find_by_address("Lê Lợi") is None
+
+    @pytest.mark.asyncio
+    async def test_substring_search_ignores_case_and_diacritics(self):
+        repository = MemoryDestinationRepository()
+        office = await repository.save(make_destination("Văn phòng", "12 Đường Lê Lợi, Quận 1"))
+        await repository.save(make_destination("Nhà", "98 Nguyễn Huệ, Quận 1"))
+
+        assert await repository.search_by_name_and_address(address="duong le loi") == [office]
+        assert await repository.search_by_name_and_address(name="phong") == [office]
+        assert len(await repository.search_by_name_and_address(address="q")) == 2  # term ngắn: quét toàn bộ
+        assert await repository.search_by_name_and_address(name="phong", address="Huệ") == []
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_updates_and_deletes(self):
+        repository = MemoryDestinationRepository()
+        await repository.save(make_destination("Nhà", "1 Lê Lợi", id="dest-1"))
+        await repository.save(make_destination("Văn phòng", "2 Hai Bà Trưng", id="dest-1"))
+
+        assert await repository.find_by_name("Nhà") is None
+        assert await repository.search_by_name_and_address(address="le loi") == []
+        assert (await repository.find_by_address("2 hai bà trưng")).id == "dest-1"
+
+        await repository.delete("dest-1")
+        assert await repository.search_by_name_and_address(name="van") == []
+        assert await repository.find_by_name("Văn phòng") is None
+
+    @pytest.mark.asyncio
+    async def test_find_nearby_orders_by_distance(self):
+        repository = MemoryDestinationRepository()
+        near = await repository.save(make_destination("Nhà", "1 Lê Lợi"))
+        far = await repository.save(make_destination("Hồ Gươm", "Hồ Hoàn Kiếm, Hà Nội", coordinates=LatLon(21.0287, 105.8524)))
+
+        results = await repository.find_nearby(LatLon(10.7725, 106.6980), limit=5)
+
+        assert [d for d, _ in results] == [near, far]
+        assert await repository.find_nearby(LatLon(10.7725, 106.6980), radius_m=10_000) == [results[0]]
+
+    @pytest.mark.asyncio
+    async def test_list_page_matches_sqlite_order(self):
+        repository = MemoryDestinationRepository()
+        older = await repository.save(make_destination("Nhà", "1 Lê Lợi", id="b", age_days=1))
+        newer = [await repository.save(make_destination(f"Kho {id}", f"{id} Hai Bà Trưng", id=id)) for id in ("a", "c")]
+        newer[0].created_at = newer[1].created_at  # cùng created_at: id giảm dần
+
+        first, after = await repository.list_page(2)
+        second, last = await repository.list_page(2, after)
+
+        assert [d.id for d in first + second] == ["c", "a", older.id]
+        assert last is None
+        assert [d.id async for d in repository.iter_all(chunk_size=1)] == ["c", "a", "b"]
+
+
+class TestTieredDestinationRepository:
+    """Test cases for TieredDestinationRepository in front of a primary repository."""
+
+    @pytest.mark.asyncio
+    async def test_reads_load_primary_once_then_stay_in_memory(self):
+        primary = AsyncMock()
+        primary.list_all.return_value = [make_destination("Nhà", "1 Lê Lợi", id="dest-1")]
+        repository = TieredDestinationRepository(primary)
+
+        results = await asyncio.gather(
+            repository.find_by_address("1 lê lợi"),
+            repository.find_by_id("dest-1"),
+            repository.find_by_name("nhà"),
+        )
+
+        assert results[0].id == results[1].id == results[2].id == "dest-1"
+        primary.list_all.assert_awaited_once()
+        primary.find_by_address.assert_not_awaited()
+        assert repository.stats()["memory_reads"] == 3
+
+    @pytest.mark.asyncio
+    async def test_searches_go_to_primary(self):
+        primary = AsyncMock()
+        primary.search_by_name_and_address.return_value = []
+        primary.search_summaries.return_value = []
+        repository = TieredDestinationRepository(primary)
+
+        await repository.search_by_name_and_address(name="nha")
+        await repository.search_summaries(address="le loi")
+
+        primary.search_by_name_and_address.assert_awaited_once_with(id=None, name="nha", address=None)
+        primary.search_summaries.assert_awaited_once_with(id=None, name=None, address="le loi")
+        primary.list_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_writes_go_through_primary_then_memory(self):
+        primary = AsyncMock()
+        primary.list_all.return_value = []
+        primary.save.side_effect = lambda destination: make_destination(
+            str(destination.name), str(destination.address), id="from-primary"
+        )
+        repository = TieredDestinationRepository(primary)
+
+        saved = await repository.save(make_destination("Nhà", "1 Lê Lợi"))
+        await repository.delete("missing")
+
+        assert saved.id == "from-primary"
+        assert (await repository.find_by_address("1 Lê Lợi")).id == "from-primary"
+        primary.delete.assert_awaited_once_with("missing")
+
+    @pytest.mark.asyncio
+    async def test_failed_load_falls_back_to_primary(self):
+        primary = AsyncMock()
+        primary.list_all.side_effect = RuntimeError("no such table: destinations")
+        primary.find_by_name.return_value = None
+        repository = TieredDestinationRepository(primary)
+
+        assert await repository.find_by_name("Nhà") is None
+
+        primary.find_by_name.assert_awaited_once_with("Nhà")
+        assert repository.stats()["loaded"] is False
+
+
+class TestTieredRepositoryOverSQLite:
+    """Test cases for the "tiered" backend of RepositoryFactoryManager over a real SQLite file."""
+
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        path = str(tmp_path / "destinations.db")
+        yield path
+        asyncio.run(DatabaseConnection.get_instance(path).close())
+        DatabaseConnection.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_tier_matches_sqlite_after_restart(self, database_path):
+        repository = RepositoryFactoryManager.for_backend("tiered", database_path).create_destination_repository()
+        await create_destinations_table()
+        older = await repository.save(make_destination("Nhà", "1 Lê Lợi", age_days=1))
+        newer = await repository.save(make_destination("Văn phòng", "2 Lê Lợi"))
+
+        # Instance mới (như sau khi restart) nạp lại từ SQLite
+        reloaded = RepositoryFactoryManager.for_backend("tiered", database_path).create_destination_repository()
+
+        assert isinstance(reloaded, TieredDestinationRepository)
+        assert [d.id for d in await reloaded.list_all()] == [newer.id, older.id]
+        assert (await reloaded.find_by_address("2 lê lợi")).id == newer.id
+
+    @pytest.mark.asyncio
+    async def test_searches_match_sqlite_backend(self, database_path):
+        sqlite = RepositoryFactoryManager.for_backend("sqlite", database_path).create_destination_repository()
+        await create_destinations_table()
+        await sqlite.save(make_destination("Hồ Gươm", "Hồ Hoàn Kiếm, Hanoi", age_days=2))
+        await sqlite.save(make_destination("Văn phòng", "2 Lê Lợi, Quận 1"))
+        await sqlite.save(make_destination("Nhà Lê", "12 Lê Lợi, Hanoi", age_days=1))
+        tiered = RepositoryFactoryManager.for_backend("tiered", database_path).create_destination_repository()
+        await tiered.warm()
+
+        queries = [
+            {"address": "anoi"},
+            {"address": "hanoi"},
+            {"address": "le loi"},
+            {"name": "van phong"},
+            {"name": "le", "address": "hanoi"},
+        ]
+        for query in queries:
+            expected = [d.id for d in await sqlite.search_by_name_and_address(**query)]
+            assert [d.id for d in await tiered.search_by_name_and_address(**query)] == expected, query
+            assert [s.id for s in await tiered.search_summaries(**query)] == expected, query
+
+    def test_unknown_backend_is_rejected(self, database_path):
+        with pytest.raises(ValueError):
+            RepositoryFactoryManager.for_backend("redis", database_path)
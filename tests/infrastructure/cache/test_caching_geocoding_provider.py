@@ -0,0 +1,84 @@
+"""Tests cho CachingGeocodingProvider."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.dto.geocoding_dto import (
+    AddressDTO,
+    GeocodeAddressCommandDTO,
+    GeocodeResponseDTO,
+    GeocodingResultDTO,
+)
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.cache.caching_geocoding_provider import CachingGeocodingProvider
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+class TestCachingGeocodingProvider:
+    """Test suite cho CachingGeocodingProvider."""
+
+    @pytest.fixture
+    def found_response(self):
+        return GeocodeResponseDTO(
+            results=[
+                GeocodingResultDTO(
+                    position=LatLon(10.7769, 106.7009),
+                    address=AddressDTO(freeform_address="123 Nguyễn Huệ, Quận 1")
+                )
+            ]
+        )
+
+    @pytest.fixture
+    def inner(self, found_response):
+        provider = AsyncMock()
+        provider.geocode_address.return_value = found_response
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_normalized_addresses_share_one_upstream_call(self, inner, found_response):
+        provider = CachingGeocodingProvider(inner=inner)
+
+        first = await provider.geocode_address(GeocodeAddressCommandDTO(address="123 Nguyễn Huệ", country_set="vn"))
+        second = await provider.geocode_address(GeocodeAddressCommandDTO(address="  123  nguyễn huệ ", country_set="VN"))
+
+        assert first is found_response
+        assert second is found_response
+        assert inner.geocode_address.await_count == 1
+        assert provider.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_and_language_are_part_of_the_key(self, inner):
+        provider = CachingGeocodingProvider(inner=inner)
+
+        await provider.geocode_address(GeocodeAddressCommandDTO(address="Hà Nội", limit=1))
+        await provider.geocode_address(GeocodeAddressCommandDTO(address="Hà Nội", limit=5))
+        await provider.geocode_address(GeocodeAddressCommandDTO(address="Hà Nội", limit=1, language="en-US"))
+
+        assert inner.geocode_address.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_results_use_negative_ttl(self, inner):
+        clock_now = [0.0]
+        cache = LruTtlCache(max_size=8, ttl_sec=3600, clock=lambda: clock_now[0])
+        inner.geocode_address.return_value = GeocodeResponseDTO(results=[])
+        provider = CachingGeocodingProvider(inner=inner, cache=cache, negative_ttl_sec=30)
+        cmd = GeocodeAddressCommandDTO(address="không tồn tại")
+
+        await provider.geocode_address(cmd)
+        await provider.geocode_address(cmd)
+        assert inner.geocode_address.await_count == 1
+
+        clock_now[0] = 31
+        await provider.geocode_address(cmd)
+        assert inner.geocode_address.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upstream_errors_are_not_cached(self, inner, found_response):
+        provider = CachingGeocodingProvider(inner=inner)
+        inner.geocode_address.side_effect = [RuntimeError("timeout"), found_response]
+        cmd = GeocodeAddressCommandDTO(address="Quận 1")
+
+        with pytest.raises(RuntimeError):
+            await provider.geocode_address(cmd)
+
+        assert await provider.geocode_address(cmd) is found_response
@@ -0,0 +1,70 @@
+"""Tests cho CachingReverseGeocodeProvider."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.constants.validation_constants import DefaultValues
+from app.application.dto.traffic_dto import GeocodedAddress, ReverseGeocodeCommand, ReverseGeocodeResponse
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.cache import geohash
+from app.infrastructure.cache.caching_reverse_geocode_provider import CachingReverseGeocodeProvider
+
+
+def _echo_reverse_geocode(unknown_for=()):
+    """Inner provider giả: trả về địa chỉ theo tọa độ, 'không xác định' cho các điểm trong unknown_for."""
+    async def reverse_geocode(cmd):
+        addresses = []
+        for coord in cmd.coordinates:
+            name = DefaultValues.UNKNOWN_ADDRESS if coord in unknown_for else f"Đường {coord.lat:.4f}"
+            addresses.append(GeocodedAddress(coordinate=coord, address=name, freeform_address=name))
+        return ReverseGeocodeResponse(success=True, addresses=addresses)
+    return reverse_geocode
+
+
+class TestCachingReverseGeocodeProvider:
+    """Test suite cho CachingReverseGeocodeProvider."""
+
+    def test_geohash_matches_reference_value(self):
+        assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    @pytest.mark.asyncio
+    async def test_warm_route_costs_no_upstream_calls(self):
+        inner = AsyncMock()
+        inner.reverse_geocode.side_effect = _echo_reverse_geocode()
+        provider = CachingReverseGeocodeProvider(inner=inner)
+        coords = [LatLon(10.7769, 106.7009), LatLon(10.8231, 106.6297)]
+
+        cold = await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=coords))
+        # Điểm lệch vài mét vẫn rơi vào cùng ô geohash
+        nearby = [LatLon(10.77691, 106.70091), LatLon(10.82311, 106.62971)]
+        warm = await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=nearby))
+
+        assert inner.reverse_geocode.await_count == 1
+        assert [a.freeform_address for a in warm.addresses] == [a.freeform_address for a in cold.addresses]
+        assert [a.coordinate for a in warm.addresses] == nearby
+
+    @pytest.mark.asyncio
+    async def test_only_missing_cells_are_fetched_once_each(self):
+        inner = AsyncMock()
+        inner.reverse_geocode.side_effect = _echo_reverse_geocode()
+        provider = CachingReverseGeocodeProvider(inner=inner)
+        a, b = LatLon(10.7769, 106.7009), LatLon(10.8231, 106.6297)
+
+        await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=[a]))
+        result = await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=[a, b, b]))
+
+        sent = inner.reverse_geocode.call_args[0][0].coordinates
+        assert sent == [b]
+        assert len(result.addresses) == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_addresses_are_not_cached(self):
+        coord = LatLon(10.7769, 106.7009)
+        inner = AsyncMock()
+        inner.reverse_geocode.side_effect = _echo_reverse_geocode(unknown_for=(coord,))
+        provider = CachingReverseGeocodeProvider(inner=inner)
+
+        await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=[coord]))
+        await provider.reverse_geocode(ReverseGeocodeCommand(coordinates=[coord]))
+
+        assert inner.reverse_geocode.await_count == 2
@@ -0,0 +1,60 @@
+"""Tests cho LruTtlCache."""
+
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    """Clock điều khiển được cho test TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLruTtlCache:
+    """Test suite cho LruTtlCache."""
+
+    def test_get_returns_value_until_ttl_expires(self):
+        clock = FakeClock()
+        cache = LruTtlCache(max_size=4, ttl_sec=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self):
+        clock = FakeClock()
+        cache = LruTtlCache(max_size=4, ttl_sec=100, clock=clock)
+        cache.set("negative", "empty", ttl_sec=1)
+
+        clock.now = 2
+        assert cache.get("negative") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LruTtlCache(max_size=2, ttl_sec=100)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_stats_track_hits_and_misses(self):
+        cache = LruTtlCache(max_size=2, ttl_sec=100)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
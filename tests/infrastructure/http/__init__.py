@@ -0,0 +1 @@
+# HTTP client tests
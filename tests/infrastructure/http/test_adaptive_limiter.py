@@ -0,0 +1,134 @@
+"""Tests cho AdaptiveLimit và AdaptiveConcurrencyLimiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.http.adaptive_limiter import (
+    AdaptiveConcurrencyLimiter,
+    AdaptiveLimit,
+    AdaptiveLimitConfig,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveLimit:
+    """Test suite cho AdaptiveLimit."""
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_while_latency_is_stable(self):
+        clock = FakeClock()
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=2, max_limit=4), clock)
+
+        for _ in range(20):
+            starts = [await limit.acquire(), await limit.acquire()]
+            clock.now += 0.1
+            for started in starts:
+                limit.on_success(started)
+
+        assert limit.limit == 4
+        assert limit.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_backs_off_once_per_wave(self):
+        clock = FakeClock()
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=10, backoff_ratio=0.5), clock)
+
+        starts = [await limit.acquire() for _ in range(3)]
+        clock.now += 1.0
+        for started in starts:
+            limit.on_drop(started)
+
+        assert limit.limit == 5
+        assert limit.stats()["drops"] == 3
+        assert limit.stats()["decreases"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_inflation_backs_off(self):
+        clock = FakeClock()
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=10, backoff_ratio=0.5, latency_tolerance=2.0), clock)
+
+        started = await limit.acquire()
+        clock.now += 0.1
+        limit.on_success(started)
+        started = await limit.acquire()
+        clock.now += 0.5
+        limit.on_success(started)
+
+        assert limit.limit == 5
+        assert limit.stats()["min_latency_ms"] == {"": pytest.approx(100.0)}
+
+    @pytest.mark.asyncio
+    async def test_mixed_fast_and_slow_endpoints_do_not_shrink_limit(self):
+        """Geocode nhanh và batch chậm cùng nhóm "search": mỗi endpoint so với baseline của chính nó."""
+        clock = FakeClock()
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=4, backoff_ratio=0.5, latency_tolerance=2.0), clock)
+
+        for _ in range(10):
+            for endpoint, latency in (("api/search/2/geocode", 0.05), ("api/search/2/batch.json", 0.8)):
+                started = await limit.acquire()
+                clock.now += latency
+                limit.on_success(started, endpoint)
+            # Batch lớn hơn (latency tăng theo số items) không được tính là tăng vọt
+            started = await limit.acquire()
+            clock.now += 3.0
+            limit.on_success(started, "api/search/2/batch.json", latency_signal=False)
+
+        stats = limit.stats()
+        assert stats["decreases"] == 0
+        assert limit.limit == 4
+        assert stats["min_latency_ms"] == {
+            "api/search/2/geocode": pytest.approx(50.0),
+            "api/search/2/batch.json": pytest.approx(800.0),
+        }
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_when_slots_free_up(self):
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=1, max_limit=1))
+        await limit.acquire()
+
+        waiter = asyncio.create_task(limit.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limit.on_ignore()
+        await asyncio.wait_for(waiter, 1)
+        assert limit.stats()["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_past_deadline_raises_timeout_and_leaves_queue(self):
+        limit = AdaptiveLimit(AdaptiveLimitConfig(initial_limit=1, max_limit=1))
+        await limit.acquire()
+
+        with pytest.raises(TimeoutError):
+            await limit.acquire(deadline=time.monotonic() + 0.05)
+
+        limit.on_ignore()
+        await asyncio.wait_for(limit.acquire(), 1)
+        assert limit.stats()["in_flight"] == 1
+
+    def test_invalid_config_is_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimitConfig(initial_limit=5, max_limit=2)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite cho AdaptiveConcurrencyLimiter."""
+
+    def test_one_limit_per_upstream_family(self):
+        limiter = AdaptiveConcurrencyLimiter()
+
+        routing = limiter.for_url("https://api.tomtom.com/routing/1/calculateRoute/1,2:3,4/json")
+        search = limiter.for_url("https://api.tomtom.com/search/2/reverseGeocode/1,2.json")
+
+        assert routing is not search
+        assert limiter.for_url("https://api.tomtom.com/routing/1/other") is routing
+        assert limiter.stats()["routing"]["limit"] == 10
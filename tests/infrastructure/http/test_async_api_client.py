@@ -0,0 +1,349 @@
+"""Tests cho AsyncApiClient (pooled session)."""
+
+import asyncio
+import dataclasses
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.application.services.deadline import DeadlineExceededError, deadline_scope
+from app.infrastructure.cache.lru_ttl_cache import LruTtlCache
+from app.infrastructure.http.adaptive_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimitConfig
+from app.infrastructure.http.circuit_breaker import CircuitBreakerConfig, CircuitBreakerRegistry, CircuitOpenError
+from app.infrastructure.http.client import AsyncApiClient
+from app.infrastructure.http.hedging import Hedger, HedgingConfig
+from app.infrastructure.http.http_method import HttpMethod
+from app.infrastructure.http.request_entity import RequestEntity
+from app.infrastructure.http.retry_policy import RetryPolicy
+
+
+def _fast_retry_policy(max_retries: int = 3) -> RetryPolicy:
+    return RetryPolicy(max_retries=max_retries, base_delay_sec=0.001, max_delay_sec=0.01)
+
+
+SLOW_HITS = web.AppKey("slow_hits", list)
+FLAKY_HITS = web.AppKey("flaky_hits", list)
+TAIL_HITS = web.AppKey("tail_hits", list)
+
+
+def _make_app() -> web.Application:
+    async def handle_get(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True, "q": request.query.get("q")})
+
+    async def handle_post(request: web.Request) -> web.Response:
+        return web.json_response({"echo": await request.json()})
+
+    async def handle_head(request: web.Request) -> web.Response:
+        return web.Response()
+
+    async def handle_slow(request: web.Request) -> web.Response:
+        request.app[SLOW_HITS].append(request.query.get("q"))
+        await asyncio.sleep(0.05)
+        return web.json_response({"q": request.query.get("q")})
+
+    async def handle_flaky(request: web.Request) -> web.Response:
+        """Trả lỗi `fail` lần đầu (status `status`, kèm Retry-After nếu có) rồi mới thành công."""
+        request.app[FLAKY_HITS].append(request.method)
+        if len(request.app[FLAKY_HITS]) <= int(request.query.get("fail", "0")):
+            headers = {"Retry-After": request.query["retry_after"]} if "retry_after" in request.query else None
+            return web.json_response({"error": "busy"}, status=int(request.query.get("status", "503")), headers=headers)
+        return web.json_response({"ok": True})
+
+    async def handle_tail(request: web.Request) -> web.Response:
+        """Request đầu tiên chậm (tail latency), các request sau trả về ngay."""
+        request.app[TAIL_HITS].append(request.query.get("q"))
+        if len(request.app[TAIL_HITS]) == 1:
+            await asyncio.sleep(1)
+        return web.json_response({"hit": len(request.app[TAIL_HITS])})
+
+    app = web.Application()
+    app[TAIL_HITS] = []
+    app.router.add_get("/tail", handle_tail)
+    app[SLOW_HITS] = []
+    app[FLAKY_HITS] = []
+    app.router.add_get("/flaky", handle_flaky)
+    app.router.add_post("/flaky", handle_flaky)
+    app.router.add_get("/slow", handle_slow)
+    app.router.add_get("/json", handle_get)
+    app.router.add_post("/json", handle_post)
+    app.router.add_route("HEAD", "/", handle_head)
+    return app
+
+
+def _get(url: str, params: dict | None = None) -> RequestEntity:
+    return RequestEntity(
+        method=HttpMethod.GET,
+        url=url,
+        headers={},
+        params=params or {},
+        json=None,
+        timeout_sec=5,
+    )
+
+
+class TestAsyncApiClient:
+    """Test suite cho AsyncApiClient."""
+
+    @pytest.mark.asyncio
+    async def test_send_reuses_single_session(self):
+        """Nhiều request liên tiếp dùng chung một session."""
+        async with TestServer(_make_app()) as server:
+            client = AsyncApiClient()
+            try:
+                first = await client.send(_get(str(server.make_url("/json")), {"q": "a"}))
+                session = client._session
+                second = await client.send(_get(str(server.make_url("/json")), {"q": "b"}))
+
+                assert first == {"ok": True, "q": "a"}
+                assert second == {"ok": True, "q": "b"}
+                assert client._session is session
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_send_post_with_json_body(self):
+        """POST gửi JSON body qua session dùng chung."""
+        async with TestServer(_make_app()) as server:
+            client = AsyncApiClient()
+            try:
+                req = RequestEntity(
+                    method=HttpMethod.POST,
+                    url=str(server.make_url("/json")),
+                    headers={},
+                    params={},
+                    json={"batchItems": [1, 2]},
+                    timeout_sec=5,
+                )
+                assert await client.send(req) == {"echo": {"batchItems": [1, 2]}}
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_session_and_allows_reopen(self):
+        """aclose() đóng session; request sau đó tạo session mới."""
+        async with TestServer(_make_app()) as server:
+            client = AsyncApiClient()
+            await client.send(_get(str(server.make_url("/json"))))
+            session = client._session
+
+            await client.aclose()
+            assert session.closed
+            assert client._session is None
+
+            await client.send(_get(str(server.make_url("/json"))))
+            assert client._session is not session
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_unreachable_hosts(self):
+        """Warmup không raise khi host không kết nối được."""
+        async with TestServer(_make_app()) as server:
+            client = AsyncApiClient()
+            try:
+                await client.warmup([str(server.make_url("/")), "http://127.0.0.1:9"])
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_are_coalesced(self):
+        """GET trùng method/URL/params (khác API key) đang chạy đồng thời chỉ gửi một request."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            client = AsyncApiClient()
+            try:
+                url = str(server.make_url("/slow"))
+                results = await asyncio.gather(
+                    client.send(_get(url, {"q": "a", "key": "k1"})),
+                    client.send(_get(url, {"key": "k2", "q": "a"})),
+                    client.send(_get(url, {"q": "b"})),
+                )
+
+                assert results == [{"q": "a"}, {"q": "a"}, {"q": "b"}]
+                assert sorted(app[SLOW_HITS]) == ["a", "b"]
+                assert client.stats()["single_flight"]["coalesced"] == 1
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_transient_get_errors_are_retried(self):
+        """GET gặp 503 tạm thời được retry tới khi thành công."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            client = AsyncApiClient(retry_policy=_fast_retry_policy())
+            try:
+                result = await client.send(_get(str(server.make_url("/flaky")), {"fail": "2"}))
+
+                assert result == {"ok": True}
+                assert len(app[FLAKY_HITS]) == 3
+                assert client.stats()["retries"] == 2
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_and_post_are_not_retried(self):
+        """404 và POST (không idempotent) không được retry."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            client = AsyncApiClient(retry_policy=_fast_retry_policy())
+            try:
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await client.send(_get(str(server.make_url("/flaky")), {"fail": "1", "status": "404"}))
+                assert len(app[FLAKY_HITS]) == 1
+
+                app[FLAKY_HITS].clear()
+                post = RequestEntity(
+                    method=HttpMethod.POST,
+                    url=str(server.make_url("/flaky")),
+                    headers={},
+                    params={"fail": "1"},
+                    json={},
+                    timeout_sec=5,
+                )
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await client.send(post)
+                assert app[FLAKY_HITS] == ["POST"]
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_deadline_fails_fast(self):
+        """Retry-After vượt quá deadline còn lại thì không chờ mà raise ngay."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            client = AsyncApiClient(retry_policy=_fast_retry_policy())
+            try:
+                req = RequestEntity(
+                    method=HttpMethod.GET,
+                    url=str(server.make_url("/flaky")),
+                    headers={},
+                    params={"fail": "1", "status": "429", "retry_after": "5"},
+                    json=None,
+                    timeout_sec=5,
+                    deadline=time.monotonic() + 1,
+                )
+                started = time.monotonic()
+                with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                    await client.send(req)
+
+                assert exc_info.value.status == 429
+                assert time.monotonic() - started < 0.5
+                assert len(app[FLAKY_HITS]) == 1
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_stale_response_or_fails_fast(self):
+        """Khi mạch mở: GET đã có trong stale cache trả response cũ, GET khác raise CircuitOpenError."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            client = AsyncApiClient(
+                retry_policy=_fast_retry_policy(max_retries=0),
+                circuit_breakers=CircuitBreakerRegistry(CircuitBreakerConfig(window_size=3, min_calls=3)),
+                stale_cache=LruTtlCache(max_size=16, ttl_sec=60),
+            )
+            try:
+                cached = await client.send(_get(str(server.make_url("/json")), {"q": "a"}))
+                for _ in range(2):
+                    with pytest.raises(aiohttp.ClientResponseError):
+                        await client.send(_get(str(server.make_url("/flaky")), {"fail": "100"}))
+                hits = len(app[FLAKY_HITS])
+
+                assert await client.send(_get(str(server.make_url("/json")), {"q": "a"})) == cached
+                with pytest.raises(CircuitOpenError):
+                    await client.send(_get(str(server.make_url("/flaky")), {"fail": "100"}))
+
+                assert len(app[FLAKY_HITS]) == hits
+                stats = client.stats()
+                assert stats["stale_served"] == 1
+                assert stats["circuit_breakers"][server.make_url("/").raw_authority]["state"] == "open"
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_from_scope_caps_timeout(self):
+        """Latency budget của request (deadline_scope) chặn timeout_sec của từng request."""
+        async with TestServer(_make_app()) as server:
+            client = AsyncApiClient(retry_policy=_fast_retry_policy())
+            try:
+                started = time.monotonic()
+                with deadline_scope(0.02):
+                    with pytest.raises(asyncio.TimeoutError):
+                        await client.send(_get(str(server.make_url("/slow")), {"q": "a"}))
+
+                assert time.monotonic() - started < 0.045
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_is_not_counted_as_upstream_failure(self):
+        """Timeout do budget của caller không làm mở circuit breaker hay giảm concurrency limit."""
+        async with TestServer(_make_app()) as server:
+            breakers = CircuitBreakerRegistry(CircuitBreakerConfig(window_size=3, min_calls=3))
+            limiter = AdaptiveConcurrencyLimiter(AdaptiveLimitConfig(initial_limit=4))
+            client = AsyncApiClient(
+                retry_policy=_fast_retry_policy(max_retries=0),
+                circuit_breakers=breakers,
+                concurrency_limiter=limiter,
+            )
+            try:
+                url = str(server.make_url("/slow"))
+                for q in "abcd":
+                    with deadline_scope(0.02):
+                        with pytest.raises(DeadlineExceededError):
+                            await client.send(_get(url, {"q": q}))
+
+                stats = client.stats()
+                assert stats["circuit_breakers"][server.make_url("/").raw_authority]["state"] == "closed"
+                assert stats["concurrency"]["slow"]["drops"] == 0
+                assert stats["concurrency"]["slow"]["limit"] == 4
+
+                # timeout_sec của request hết trước budget: vẫn là tín hiệu quá tải
+                with pytest.raises(asyncio.TimeoutError) as exc_info:
+                    await client.send(dataclasses.replace(_get(url, {"q": "e"}), timeout_sec=0.01))
+                assert not isinstance(exc_info.value, DeadlineExceededError)
+                assert client.stats()["concurrency"]["slow"]["drops"] == 1
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_slow_get_is_hedged_and_loser_cancelled(self):
+        """GET chậm hơn hedge delay được gửi thêm bản sao; bản về trước thắng."""
+        app = _make_app()
+        async with TestServer(app) as server:
+            hedger = Hedger(HedgingConfig(min_samples=1, min_delay_sec=0.01, budget_ratio=1.0))
+            url = str(server.make_url("/tail"))
+            hedger.endpoint(url).record(0.01)
+            client = AsyncApiClient(hedger=hedger)
+            try:
+                started = time.monotonic()
+                result = await client.send(_get(url, {"q": "a"}))
+
+                assert time.monotonic() - started < 0.5
+                assert result == {"hit": 2}
+                assert len(app[TAIL_HITS]) == 2
+                stats = client.stats()["hedging"][Hedger.endpoint_of(url)]
+                assert stats["hedges"] == 1
+                assert stats["hedge_wins"] == 1
+            finally:
+                await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_caps_in_flight_requests(self):
+        """Adaptive concurrency limit giới hạn số request đồng thời tới một nhóm upstream."""
+        async with TestServer(_make_app()) as server:
+            limiter = AdaptiveConcurrencyLimiter(AdaptiveLimitConfig(initial_limit=1, max_limit=1))
+            client = AsyncApiClient(concurrency_limiter=limiter)
+            try:
+                url = str(server.make_url("/slow"))
+                started = time.monotonic()
+                await asyncio.gather(*(client.send(_get(url, {"q": q})) for q in "abc"))
+
+                assert time.monotonic() - started >= 0.15
+                stats = client.stats()["concurrency"]["slow"]
+                assert stats["limit"] == 1
+                assert stats["in_flight"] == 0
+            finally:
+                await client.aclose()
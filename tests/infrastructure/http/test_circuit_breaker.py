@@ -0,0 +1,111 @@
+"""Tests cho CircuitBreaker và CircuitBreakerRegistry."""
+
+import pytest
+
+from app.infrastructure.http.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, **overrides) -> CircuitBreaker:
+    config = CircuitBreakerConfig(window_size=4, min_calls=4, open_sec=10.0, half_open_max_calls=2, **overrides)
+    return CircuitBreaker("api.tomtom.com", config, clock)
+
+
+class TestCircuitBreaker:
+    """Test suite cho CircuitBreaker."""
+
+    def test_opens_on_failure_rate_and_fails_fast(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+
+        for success in (True, False, True, False):
+            breaker.before_call()
+            breaker.record(success, 0.1)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_in_sec == pytest.approx(10.0)
+        assert breaker.stats()["rejected"] == 1
+
+    def test_does_not_open_before_min_calls(self):
+        breaker = _breaker(FakeClock())
+
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record(False, 0.1)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_on_slow_call_rate(self):
+        breaker = _breaker(FakeClock(), slow_call_sec=1.0, slow_call_rate_threshold=0.75)
+
+        for duration in (2.0, 2.0, 0.1, 2.0):
+            breaker.before_call()
+            breaker.record(True, duration)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_probes_close_the_circuit(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.before_call()
+            breaker.record(False, 0.1)
+
+        clock.now = 10.0
+        breaker.before_call()
+        breaker.before_call()
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # vượt half_open_max_calls
+
+        breaker.record(True, 0.1)
+        breaker.record(True, 0.1)
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.stats()["window_calls"] == 0
+
+    def test_failed_probe_reopens_and_release_frees_slot(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(4):
+            breaker.before_call()
+            breaker.record(False, 0.1)
+
+        clock.now = 10.0
+        breaker.before_call()
+        breaker.before_call()
+        breaker.release()
+        breaker.before_call()  # slot được trả lại bởi release()
+
+        breaker.record(False, 0.1)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.stats()["opened"] == 2
+
+
+class TestCircuitBreakerRegistry:
+    """Test suite cho CircuitBreakerRegistry."""
+
+    def test_one_breaker_per_host(self):
+        registry = CircuitBreakerRegistry()
+
+        routing = registry.for_url("https://api.tomtom.com/routing/1/calculateRoute/1,2:3,4/json")
+        search = registry.for_url("https://api.tomtom.com/search/2/batch.json")
+        weather = registry.for_url("https://api.weatherapi.com/v1/current.json")
+
+        assert routing is search
+        assert weather is not routing
+        assert set(registry.stats()) == {"api.tomtom.com", "api.weatherapi.com"}
@@ -0,0 +1,48 @@
+"""Tests cho Hedger."""
+
+from app.infrastructure.http.hedging import Hedger, HedgingConfig
+
+
+class TestHedger:
+    """Test suite cho Hedger."""
+
+    def test_endpoint_key_ignores_path_parameters(self):
+        first = Hedger.endpoint_of("https://api.tomtom.com/search/2/reverseGeocode/10.1,106.2.json?key=x")
+        second = Hedger.endpoint_of("https://api.tomtom.com/search/2/reverseGeocode/10.3,106.4.json")
+
+        assert first == second == "api.tomtom.com/search/2/reverseGeocode"
+        assert Hedger.endpoint_of("https://api.tomtom.com/search/2/geocode/abc.json") != first
+
+    def test_no_hedge_until_enough_samples(self):
+        endpoint = Hedger(HedgingConfig(min_samples=5, budget_ratio=1.0)).endpoint("https://h/a/b/c")
+        endpoint.requests = 10
+        for _ in range(4):
+            endpoint.record(0.1)
+
+        assert endpoint.hedge_delay() is None
+        endpoint.record(0.1)
+        assert endpoint.hedge_delay() == 0.1
+
+    def test_delay_tracks_percentile_within_bounds(self):
+        endpoint = Hedger(HedgingConfig(
+            percentile=0.9, min_samples=10, min_delay_sec=0.05, max_delay_sec=2.0, budget_ratio=1.0
+        )).endpoint("https://h/a/b/c")
+        endpoint.requests = 100
+        for latency_ms in range(1, 101):
+            endpoint.record(latency_ms / 1000)
+
+        assert endpoint.hedge_delay() == 0.091
+        for _ in range(200):
+            endpoint.record(10.0)
+        assert endpoint.hedge_delay() == 2.0
+
+    def test_budget_caps_hedge_ratio(self):
+        endpoint = Hedger(HedgingConfig(min_samples=1, budget_ratio=0.1)).endpoint("https://h/a/b/c")
+        endpoint.record(0.2)
+
+        endpoint.requests = 9
+        assert endpoint.hedge_delay() is None
+        endpoint.requests = 10
+        assert endpoint.hedge_delay() is not None
+        endpoint.hedges = 1
+        assert endpoint.hedge_delay() is None
@@ -0,0 +1,60 @@
+"""Tests cho TokenBucket và RateLimiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.http.rate_limiter import RateLimitConfig, RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test suite cho TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_served_immediately_then_smoothed(self):
+        bucket = TokenBucket(RateLimitConfig(rate_per_sec=100, burst=5))
+
+        started = time.monotonic()
+        waits = await asyncio.gather(*(bucket.acquire() for _ in range(10)))
+        elapsed = time.monotonic() - started
+
+        # 5 token burst, 5 request còn lại chờ ~10ms mỗi cái
+        assert sum(1 for wait in waits if wait < 0.005) == 5
+        assert 0.04 <= elapsed < 0.2
+        stats = bucket.stats()
+        assert stats["acquired"] == 10
+        assert stats["waiting"] == 0
+        assert stats["max_wait_ms"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_wait_past_deadline_raises_timeout(self):
+        bucket = TokenBucket(RateLimitConfig(rate_per_sec=1, burst=1))
+        await bucket.acquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await bucket.acquire(deadline=time.monotonic() + 0.1)
+
+
+class TestRateLimiter:
+    """Test suite cho RateLimiter."""
+
+    def test_family_classification(self):
+        assert RateLimiter.family_of("https://api.tomtom.com/routing/1/calculateRoute/1,2:3,4/json") == "routing"
+        assert RateLimiter.family_of("https://api.tomtom.com/search/2/batch.json") == "search"
+        assert RateLimiter.family_of("https://api.weatherapi.com/v1/current.json") == "weather"
+
+    @pytest.mark.asyncio
+    async def test_families_have_independent_buckets(self):
+        limiter = RateLimiter({
+            "routing": RateLimitConfig(rate_per_sec=1, burst=1),
+            "search": RateLimitConfig(rate_per_sec=1, burst=1),
+        })
+
+        await limiter.acquire("https://api.tomtom.com/routing/1/x")
+        started = time.monotonic()
+        await limiter.acquire("https://api.tomtom.com/search/2/y")
+        await limiter.acquire("https://example.com/unlimited")
+
+        assert time.monotonic() - started < 0.05
+        assert set(limiter.stats()) == {"routing", "search"}
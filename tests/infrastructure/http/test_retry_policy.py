@@ -0,0 +1,51 @@
+"""Tests cho RetryPolicy."""
+
+import asyncio
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+from multidict import CIMultiDict
+
+from app.infrastructure.http.retry_policy import RetryPolicy
+
+
+def _response_error(status: int, headers: dict | None = None) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        request_info=None, history=(), status=status, headers=CIMultiDict(headers or {})
+    )
+
+
+class TestRetryPolicy:
+    """Test suite cho RetryPolicy."""
+
+    def test_classifies_retryable_errors(self):
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(_response_error(429))
+        assert policy.is_retryable(_response_error(503))
+        assert policy.is_retryable(aiohttp.ServerDisconnectedError())
+        assert policy.is_retryable(asyncio.TimeoutError())
+        assert not policy.is_retryable(_response_error(400))
+        assert not policy.is_retryable(_response_error(401))
+        assert not policy.is_retryable(ValueError("bad payload"))
+
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay_sec=0.1, max_delay_sec=2.0, backoff_factor=3.0, rng=random.Random(7))
+
+        delay = None
+        for _ in range(50):
+            previous = delay
+            delay = policy.next_delay(previous)
+            upper = max(0.1, (previous if previous is not None else 0.1) * 3.0)
+            assert 0.1 <= delay <= min(2.0, upper)
+
+    def test_parses_retry_after_seconds_and_http_date(self):
+        policy = RetryPolicy()
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert policy.retry_after_sec(_response_error(429, {"Retry-After": "3"})) == 3.0
+        assert 25 <= policy.retry_after_sec(_response_error(503, {"Retry-After": format_datetime(retry_at)})) <= 30
+        assert policy.retry_after_sec(_response_error(503)) is None
+        assert policy.retry_after_sec(_response_error(503, {"Retry-After": "soon"})) is None
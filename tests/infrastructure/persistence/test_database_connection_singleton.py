@@ -8,6 +8,11 @@ from app.infrastructure.persistence.database.connection import DatabaseConnectio
 class TestDatabaseConnectionSingleton:
     """Test cases for DatabaseConnection singleton pattern."""
     
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Temporary database file for tests that actually open a connection."""
+        return str(tmp_path / "test.db")
+    
     def test_singleton_creates_only_one_instance(self):
         """Test that only one instance is created."""
         # Reset singleton before test
@@ -70,14 +75,14 @@ class TestDatabaseConnectionSingleton:
         assert db2._database_path == "test2.db"
     
     @pytest.mark.asyncio
-    async def test_singleton_connection_sharing(self):
+    async def test_singleton_connection_sharing(self, db_path):
         """Test that singleton shares connection across instances."""
         # Reset singleton before test
         DatabaseConnection.reset_instance()
         
         # Create multiple instances
-        db1 = DatabaseConnection("test.db")
-        db2 = DatabaseConnection("test.db")
+        db1 = DatabaseConnection(db_path)
+        db2 = DatabaseConnection(db_path)
         
         # Connect first instance
         conn1 = await db1.connect()
@@ -92,17 +97,17 @@ class TestDatabaseConnectionSingleton:
         await db1.close()
     
     @pytest.mark.asyncio
-    async def test_singleton_context_manager(self):
+    async def test_singleton_context_manager(self, db_path):
         """Test singleton with context manager."""
         # Reset singleton before test
         DatabaseConnection.reset_instance()
         
         # Use context manager
-        async with DatabaseConnection("test.db") as conn1:
+        async with DatabaseConnection(db_path) as conn1:
             assert conn1 is not None
             
             # Create another instance and use context manager
-            db2 = DatabaseConnection("test.db")
+            db2 = DatabaseConnection(db_path)
             async with db2 as conn2:
                 # Should be the same connection
                 assert conn1 is conn2
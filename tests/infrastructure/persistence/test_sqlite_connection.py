@@ -0,0 +1,185 @@
+"""Test cases for the persistent SQLite connection (pragmas, borrowing, write serialization)."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.database.sqlite_config import SQLiteConfig
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+from tests.fixtures.destinations import make_destination
+
+
+class TestPersistentSQLiteConnection:
+    """Test cases for DatabaseConnection as a long-lived shared connection."""
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        db = DatabaseConnection.get_instance(str(tmp_path / "destinations.db"), SQLiteConfig(cache_size_kib=4096))
+        yield db
+        asyncio.run(db.close())  # kết nối không gắn với event loop của test
+        DatabaseConnection.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_pragmas_are_applied_on_connect(self, database):
+        conn = await database.connect()
+
+        async with conn.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+        async with conn.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+        async with conn.execute("PRAGMA cache_size") as cursor:
+            assert (await cursor.fetchone())[0] == -4096
+
+    @pytest.mark.asyncio
+    async def test_context_manager_borrows_without_closing(self, database):
+        async with database as first:
+            pass
+        async with database as second:
+            assert second is first
+            async with second.execute("SELECT 1") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_argument_keeps_configured_path(self, database):
+        assert DatabaseConnection()._database_path == database._database_path
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_share_connection_safely(self, database):
+        await create_destinations_table()
+        repository = SQLiteDestinationRepository(database._database_path)
+
+        saved = await asyncio.gather(*(repository.save(make_destination(f"Điểm {i}", f"{i} Lê Lợi, Quận 1")) for i in range(20)))
+
+        assert len({destination.id for destination in saved}) == 20
+        assert len(await repository.list_all()) == 20
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_is_rolled_back(self, database):
+        await create_destinations_table()
+
+        with pytest.raises(RuntimeError):
+            async with database.transaction() as conn:
+                await conn.execute(
+                    "INSERT INTO destinations (id, name, address, latitude, longitude, created_at, updated_at) "
+                    "VALUES ('x', 'n', 'a', 1.0, 2.0, '2024-01-01', '2024-01-01')"
+                )
+                raise RuntimeError("boom")
+
+        async with database as conn:
+            async with conn.execute("SELECT COUNT(*) FROM destinations") as cursor:
+                assert (await cursor.fetchone())[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_reads_open_one_pool(self, database):
+        opened = []
+        open_connection = database._open
+
+        async def counting_open(path, **kwargs):
+            connection = await open_connection(path, **kwargs)
+            opened.append(connection)
+            return connection
+
+        database._open = counting_open
+
+        async def read_one():
+            async with database.read() as conn:
+                async with conn.execute("SELECT 1") as cursor:
+                    return (await cursor.fetchone())[0]
+
+        assert await asyncio.gather(*(read_one() for _ in range(8))) == [1] * 8
+        assert len(opened) == 1 + database._config.read_pool_size
+        assert len(database._readers) == database._config.read_pool_size
+
+    def test_reset_instance_closes_readers_and_writer(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        db = DatabaseConnection.get_instance(str(tmp_path / "reset.db"))
+
+        async def use():
+            async with db.read():
+                pass
+            await db.write(lambda conn: conn.execute("SELECT 1"))
+
+        asyncio.run(use())
+        assert db._readers and db._connection is not None
+
+        DatabaseConnection.reset_instance()
+
+        assert db._readers == [] and db._connection is None
+        assert db._writer_task is None and db._write_queue is None
+        assert DatabaseConnection._instance is None
+
+    @pytest.mark.asyncio
+    async def test_reads_use_read_only_pool(self, database):
+        await create_destinations_table()
+
+        async with database.read() as first:
+            async with first.execute("PRAGMA query_only") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+        async with database.read() as second:
+            pass
+
+        assert first is not second
+        assert first is not await database.connect()
+
+    @pytest.mark.asyncio
+    async def test_reads_are_not_blocked_by_open_write_transaction(self, database):
+        await create_destinations_table()
+        repository = SQLiteDestinationRepository(database._database_path)
+        saved = await repository.save(make_destination("Điểm 1", "1 Lê Lợi, Quận 1"))
+
+        async with database.transaction() as conn:
+            await conn.execute("UPDATE destinations SET address = 'pending' WHERE id = ?", (saved.id,))
+            # Reader thấy snapshot đã commit và không phải chờ writer
+            found = await asyncio.wait_for(repository.find_by_id(saved.id), 1)
+            assert str(found.address) == str(saved.address)
+
+    @pytest.mark.asyncio
+    async def test_failed_write_job_does_not_affect_batched_jobs(self, database):
+        await create_destinations_table()
+        repository = SQLiteDestinationRepository(database._database_path)
+
+        async def failing(conn):
+            await conn.execute("INSERT INTO destinations (id) VALUES ('broken')")
+
+        results = await asyncio.gather(
+            repository.save(make_destination("Điểm 1", "1 Lê Lợi, Quận 1")),
+            database.write(failing),
+            repository.save(make_destination("Điểm 2", "2 Lê Lợi, Quận 1")),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], Exception)
+        assert len(await repository.list_all()) == 2
+
+
+    def test_writer_is_rebound_to_new_event_loop(self, database):
+        repository = SQLiteDestinationRepository(database._database_path)
+
+        async def save(i: int):
+            await create_destinations_table()
+            return await repository.save(make_destination(f"Điểm {i}", f"{i} Lê Lợi, Quận 1"))
+
+        first = asyncio.run(save(1))
+        second = asyncio.run(save(2))  # loop trước đã đóng cùng writer task của nó
+
+        assert first.id != second.id
+        assert len(asyncio.run(repository.list_all())) == 2
+
+
+class TestInMemorySQLiteConnection:
+    """Test cases for ":memory:" databases (no read pool, reads share the writer)."""
+
+    @pytest.mark.asyncio
+    async def test_memory_database_reads_on_writer(self):
+        DatabaseConnection.reset_instance()
+        database = DatabaseConnection.get_instance(":memory:")
+        try:
+            async with database.read() as conn:
+                assert conn is await database.connect()
+        finally:
+            await database.close()
+            DatabaseConnection.reset_instance()
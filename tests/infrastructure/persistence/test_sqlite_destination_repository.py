@@ -0,0 +1,509 @@
+"""Test cases for SQLiteDestinationRepository queries (upsert, lookups, full-text and spatial search)."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.application.dto.search_destinations_dto import DestinationSummary
+from app.domain.entities.destination import Destination
+from app.domain.value_objects.address import Address
+from app.domain.value_objects.destination_name import DestinationName
+from app.domain.value_objects.latlon import LatLon
+from app.infrastructure.persistence.database.connection import DatabaseConnection
+from app.infrastructure.persistence.migrations.create_destinations_table import create_destinations_table
+from app.infrastructure.persistence.repositories.sqlite_destination_repository import SQLiteDestinationRepository
+
+from tests.fixtures.destinations import make_destination
+
+
+class TestSQLiteDestinationRepositoryUpsert:
+    """Test cases for save() as one INSERT ... ON CONFLICT ... RETURNING statement."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_save_runs_one_statement(self, repository):
+        await create_destinations_table()
+        conn = await repository._db_connection.connect()
+        statements = []
+        await conn.set_trace_callback(statements.append)
+
+        saved = await repository.save(make_destination("Nhà", "1 Lê Lợi"))
+
+        await conn.set_trace_callback(None)
+        queries = [
+            sql for sql in statements
+            if not sql.startswith("--")  # câu lệnh con của trigger (FTS index)
+            and sql.split()[0].upper() not in ("BEGIN", "COMMIT", "SAVEPOINT", "RELEASE")
+        ]
+        # SQLite trace lặp lại cùng câu lệnh khi RETURNING chạy kèm trigger; đếm câu lệnh khác nhau
+        assert len(set(queries)) == 1
+        assert saved.id is not None
+        assert str(saved.name) == "Nhà"
+
+    @pytest.mark.asyncio
+    async def test_save_without_id_updates_row_with_same_name(self, repository):
+        await create_destinations_table()
+        first = await repository.save(make_destination("Home", "1 Lê Lợi", age_days=3))
+
+        second = await repository.save(make_destination("HOME", "2 Lê Lợi"))
+
+        assert second.id == first.id
+        assert str(second.address) == "2 Lê Lợi"
+        assert second.created_at == first.created_at  # cập nhật giữ nguyên created_at
+        assert len(await repository.list_all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_save_without_id_updates_row_with_same_address(self, repository):
+        await create_destinations_table()
+        first = await repository.save(make_destination("Nhà", "1 Le Loi"))
+
+        second = await repository.save(make_destination("Văn phòng", "1 LE LOI"))
+
+        assert second.id == first.id
+        assert str(second.name) == "Văn phòng"
+
+    @pytest.mark.asyncio
+    async def test_save_with_explicit_id_inserts_then_updates(self, repository):
+        await create_destinations_table()
+        inserted = await repository.save(make_destination("Nhà", "1 Lê Lợi", id="dest-1"))
+
+        updated = await repository.save(make_destination("Nhà mới", "1 Lê Lợi", id="dest-1"))
+
+        assert inserted.id == updated.id == "dest-1"
+        assert str((await repository.find_by_id("dest-1")).name) == "Nhà mới"
+
+    @pytest.mark.asyncio
+    async def test_save_many_skips_failing_rows(self, repository):
+        await create_destinations_table()
+
+        saved = await repository.save_many([
+            make_destination("Nhà", "1 Le Loi", id="dest-1"),
+            make_destination("Nhà", "2 Le Loi", id="dest-2"),  # trùng name (UNIQUE) với dest-1
+            make_destination("Văn phòng", "3 Le Loi"),
+        ])
+
+        assert [str(d.name) for d in saved] == ["Nhà", "Văn phòng"]
+        assert len(await repository.list_all()) == 2
+
+
+class TestSQLiteDestinationRepositoryLookups:
+    """Test cases for case-insensitive exact lookups backed by expression indexes."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    @staticmethod
+    async def _query_plan(conn, sql: str, params=()) -> str:
+        async with conn.execute(f"EXPLAIN QUERY PLAN {sql}", params) as cursor:
+            return " | ".join(row[3] for row in await cursor.fetchall())
+
+    @pytest.mark.asyncio
+    async def test_find_by_address_is_exact_and_case_insensitive(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Nhà", "98A Nguyen Nhu, Kon Tum"))
+
+        assert (await repository.find_by_address("  98a nguyen nhu, KON TUM ")).id == saved.id
+        assert await repository.find_by_address("Kon Tum") is None
+
+    @pytest.mark.asyncio
+    async def test_find_by_address_uses_address_index(self, repository):
+        await create_destinations_table()
+        conn = await repository._db_connection.connect()
+
+        plan = await self._query_plan(conn, repository._FIND_BY_ADDRESS_SQL, ("1 Le Loi",))
+
+        assert "USING INDEX idx_destinations_address_lower" in plan
+        assert "SCAN" not in plan
+
+    @pytest.mark.asyncio
+    async def test_upsert_id_resolution_uses_lower_indexes(self, repository):
+        await create_destinations_table()
+        conn = await repository._db_connection.connect()
+
+        plan = await self._query_plan(
+            conn,
+            repository._UPSERT_SQL,
+            (None, "Nhà", "1 Le Loi", "new-id", "Nhà", "1 Le Loi", 10.0, 106.0, "2024-01-01", "2024-01-01"),
+        )
+
+        assert "USING INDEX idx_destinations_name_lower" in plan
+        assert "USING INDEX idx_destinations_address_lower" in plan
+        assert "SCAN" not in plan
+
+
+class TestSQLiteDestinationRepositoryFullTextSearch:
+    """Test cases for search_by_name_and_address backed by the destinations_fts index."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    @pytest.mark.asyncio
+    async def test_search_ignores_case_and_vietnamese_diacritics(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Văn phòng", "12 Đường Lê Lợi, Quận 1"))
+
+        for address in ("đường lê lợi", "DUONG LE LOI", "duong le"):
+            results = await repository.search_by_name_and_address(address=address)
+            assert [d.id for d in results] == [saved.id], address
+
+    @pytest.mark.asyncio
+    async def test_search_matches_word_prefixes(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Văn phòng", "12 Lê Lợi"))
+        await repository.save(make_destination("Nhà", "98 Nguyễn Huệ"))
+
+        results = await repository.search_by_name_and_address(name="van pho")
+
+        assert [d.id for d in results] == [saved.id]
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_best_match_first(self, repository):
+        await create_destinations_table()
+        await repository.save(make_destination("Kho", "5 Lê Lợi, phường Bến Nghé, Quận 1, Thành phố Hồ Chí Minh"))
+        best = await repository.save(make_destination("Nhà Lê Lợi", "7 Lê Lợi"))
+
+        results = await repository.search_by_name_and_address(address="le loi")
+
+        assert results[0].id == best.id
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Nhà", "1 Le Loi", id="dest-1"))
+        await repository.save(make_destination("Văn phòng", "1 Le Loi", id="dest-1"))
+
+        assert await repository.search_by_name_and_address(name="nha") == []
+        assert len(await repository.search_by_name_and_address(name="van phong")) == 1
+
+        await repository.delete(saved.id)
+        assert await repository.search_by_name_and_address(name="van phong") == []
+
+    @pytest.mark.asyncio
+    async def test_migration_backfills_existing_rows(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Nhà", "1 Le Loi"))
+        async with repository._db_connection.transaction() as conn:
+            await conn.execute("DROP TABLE destinations_fts")
+
+        await create_destinations_table()
+
+        assert [d.id for d in await repository.search_by_name_and_address(name="nha")] == [saved.id]
+
+    @pytest.mark.asyncio
+    async def test_search_without_indexable_words_falls_back_to_like(self, repository):
+        await create_destinations_table()
+        saved = await repository.save(make_destination("Nhà #1", "1 Le Loi"))
+
+        results = await repository.search_by_name_and_address(name="#")
+
+        assert [d.id for d in results] == [saved.id]
+
+
+class TestSQLiteDestinationRepositoryNearby:
+    """Test cases for find_nearby backed by the destinations_rtree index."""
+
+    # Chợ Bến Thành, Nhà thờ Đức Bà (~1 km), Landmark 81 (~4.5 km), Hồ Gươm (~1140 km)
+    BEN_THANH = LatLon(10.7725, 106.6980)
+    NOTRE_DAME = LatLon(10.7798, 106.6990)
+    LANDMARK_81 = LatLon(10.7950, 106.7218)
+    HOAN_KIEM = LatLon(21.0287, 105.8524)
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    async def _seed(self, repository):
+        await create_destinations_table()
+        for name, coordinates in (
+            ("Hồ Gươm", self.HOAN_KIEM),
+            ("Landmark 81", self.LANDMARK_81),
+            ("Nhà thờ Đức Bà", self.NOTRE_DAME),
+        ):
+            await repository.save(make_destination(name, name, coordinates=coordinates))
+
+    @pytest.mark.asyncio
+    async def test_k_nearest_sorted_by_distance(self, repository):
+        await self._seed(repository)
+
+        results = await repository.find_nearby(self.BEN_THANH, limit=3)
+
+        assert [str(d.name) for d, _ in results] == ["Nhà thờ Đức Bà", "Landmark 81", "Hồ Gươm"]
+        distances = [meters for _, meters in results]
+        assert distances == sorted(distances)
+        assert distances[0] == pytest.approx(self.BEN_THANH.distance_to(self.NOTRE_DAME))
+        assert 800 < distances[0] < 900
+
+    @pytest.mark.asyncio
+    async def test_limit_smaller_than_matches(self, repository):
+        await self._seed(repository)
+
+        results = await repository.find_nearby(self.HOAN_KIEM, limit=1)
+
+        assert [str(d.name) for d, _ in results] == ["Hồ Gươm"]
+        assert results[0][1] == pytest.approx(0.0)
+
+    @pytest.mark.asyncio
+    async def test_radius_excludes_farther_destinations(self, repository):
+        await self._seed(repository)
+
+        results = await repository.find_nearby(self.BEN_THANH, limit=10, radius_m=5_000)
+
+        assert [str(d.name) for d, _ in results] == ["Nhà thờ Đức Bà", "Landmark 81"]
+        assert await repository.find_nearby(self.BEN_THANH, radius_m=500) == []
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, repository):
+        await self._seed(repository)
+        moved = await repository.save(make_destination("Nhà", "1 Le Loi", id="dest-1", coordinates=self.HOAN_KIEM))
+        await repository.save(make_destination("Nhà", "1 Le Loi", id="dest-1", coordinates=self.BEN_THANH))
+
+        nearest, meters = (await repository.find_nearby(self.BEN_THANH, limit=1))[0]
+        assert nearest.id == moved.id and meters == pytest.approx(0.0)
+
+        await repository.delete(moved.id)
+        assert (await repository.find_nearby(self.BEN_THANH, limit=1))[0][0].id != moved.id
+
+    @pytest.mark.asyncio
+    async def test_search_across_antimeridian(self, repository):
+        await create_destinations_table()
+        await repository.save(make_destination("Fiji", "Suva, Fiji", coordinates=LatLon(-17.0, 179.99)))
+
+        results = await repository.find_nearby(LatLon(-17.0, -179.99), limit=1, radius_m=10_000)
+
+        assert [str(d.name) for d, _ in results] == ["Fiji"]
+
+    @pytest.mark.asyncio
+    async def test_migration_backfills_existing_rows(self, repository):
+        await self._seed(repository)
+        async with repository._db_connection.transaction() as conn:
+            await conn.execute("DROP TABLE destinations_rtree")
+
+        await create_destinations_table()
+
+        assert len(await repository.find_nearby(self.BEN_THANH, limit=10)) == 3
+
+
+class TestSQLiteDestinationRepositoryIndexKeys:
+    """destinations_fts và destinations_rtree key theo destinations.seq (INTEGER PRIMARY KEY), không theo rowid ngầm."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    async def _create_legacy_schema(self, repository):
+        """Schema trước khi có seq: id TEXT PRIMARY KEY, FTS và R*Tree key theo rowid ngầm."""
+        now = datetime.now(timezone.utc).isoformat()
+        async with repository._db_connection.transaction() as conn:
+            await conn.execute("""
+                CREATE TABLE destinations (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE,
+                    address TEXT NOT NULL,
+                    latitude REAL NOT NULL,
+                    longitude REAL NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            await conn.executemany(
+                "INSERT INTO destinations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("home", "Nhà", "1 Le Loi", 10.77, 106.70, now, now),
+                    ("gone", "Kho", "5 Hai Ba Trung", 10.78, 106.69, now, now),
+                    ("office", "Văn phòng", "2 Nguyen Hue", 21.03, 105.85, now, now),
+                ]
+            )
+            await conn.execute("DELETE FROM destinations WHERE id = 'gone'")
+            await conn.execute('CREATE VIRTUAL TABLE destinations_fts USING fts5(name, address, tokenize = "unicode61 remove_diacritics 2")')
+            await conn.execute("INSERT INTO destinations_fts(rowid, name, address) SELECT rowid, name, address FROM destinations")
+            await conn.execute("CREATE VIRTUAL TABLE destinations_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon)")
+            await conn.execute(
+                "INSERT INTO destinations_rtree SELECT rowid, latitude, latitude, longitude, longitude FROM destinations"
+            )
+
+    @pytest.mark.asyncio
+    async def test_legacy_table_is_rebuilt_keeping_index_entries(self, repository):
+        await self._create_legacy_schema(repository)
+
+        await create_destinations_table()
+
+        async with repository._db_connection.read() as conn:
+            cursor = await conn.execute("SELECT id, seq FROM destinations ORDER BY seq")
+            assert await cursor.fetchall() == [("home", 1), ("office", 3)]
+        assert [d.id for d in await repository.search_by_name_and_address(name="van phong")] == ["office"]
+        assert [d.id for d, _ in await repository.find_nearby(LatLon(21.03, 105.85), limit=1)] == ["office"]
+
+        saved = await repository.save(make_destination("Kho mới", "9 Pasteur", coordinates=LatLon(10.78, 106.69)))
+        assert [d.id for d in await repository.search_by_name_and_address(address="pasteur")] == [saved.id]
+        assert [d.id for d, _ in await repository.find_nearby(LatLon(10.78, 106.69), limit=1)] == [saved.id]
+
+    @pytest.mark.asyncio
+    async def test_index_keys_survive_vacuum(self, repository):
+        await create_destinations_table()
+        removed = await repository.save(make_destination("Kho", "5 Hai Ba Trung"))
+        kept = await repository.save(make_destination("Văn phòng", "2 Nguyen Hue", coordinates=LatLon(21.03, 105.85)))
+        await repository.delete(removed.id)
+
+        writer = await repository._db_connection.connect()
+        await writer.execute("VACUUM")
+
+        assert [d.id for d in await repository.search_by_name_and_address(address="nguyen hue")] == [kept.id]
+        assert [d.id for d, _ in await repository.find_nearby(LatLon(21.03, 105.85), limit=1)] == [kept.id]
+
+
+class TestSQLiteDestinationRepositoryPagination:
+    """Test cases for keyset pagination (list_page) and streaming (iter_all)."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    async def _seed(self, repository, count: int):
+        await create_destinations_table()
+        return [
+            await repository.save(make_destination(f"Điểm {i}", f"{i} Le Loi, Quan 1", age_days=count - i))
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_newest_first(self, repository):
+        saved = await self._seed(repository, 5)
+
+        ids, after, pages = [], None, 0
+        while True:
+            page, after = await repository.list_page(2, after)
+            ids += [d.id for d in page]
+            pages += 1
+            if after is None:
+                break
+
+        assert ids == [d.id for d in reversed(saved)]
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_ties_on_created_at_are_ordered_by_id(self, repository):
+        await create_destinations_table()
+        for id in ("b", "a", "c"):
+            await repository.save(make_destination(f"Điểm {id}", f"{id} Le Loi, Quan 1", id=id))
+        async with repository._db_connection.transaction() as conn:
+            await conn.execute("UPDATE destinations SET created_at = '2024-01-01T00:00:00+00:00'")
+
+        first, after = await repository.list_page(2)
+        second, last = await repository.list_page(2, after)
+
+        assert [d.id for d in first + second] == ["c", "b", "a"]
+        assert last is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_stable_when_newer_rows_are_inserted(self, repository):
+        saved = await self._seed(repository, 4)
+        first, after = await repository.list_page(2)
+
+        await repository.save(make_destination("Mới", "99 Le Loi, Quan 1"))
+        second, _ = await repository.list_page(2, after)
+
+        assert [d.id for d in first + second] == [d.id for d in reversed(saved)]
+
+    @pytest.mark.asyncio
+    async def test_page_query_uses_keyset_index(self, repository):
+        await self._seed(repository, 3)
+        _, after = await repository.list_page(1)
+
+        async with repository._db_connection.read() as conn:
+            async with conn.execute(
+                f"EXPLAIN QUERY PLAN {SQLiteDestinationRepository._PAGE_AFTER_SQL}", (after.created_at, after.id, 2)
+            ) as cursor:
+                plan = " | ".join(row[3] for row in await cursor.fetchall())
+
+        assert "idx_destinations_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_iter_all_streams_every_row_in_chunks(self, repository):
+        saved = await self._seed(repository, 5)
+
+        streamed = [d.id async for d in repository.iter_all(chunk_size=2)]
+
+        assert streamed == [d.id for d in reversed(saved)]
+
+
+class TestSQLiteDestinationRepositoryHydration:
+    """Test cases for trusted row hydration and the DestinationSummary projection."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        DatabaseConnection.reset_instance()
+        repository = SQLiteDestinationRepository(str(tmp_path / "destinations.db"))
+        yield repository
+        asyncio.run(repository._db_connection.close())
+        DatabaseConnection.reset_instance()
+
+    @pytest.mark.parametrize("created_at", ["2024-01-01T08:30:00+00:00", "2024-01-01T08:30:00.123456", "2024-01-01T15:30:00+07:00"])
+    def test_row_to_summary_matches_entity_path(self, repository, created_at):
+        row = ("dest-1", "Văn phòng", "12 Lê Lợi, Quận 1", 10.77, 106.70, created_at, "2024-02-01T00:00:00+00:00")
+
+        summary = repository._row_to_summary(row)
+
+        assert summary == DestinationSummary.from_destination(repository._row_to_destination(row))
+        assert summary.created_at.endswith(("+00:00", "+07:00"))
+
+    def test_trusted_hydration_equals_validated_entity(self, repository):
+        row = ("dest-1", "Văn phòng", "12 Lê Lợi, Quận 1", 10.77, 106.70, "2024-01-01T00:00:00+00:00", "2024-01-02T00:00:00+00:00")
+
+        hydrated = repository._row_to_destination(row)
+
+        assert hydrated == Destination(
+            id="dest-1",
+            name=DestinationName("Văn phòng"),
+            address=Address("12 Lê Lợi, Quận 1"),
+            coordinates=LatLon(10.77, 106.70),
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+        assert hydrated.coordinates == LatLon(10.77, 106.70)
+        assert hash(hydrated.name) == hash(DestinationName("Văn phòng"))
+
+    @pytest.mark.asyncio
+    async def test_summary_queries_match_entity_queries(self, repository):
+        await create_destinations_table()
+        for i in range(3):
+            await repository.save(make_destination(f"Văn phòng {i}", f"{i} Le Loi, Quan 1", age_days=i))
+
+        searched = await repository.search_by_name_and_address(address="le loi")
+        assert await repository.search_summaries(address="le loi") == [DestinationSummary.from_destination(d) for d in searched]
+
+        page, after = await repository.list_page(2)
+        summaries, summary_after = await repository.list_summary_page(2)
+        assert summaries == [DestinationSummary.from_destination(d) for d in page]
+        assert summary_after == after
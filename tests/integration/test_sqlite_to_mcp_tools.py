@@ -13,6 +13,13 @@ from app.application.dto.delete_destination_dto import DeleteDestinationRequest
 class TestSQLiteToMCPIntegration:
     """Integration tests from SQLite persistence to MCP tools."""
     
+    @pytest.fixture(autouse=True)
+    def database_path(self, tmp_path, monkeypatch):
+        """Point DATABASE_PATH at a temporary file so test runs never write into the source tree."""
+        path = tmp_path / "destinations.db"
+        monkeypatch.setenv("DATABASE_PATH", str(path))
+        return path
+    
     @pytest.fixture
     def container_with_db(self):
         """Create container with initialized database."""
@@ -261,13 +268,14 @@ class TestSQLiteToMCPIntegration:
         import os
         from pathlib import Path
         
-        # Check if database file exists
-        db_path = Path("destinations.db")
+        container = await container_with_db()
+        
+        # Check if database file exists (at the configured DATABASE_PATH)
+        db_path = Path(container.settings.database_path)
         assert db_path.exists() is True
         assert db_path.stat().st_size > 0  # File is not empty
         
         # Test that we can read from the file
-        container = await container_with_db()
         list_result = await container.search_destinations.execute(SearchDestinationsRequest())
         assert list_result.success is True
     
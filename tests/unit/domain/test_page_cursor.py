@@ -0,0 +1,33 @@
+"""Test cases for the PageCursor value object."""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.domain.errors import InvalidPageCursorError
+from app.domain.value_objects.page_cursor import PageCursor
+
+
+class TestPageCursor:
+    """Test cases for PageCursor encode/decode."""
+
+    def test_encode_decode_round_trip(self):
+        cursor = PageCursor("2024-01-01T00:00:00+00:00", "dest-1")
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "WzFd", ""])
+    def test_invalid_token_raises(self, token):
+        with pytest.raises(InvalidPageCursorError):
+            PageCursor.decode(token)
+
+    @pytest.mark.parametrize("module", ["app.domain.errors", "app.domain.value_objects.page_cursor"])
+    def test_module_imports_in_fresh_interpreter(self, module):
+        # Bắt lỗi circular import giữa app.domain.errors và app.domain.value_objects
+        result = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr